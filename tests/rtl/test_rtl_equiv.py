@@ -313,6 +313,30 @@ class TestRtlEquivalence:
         success, message = runner.validate_against_rtl()
         assert success, f"RTL validation failed: {message}"
 
+    def test_rtl_batch_matches_reference(self):
+        """Each pattern in a batch run should start from reset."""
+        from thermalres.rtl import run_link_monitor_rtl_batch
+
+        random.seed(789)
+        patterns = [
+            [(True, random.random() < p) for _ in range(40)]
+            for p in (0.0, 0.5, 1.0)
+        ]
+
+        results = run_link_monitor_rtl_batch(patterns, fails_to_down=4, passes_to_up=8)
+
+        assert len(results) == len(patterns)
+        for pattern, samples in zip(patterns, results):
+            ref = LinkMonitorRef(LinkMonitorParams(fails_to_down=4, passes_to_up=8))
+            assert [s.cycle for s in samples] == list(range(len(pattern)))
+            for sample, (valid, crc_fail) in zip(samples, pattern):
+                state = ref.step(valid, crc_fail)
+                assert sample.link_up == state.link_up
+                assert sample.total_frames == state.total_frames
+                assert sample.total_crc_fails == state.total_crc_fails
+                assert sample.consec_fails == state.consec_fails
+                assert sample.consec_passes == state.consec_passes
+
     def test_link_runner_rtl_validation_all_passes(self):
         """Test RTL validation with all passes."""
         config = LinkMonitorConfig(fails_to_down=4, passes_to_up=8, use_rtl=True)
@@ -392,6 +416,26 @@ class TestRtlEquivalence:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+def test_rtl_link_samples_soa_conversions():
+    """_RtlLinkSamples converts to per-sample objects and shared columns."""
+    import numpy as np
+
+    from thermalres.rtl import RtlLinkSample
+    from thermalres.rtl.adapter import _RtlLinkSamples
+
+    raw = np.array([[0, 1, 1, 0, 0, 1], [3, 0, 4, 4, 4, 0]], dtype=np.int64)
+    samples = _RtlLinkSamples.from_array(raw)
+
+    assert len(samples) == 2
+    assert samples.to_list() == [
+        RtlLinkSample(0, True, 1, 0, 0, 1),
+        RtlLinkSample(3, False, 4, 4, 4, 0),
+    ]
+    columns = samples.to_columns()
+    assert columns["link_up"].dtype == np.bool_
+    assert columns["total_crc_fails"].tolist() == [0, 4]
+
+
 class TestEdgeCases:
     """Edge case tests for reference model and LinkRunner."""
 
@@ -4,9 +4,19 @@ import json
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import numpy as np
+import pytest
+
 from thermalres.config import PlantConfig, SimConfig
+from thermalres.cosim import metrics as metrics_mod
+from thermalres.cosim.interfaces import (
+    ChunkSummary,
+    CrcEvent,
+    RunMetrics,
+    TimeSeriesSample,
+)
 from thermalres.cosim.kernel import CoSimKernel
-from thermalres.cosim.metrics import write_run_artifacts
+from thermalres.cosim.metrics import TimeseriesEncoder, write_run_artifacts
 from thermalres.cosim.plant_runner import PlantRunner
 from thermalres.plant import ImpairmentParams, ResonatorParams, ThermalParams
 from thermalres.scenarios import constant_heater, step_workload
@@ -241,6 +251,192 @@ def test_open_loop_artifacts():
             "workload_frac",
         }
 
+        # Validate timeseries.npz matches timeseries.json column by column
+        with np.load(out_dir.joinpath("timeseries.npz")) as npz:
+            assert npz["cycle"].dtype == np.int64
+            assert npz["locked"].dtype == np.bool_
+            for name in ("cycle", "temp_c", "detune_nm", "locked", "heater_duty"):
+                assert npz[name].tolist() == [s[name] for s in ts_data["samples"]]
+            assert np.isnan(npz["controller_error"]).all()
+
+        # Validate events.jsonl: one object per event, keys in sorted order
+        events_file = out_dir.joinpath("events.jsonl")
+        lines = events_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == len(result.events)
+        for line, event in zip(lines, result.events):
+            record = json.loads(line)
+            assert list(record) == ["chunk_idx", "crc_fail", "crc_fail_prob", "cycle"]
+            assert record == {
+                "chunk_idx": event.chunk_idx,
+                "crc_fail": event.crc_fail,
+                "crc_fail_prob": event.crc_fail_prob,
+                "cycle": event.cycle,
+            }
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_artifacts_accept_numpy_scalars(monkeypatch, use_orjson):
+    """
+    NumPy scalars in metrics, samples and events should encode as plain
+    JSON values, with orjson and with the stdlib fallback.
+    """
+    if not use_orjson:
+        monkeypatch.setattr(metrics_mod, "_orjson", lambda: None)
+
+    metrics = RunMetrics(
+        total_cycles=np.int64(10),
+        total_chunks=np.int64(1),
+        start_time="t0",
+        finish_time="t1",
+        scenario_name="numpy",
+    )
+    sample = TimeSeriesSample(
+        cycle=np.int64(9),
+        temp_c=np.float64(30.5),
+        detune_nm=np.float64(-0.25),
+        locked=np.bool_(True),
+        crc_fail_prob=np.float64(0.125),
+        heater_duty=np.float32(0.5),
+        workload_frac=0.0,
+    )
+
+    with TemporaryDirectory() as td:
+        out_dir = Path(td)
+        write_run_artifacts(
+            out_path=out_dir,
+            metrics=metrics,
+            chunks=[ChunkSummary(chunk_idx=0, start_cycle=0, end_cycle=10)],
+            timeseries=[sample],
+            events=[
+                CrcEvent(
+                    cycle=np.int64(9),
+                    chunk_idx=np.int64(0),
+                    crc_fail=np.bool_(True),
+                    crc_fail_prob=np.float64(0.125),
+                )
+            ],
+        )
+
+        run = json.loads(out_dir.joinpath("metrics.json").read_text(encoding="utf-8"))
+        assert run["run"]["total_cycles"] == 10
+        ts = json.loads(out_dir.joinpath("timeseries.json").read_text(encoding="utf-8"))
+        record = ts["samples"][0]
+        assert record["cycle"] == 9
+        assert record["temp_c"] == 30.5
+        assert record["locked"] is True
+        assert record["heater_duty"] == 0.5
+        lines = out_dir.joinpath("events.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"chunk_idx": 0, "crc_fail": True, "crc_fail_prob": 0.125, "cycle": 9}
+        ]
+
+
+def test_open_loop_background_encoding():
+    """
+    Test that timeseries encoded during the run matches post-run encoding.
+    """
+    plant_cfg = PlantConfig()
+
+    def make_kernel(encoder=None):
+        plant_runner = PlantRunner(
+            thermal_params=ThermalParams(
+                ambient_c=plant_cfg.ambient_c,
+                r_th_c_per_w=plant_cfg.r_th_c_per_w,
+                c_th_j_per_c=plant_cfg.c_th_j_per_c,
+                heater_w_max=plant_cfg.heater_w_max,
+                workload_w_max=plant_cfg.workload_w_max,
+            ),
+            resonator_params=ResonatorParams(
+                lambda0_nm=plant_cfg.lambda0_nm,
+                thermo_optic_nm_per_c=plant_cfg.thermo_optic_nm_per_c,
+                lock_window_nm=plant_cfg.lock_window_nm,
+                target_lambda_nm=plant_cfg.target_lambda_nm,
+                ambient_c=plant_cfg.ambient_c,
+            ),
+            impairment_params=ImpairmentParams(
+                detune_50_nm=plant_cfg.detune_50_nm,
+                detune_floor_nm=plant_cfg.detune_floor_nm,
+                detune_ceil_nm=plant_cfg.detune_ceil_nm,
+            ),
+            initial_temp_c=plant_cfg.ambient_c,
+        )
+        cfg = SimConfig.from_args(
+            name="encoder_test",
+            cycles=100,
+            cycle_chunks=5,
+            seed=3,
+            out_dir=None,
+        )
+        return CoSimKernel(
+            cfg,
+            plant_runner=plant_runner,
+            schedule=constant_heater(heater=0.3, workload=0.1),
+            timeseries_encoder=encoder,
+        )
+
+    with TemporaryDirectory() as td:
+        plain_dir = Path(td).joinpath("plain")
+        result = make_kernel().run()
+        write_run_artifacts(
+            out_path=plain_dir,
+            metrics=result.metrics,
+            chunks=result.chunks,
+            timeseries=result.timeseries,
+        )
+
+        encoded_dir = Path(td).joinpath("encoded")
+        with TimeseriesEncoder(batch_size=7) as encoder:
+            encoder.add(result.timeseries[0])  # Discarded when the run starts
+            result = make_kernel(encoder).run()
+            assert len(encoder) == len(result.timeseries) == 20
+            write_run_artifacts(
+                out_path=encoded_dir,
+                metrics=result.metrics,
+                chunks=result.chunks,
+                timeseries=result.timeseries,
+                timeseries_encoder=encoder,
+            )
+
+        # A closed encoder still writes, flushing its last partial batch
+        closed_dir = Path(td).joinpath("closed")
+        write_run_artifacts(
+            out_path=closed_dir,
+            metrics=result.metrics,
+            chunks=result.chunks,
+            timeseries=result.timeseries,
+            timeseries_encoder=encoder,
+        )
+
+        expected = plain_dir.joinpath("timeseries.json").read_bytes()
+        assert encoded_dir.joinpath("timeseries.json").read_bytes() == expected
+        assert closed_dir.joinpath("timeseries.json").read_bytes() == expected
+
+        # An encoder fed by another run of the same length is rejected
+        other = make_kernel().run()
+        assert len(other.timeseries) == len(encoder)
+        with pytest.raises(ValueError, match="timeseries_encoder"):
+            write_run_artifacts(
+                out_path=Path(td).joinpath("other"),
+                metrics=other.metrics,
+                chunks=other.chunks,
+                timeseries=other.timeseries,
+                timeseries_encoder=encoder,
+            )
+
+
+def test_samples_json_not_left_partial():
+    """A failure while streaming records leaves no timeseries.json behind."""
+
+    def records():
+        yield b'{"cycle": 0}'
+        raise RuntimeError("encoding failed")
+
+    with TemporaryDirectory() as td:
+        path = Path(td).joinpath("timeseries.json")
+        with pytest.raises(RuntimeError, match="encoding failed"):
+            metrics_mod._write_samples_json(path, records())
+        assert list(Path(td).iterdir()) == []
+
 
 def test_open_loop_determinism():
     """
@@ -301,3 +497,61 @@ def test_open_loop_determinism():
         assert s1.crc_fail_prob == s2.crc_fail_prob
         assert s1.heater_duty == s2.heater_duty
         assert s1.workload_frac == s2.workload_frac
+
+
+def test_open_loop_tiled_plant_matches_per_step():
+    """
+    Open-loop runs step the plant in tiles; results must match stepping
+    the plant once per chunk, across several tile boundaries.
+    """
+    plant_cfg = PlantConfig()
+
+    def make_runner():
+        return PlantRunner(
+            thermal_params=ThermalParams(
+                ambient_c=plant_cfg.ambient_c,
+                r_th_c_per_w=plant_cfg.r_th_c_per_w,
+                c_th_j_per_c=plant_cfg.c_th_j_per_c,
+                heater_w_max=plant_cfg.heater_w_max,
+                workload_w_max=plant_cfg.workload_w_max,
+            ),
+            resonator_params=ResonatorParams(
+                lambda0_nm=plant_cfg.lambda0_nm,
+                thermo_optic_nm_per_c=plant_cfg.thermo_optic_nm_per_c,
+                lock_window_nm=plant_cfg.lock_window_nm,
+                target_lambda_nm=plant_cfg.target_lambda_nm,
+                ambient_c=plant_cfg.ambient_c,
+            ),
+            impairment_params=ImpairmentParams(
+                detune_50_nm=plant_cfg.detune_50_nm,
+                detune_floor_nm=plant_cfg.detune_floor_nm,
+                detune_ceil_nm=plant_cfg.detune_ceil_nm,
+            ),
+            initial_temp_c=plant_cfg.ambient_c,
+        )
+
+    schedule = step_workload(
+        heater=0.3, workload_low=0.0, workload_high=0.8, step_at_cycle=700
+    )
+    cfg = SimConfig.from_args(
+        name="tiled", cycles=1300, cycle_chunks=1, seed=7, out_dir=None
+    )
+
+    runner = make_runner()
+    kernel = CoSimKernel(cfg, plant_runner=runner, schedule=schedule)
+    result = kernel.run()
+
+    # The batch loop performs the same float operations as single steps,
+    # so the results match exactly
+    reference = make_runner()
+    assert len(result.timeseries) == 1300
+    for sample in result.timeseries:
+        expected = reference.step(schedule(sample.cycle))
+        assert sample.temp_c == expected.temp_c
+        assert sample.detune_nm == expected.detune_nm
+        assert sample.locked == expected.locked
+        assert sample.crc_fail_prob == expected.crc_fail_prob
+
+    assert runner.get_thermal_state().temp_c == reference.get_thermal_state().temp_c
+    # The last outputs are tracked in tiled mode too
+    assert kernel._last_outputs == expected
@@ -0,0 +1,189 @@
+"""
+Unit tests for the fused plant chain (run_plant_batch, run_plant_sweep).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from thermalres.cosim.interfaces import PlantInputs
+from thermalres.cosim.plant_runner import PlantRunner
+from thermalres.plant import (
+    ImpairmentParams,
+    ResonatorParams,
+    ThermalParams,
+    ThermalState,
+    eval_plant_chain,
+    run_plant_trace,
+)
+from thermalres.plant._jit import pack_thermal_params, thermal_kernel
+from thermalres.plant.fused import run_plant_batch, run_plant_sweep
+from thermalres.plant.thermal import step_thermal
+
+THERMAL = ThermalParams(
+    ambient_c=25.0,
+    r_th_c_per_w=10.0,
+    c_th_j_per_c=0.1,
+    heater_w_max=1.0,
+    workload_w_max=0.5,
+)
+RESONATOR = ResonatorParams(
+    lambda0_nm=1550.0,
+    thermo_optic_nm_per_c=0.1,
+    lock_window_nm=0.5,
+    target_lambda_nm=1550.5,
+    ambient_c=25.0,
+)
+IMPAIRMENT = ImpairmentParams(
+    detune_50_nm=0.2,
+    detune_floor_nm=0.05,
+    detune_ceil_nm=0.4,
+)
+
+
+def test_run_plant_batch_matches_chain():
+    """Batch results should match eval_plant_chain stepped one at a time."""
+    rng = np.random.default_rng(5)
+    n = 200
+    heater = rng.random(n)
+    workload = rng.random(n)
+    dt = np.full(n, 0.01)
+
+    state0 = ThermalState(temp_c=25.0)
+    final_state, out = run_plant_batch(
+        state0, heater, workload, dt, THERMAL, RESONATOR, IMPAIRMENT
+    )
+
+    state = state0
+    for i in range(n):
+        state, expected = eval_plant_chain(
+            state,
+            PlantInputs(heater_duty=heater[i], workload_frac=workload[i], dt_s=dt[i]),
+            THERMAL,
+            RESONATOR,
+            IMPAIRMENT,
+        )
+        assert out.temp_c[i] == expected.temp_c
+        assert out.detune_nm[i] == expected.detune_nm
+        assert bool(out.locked[i]) == expected.locked
+        assert out.crc_fail_prob[i] == expected.crc_fail_prob
+
+    assert final_state.temp_c == state.temp_c
+    assert state0.temp_c == 25.0  # Input state is not mutated
+
+
+def test_run_plant_batch_rejects_2d_input():
+    """Inputs must be 1-D."""
+    inputs = np.zeros((2, 3))
+    with pytest.raises(ValueError):
+        run_plant_batch(
+            ThermalState(temp_c=25.0), inputs, inputs, inputs,
+            THERMAL, RESONATOR, IMPAIRMENT,
+        )
+
+
+def test_plant_runner_jit_step_matches_chain():
+    """PlantRunner.step via the compiled kernel should match eval_plant_chain."""
+    rng = np.random.default_rng(9)
+    fast = PlantRunner(
+        THERMAL, RESONATOR, IMPAIRMENT, initial_temp_c=25.0, use_jit=True
+    )
+    slow = PlantRunner(THERMAL, RESONATOR, IMPAIRMENT, initial_temp_c=25.0)
+
+    for _ in range(100):
+        inputs = PlantInputs(
+            heater_duty=float(rng.random()),
+            workload_frac=float(rng.random()),
+            dt_s=0.01,
+        )
+        got = fast.step(inputs)
+        expected = slow.step(inputs)
+        assert got.temp_c == expected.temp_c
+        assert got.detune_nm == expected.detune_nm
+        assert got.locked == expected.locked
+        assert got.crc_fail_prob == expected.crc_fail_prob
+
+    # Integer inputs are accepted as well
+    out = fast.step(PlantInputs(heater_duty=0, workload_frac=1, dt_s=0.01))
+    assert isinstance(out.temp_c, float)
+
+
+@pytest.mark.parametrize("heater, workload", [(0.0, 0.0), (0.4, 0.7), (1.5, -0.2)])
+def test_thermal_kernel_matches_step_thermal(heater, workload):
+    """The scalar thermal kernel should match step_thermal (clamping included)."""
+    state = ThermalState(temp_c=31.0)
+    expected = step_thermal(
+        state, dt_s=0.01, heater_duty=heater, workload_frac=workload, p=THERMAL
+    )
+
+    got = thermal_kernel(31.0, heater, workload, 0.01, pack_thermal_params(THERMAL))
+
+    assert got == expected.temp_c
+
+
+def test_run_plant_trace_scalar_dt():
+    """run_plant_trace should match run_plant_batch with a broadcast dt."""
+    rng = np.random.default_rng(11)
+    heater = rng.random(50)
+    workload = rng.random(50)
+
+    trace = run_plant_trace(
+        heater, workload, 0.01, THERMAL, RESONATOR, IMPAIRMENT, initial_temp_c=25.0
+    )
+    _, batch = run_plant_batch(
+        ThermalState(temp_c=25.0), heater, workload, np.full(50, 0.01),
+        THERMAL, RESONATOR, IMPAIRMENT,
+    )
+
+    assert len(trace) == 50
+    np.testing.assert_array_equal(trace.temp_c, batch.temp_c)
+    np.testing.assert_array_equal(trace.crc_fail_prob, batch.crc_fail_prob)
+
+
+def test_run_plant_sweep_matches_batch_per_scenario():
+    """Each sweep row should match run_plant_batch on that scenario alone."""
+    rng = np.random.default_rng(11)
+    n_scenarios, n = 6, 150
+    heater = rng.random((n_scenarios, n))
+    workload = np.repeat(np.linspace(0.0, 1.0, n_scenarios)[:, None], n, axis=1)
+    initial = np.linspace(20.0, 35.0, n_scenarios)
+
+    final, out = run_plant_sweep(
+        heater, workload, 0.01, THERMAL, RESONATOR, IMPAIRMENT, initial
+    )
+
+    assert out.temp_c.shape == out.locked.shape == (n_scenarios, n)
+    for s in range(n_scenarios):
+        state, expected = run_plant_batch(
+            ThermalState(temp_c=initial[s]),
+            heater[s],
+            workload[s],
+            np.full(n, 0.01),
+            THERMAL,
+            RESONATOR,
+            IMPAIRMENT,
+        )
+        assert out.temp_c[s].tolist() == expected.temp_c.tolist()
+        assert out.detune_nm[s].tolist() == expected.detune_nm.tolist()
+        assert out.locked[s].tolist() == expected.locked.tolist()
+        assert out.crc_fail_prob[s].tolist() == expected.crc_fail_prob.tolist()
+        assert final[s] == state.temp_c
+
+
+def test_run_plant_sweep_rejects_bad_shapes():
+    """Inputs must be 2-D with matching shapes."""
+    with pytest.raises(ValueError):
+        run_plant_sweep(
+            np.zeros(4), np.zeros(4), 0.01, THERMAL, RESONATOR, IMPAIRMENT, 25.0
+        )
+    with pytest.raises(ValueError):
+        run_plant_sweep(
+            np.zeros((2, 4)), np.zeros((2, 3)), 0.01,
+            THERMAL, RESONATOR, IMPAIRMENT, 25.0,
+        )
+    with pytest.raises(ValueError):
+        run_plant_sweep(
+            np.zeros((2, 4)), np.zeros((2, 4)), np.zeros(3),
+            THERMAL, RESONATOR, IMPAIRMENT, 25.0,
+        )
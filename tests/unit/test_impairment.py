@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
-from thermalres.plant.impairment import ImpairmentParams, eval_impairment
+from thermalres.plant.impairment import (
+    ImpairmentLUT,
+    ImpairmentParams,
+    eval_impairment,
+    eval_impairment_batch,
+    eval_impairment_lut,
+)
 
 
 @pytest.fixture
@@ -26,6 +33,40 @@ def test_impairment_params_initialization():
     assert params.detune_floor_nm == 0.0
 
 
+def test_impairment_params_derived_constants():
+    """Test precomputed constants and that they stay out of repr/eq."""
+    params = ImpairmentParams(
+        detune_50_nm=0.3,
+        detune_floor_nm=0.1,
+        detune_ceil_nm=0.5,
+    )
+    assert params._inv_range == pytest.approx(1.0 / 0.4)
+    assert params._x_50 == pytest.approx(0.5)
+    assert params._inv_lo == pytest.approx(1.0)
+    assert params._inv_hi == pytest.approx(1.0)
+    assert params._mid == 0.5
+    assert "_inv_range" not in repr(params)
+    assert params == ImpairmentParams(0.3, 0.1, 0.5)
+    assert hash(params) == hash(ImpairmentParams(0.3, 0.1, 0.5))
+
+
+@pytest.mark.parametrize("detune_50_nm", [0.0, 2.0])
+def test_impairment_params_no_rescale_is_identity(detune_50_nm):
+    """
+    With detune_50 at or outside the range ends, the remap is the identity,
+    so the result is the plain smoothstep of the normalized detuning.
+    """
+    params = ImpairmentParams(
+        detune_50_nm=detune_50_nm,
+        detune_floor_nm=0.0,
+        detune_ceil_nm=1.0,
+    )
+    assert (params._inv_lo, params._mid, params._inv_hi) == (1.0, 0.0, 1.0)
+    for x in (0.1, 0.25, 0.5, 0.9):
+        expected = x * x * (3.0 - 2.0 * x)
+        assert eval_impairment(detune_nm=x, locked=True, p=params).crc_fail_prob == expected
+
+
 def test_impairment_unlocked_always_fails(default_params):
     """
     When not locked, CRC failure probability should always be 1.0.
@@ -287,3 +328,101 @@ def test_impairment_full_range_coverage():
     # All should be in (0, 1)
     for prob in mid_range_probs:
         assert 0.0 < prob < 1.0
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        ImpairmentParams(detune_50_nm=0.3, detune_floor_nm=0.0, detune_ceil_nm=1.0),
+        ImpairmentParams(detune_50_nm=0.05, detune_floor_nm=0.02, detune_ceil_nm=0.2),
+        # detune_50 outside (floor, ceil): no piecewise rescale
+        ImpairmentParams(detune_50_nm=0.0, detune_floor_nm=0.0, detune_ceil_nm=1.0),
+        ImpairmentParams(detune_50_nm=2.0, detune_floor_nm=0.0, detune_ceil_nm=1.0),
+    ],
+)
+def test_impairment_batch_matches_scalar(params):
+    """
+    eval_impairment_batch should match eval_impairment element-wise.
+    """
+    detunes = np.linspace(-1.5, 1.5, 301)
+    locked = np.arange(detunes.size) % 5 != 0
+
+    result = eval_impairment_batch(detunes, locked, params)
+
+    expected = [
+        eval_impairment(detune_nm=float(d), locked=bool(l), p=params).crc_fail_prob
+        for d, l in zip(detunes, locked)
+    ]
+    assert result.dtype == np.float64
+    assert result == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+def test_impairment_batch_zero_width_range():
+    """
+    A zero-width floor/ceil range should not divide by zero.
+    """
+    params = ImpairmentParams(detune_50_nm=0.1, detune_floor_nm=0.1, detune_ceil_nm=0.1)
+    result = eval_impairment_batch(np.array([0.0, 0.1, 0.2]), True, params)
+    assert result.tolist() == [0.0, 0.0, 1.0]
+
+
+@pytest.mark.parametrize("locked", [True, False])
+def test_impairment_batch_uniform_lock_and_shape(locked):
+    """
+    All-locked and all-unlocked inputs should match the scalar model and
+    keep the broadcast input shape (including 0-d).
+    """
+    params = ImpairmentParams(detune_50_nm=0.3, detune_floor_nm=0.0, detune_ceil_nm=1.0)
+    detunes = np.linspace(-1.2, 1.2, 12).reshape(3, 4)
+
+    result = eval_impairment_batch(detunes, locked, params)
+
+    expected = [
+        eval_impairment(detune_nm=float(d), locked=locked, p=params).crc_fail_prob
+        for d in detunes.ravel()
+    ]
+    assert result.shape == (3, 4)
+    assert result.ravel() == pytest.approx(expected, rel=1e-12, abs=1e-12)
+    assert eval_impairment_batch(0.3, locked, params).shape == ()
+
+
+@pytest.mark.parametrize(
+    "params, tol",
+    [
+        # Kink at detune_50 bounds the error
+        (ImpairmentParams(detune_50_nm=0.3, detune_floor_nm=0.0, detune_ceil_nm=1.0), 1e-3),
+        (ImpairmentParams(detune_50_nm=0.05, detune_floor_nm=0.02, detune_ceil_nm=0.2), 1e-3),
+        # No rescale: plain smoothstep, error ~ 1/size**2
+        (ImpairmentParams(detune_50_nm=0.0, detune_floor_nm=0.0, detune_ceil_nm=1.0), 1e-6),
+    ],
+)
+def test_impairment_lut_close_to_exact(params, tol):
+    """
+    The LUT should approximate eval_impairment_batch within tolerance,
+    with exact floor/ceil and unlocked values.
+    """
+    lut = ImpairmentLUT(params)
+    detunes = np.linspace(-1.5, 1.5, 30001)
+    locked = np.arange(detunes.size) % 5 != 0
+
+    result = eval_impairment_lut(detunes, locked, lut)
+    expected = eval_impairment_batch(detunes, locked, params)
+
+    assert result.dtype == np.float64
+    assert result == pytest.approx(expected, abs=tol)
+    assert np.all(result[~locked] == 1.0)
+    exact = np.abs(detunes) <= params.detune_floor_nm
+    exact |= np.abs(detunes) >= params.detune_ceil_nm
+    assert np.array_equal(result[exact], expected[exact])
+
+
+def test_impairment_lut_zero_width_range_and_size():
+    """
+    A zero-width range should behave like the exact model; size must be positive.
+    """
+    params = ImpairmentParams(detune_50_nm=0.1, detune_floor_nm=0.1, detune_ceil_nm=0.1)
+    lut = ImpairmentLUT(params, size=16)
+    assert eval_impairment_lut(np.array([0.0, 0.1, 0.2]), True, lut).tolist() == [0.0, 0.0, 1.0]
+
+    with pytest.raises(ValueError):
+        ImpairmentLUT(params, size=0)
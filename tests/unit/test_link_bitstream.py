@@ -0,0 +1,80 @@
+"""
+Unit tests for the run-length link monitor evaluation.
+
+Checks run_link_monitor_bitstream against stepping LinkMonitorRef one
+frame at a time.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from thermalres.digital import (
+    LinkMonitorParams,
+    LinkMonitorRef,
+    run_link_monitor_bitstream,
+)
+
+_FIELDS = ("link_up", "total_frames", "total_crc_fails", "consec_fails", "consec_passes")
+
+
+def _reference_rows(bits, params):
+    monitor = LinkMonitorRef(params)
+    rows = []
+    for bit in bits:
+        state = monitor.step(valid=True, crc_fail=bool(bit))
+        rows.append(tuple(getattr(state, f) for f in _FIELDS))
+    return rows
+
+
+def _column_rows(cols):
+    return list(zip(*(cols[f].tolist() for f in _FIELDS)))
+
+
+@pytest.mark.parametrize("p_fail", [0.05, 0.3, 0.5, 0.8])
+def test_matches_reference_every_frame(p_fail):
+    """Test full history matches LinkMonitorRef for random streams."""
+    rng = np.random.default_rng(7)
+    bits = rng.random(500) < p_fail
+    params = LinkMonitorParams(fails_to_down=3, passes_to_up=5)
+
+    cols = run_link_monitor_bitstream(bits, params)
+
+    assert _column_rows(cols) == _reference_rows(bits, params)
+
+
+def test_sampled_indices():
+    """Test that only the requested sample indices are reported."""
+    rng = np.random.default_rng(1)
+    bits = rng.random(203) < 0.4
+    params = LinkMonitorParams()
+    idx = [0, 7, 8, 63, 64, 150, 202]
+
+    cols = run_link_monitor_bitstream(bits, params, sample_idx=idx)
+
+    expected = _reference_rows(bits, params)
+    assert _column_rows(cols) == [expected[i] for i in idx]
+
+
+def test_link_goes_down_and_recovers():
+    """Test threshold crossings inside a run."""
+    bits = [True] * 4 + [False] * 8
+    cols = run_link_monitor_bitstream(bits)
+
+    assert cols["link_up"].tolist() == [True] * 3 + [False] * 8 + [True]
+    assert cols["consec_fails"][3] == 4
+    assert cols["consec_passes"][-1] == 8
+    assert cols["total_crc_fails"][-1] == 4
+
+
+def test_empty_stream():
+    """Test that an empty stream yields empty columns."""
+    cols = run_link_monitor_bitstream(np.zeros(0, dtype=bool))
+    assert all(len(cols[f]) == 0 for f in _FIELDS)
+
+
+def test_sample_index_out_of_range():
+    """Test that out-of-range sample indices are rejected."""
+    with pytest.raises(IndexError):
+        run_link_monitor_bitstream([True, False], sample_idx=[2])
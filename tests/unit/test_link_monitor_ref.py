@@ -0,0 +1,76 @@
+"""
+Unit tests for LinkMonitorRef.run_batch.
+
+Checks the batched kernel against stepping the reference model one frame
+at a time.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from thermalres.digital import LinkMonitorParams, LinkMonitorRef
+
+_FIELDS = ("link_up", "total_frames", "total_crc_fails", "consec_fails", "consec_passes")
+
+
+def _step_rows(monitor, valid, crc_fail):
+    rows = []
+    for v, c in zip(valid, crc_fail):
+        state = monitor.step(valid=bool(v), crc_fail=bool(c))
+        rows.append(tuple(getattr(state, f) for f in _FIELDS))
+    return rows
+
+
+def _column_rows(cols):
+    return list(zip(*(cols[f].tolist() for f in _FIELDS)))
+
+
+def test_run_batch_matches_step():
+    """Test run_batch matches per-frame step, including invalid frames."""
+    rng = np.random.default_rng(11)
+    valid = rng.random(400) < 0.9
+    crc_fail = rng.random(400) < 0.4
+    params = LinkMonitorParams(fails_to_down=3, passes_to_up=5)
+
+    batch = LinkMonitorRef(params)
+    cols = batch.run_batch(valid, crc_fail)
+
+    stepped = LinkMonitorRef(params)
+    assert _column_rows(cols) == _step_rows(stepped, valid, crc_fail)
+    assert cols["link_up"].dtype == bool
+    assert batch.get_state() == stepped.get_state()
+
+
+def test_run_batch_chains_with_step():
+    """Test that batches continue from the current state."""
+    crc_fail = [True] * 3 + [False] * 2 + [True] * 6
+    valid = [True] * len(crc_fail)
+
+    chained = LinkMonitorRef()
+    chained.step(valid=True, crc_fail=True)
+    first = chained.run_batch(valid[:5], crc_fail[:5])
+    second = chained.run_batch(valid[5:], crc_fail[5:])
+
+    stepped = LinkMonitorRef()
+    stepped.step(valid=True, crc_fail=True)
+    expected = _step_rows(stepped, valid, crc_fail)
+
+    assert _column_rows(first) + _column_rows(second) == expected
+    assert chained.get_state() == stepped.get_state()
+
+
+def test_run_batch_length_mismatch():
+    """Test that mismatched input lengths are rejected."""
+    with pytest.raises(ValueError):
+        LinkMonitorRef().run_batch([True, True], [False])
+
+
+def test_state_and_params_use_slots():
+    """Test that state/params reject dynamic attributes (slots dataclasses)."""
+    monitor = LinkMonitorRef()
+    for obj in (monitor.state, monitor.params):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.extra = 1
@@ -16,7 +16,7 @@ tests are in tests/rtl/test_rtl_equiv.py.
 import pytest
 
 from thermalres.cosim.interfaces import CrcEvent, LinkMonitorConfig, LinkStateSample
-from thermalres.cosim.link_runner import LinkRunner
+from thermalres.cosim.link_runner import LinkRunner, _link_state_columns
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -262,8 +262,8 @@ class TestResetAndHistory:
         assert len(runner.get_samples()) == 0
         assert len(runner.get_events()) == 0
 
-    def test_get_samples_returns_copy(self):
-        """Test that get_samples returns a copy, not internal list."""
+    def test_get_samples_returns_read_only_view(self):
+        """Test that get_samples returns a read-only view, not the internal list."""
         runner = LinkRunner()
 
         event = CrcEvent(cycle=0, chunk_idx=0, crc_fail=False, crc_fail_prob=0.0)
@@ -275,13 +275,34 @@ class TestResetAndHistory:
         # Should be equal but not the same object
         assert samples1 == samples2
         assert samples1 is not samples2
+        assert samples1[0] == samples1[-1]
 
-        # Modifying returned list should not affect internal state
-        samples1.clear()
+        # View cannot be used to modify internal state
+        assert not hasattr(samples1, "clear")
+        with pytest.raises(TypeError):
+            samples1[0] = None  # type: ignore
         assert len(runner.get_samples()) == 1
 
-    def test_get_events_returns_copy(self):
-        """Test that get_events returns a copy, not internal list."""
+    def test_get_samples_view_length_is_frozen(self):
+        """Test that a view does not grow when more events are processed."""
+        runner = LinkRunner()
+
+        runner.step(CrcEvent(cycle=0, chunk_idx=0, crc_fail=False, crc_fail_prob=0.0))
+        view = runner.get_samples()
+
+        runner.step(CrcEvent(cycle=1, chunk_idx=0, crc_fail=True, crc_fail_prob=1.0))
+        assert len(view) == 1
+        assert [s.cycle for s in view] == [0]
+        with pytest.raises(IndexError):
+            view[1]
+
+        # Reset must not invalidate views handed out earlier
+        runner.reset()
+        assert len(view) == 1
+        assert view[0].cycle == 0
+
+    def test_get_events_returns_read_only_view(self):
+        """Test that get_events returns a read-only view, not the internal list."""
         runner = LinkRunner()
 
         event = CrcEvent(cycle=0, chunk_idx=0, crc_fail=False, crc_fail_prob=0.0)
@@ -293,6 +314,7 @@ class TestResetAndHistory:
         # Should be equal but not the same object
         assert events1 == events2
         assert events1 is not events2
+        assert list(events1) == [event]
 
     def test_get_current_state_before_any_events(self):
         """Test that get_current_state returns None before any events."""
@@ -453,3 +475,133 @@ class TestRtlValidationDisabled:
         success, message = runner.validate_against_rtl()
         assert success is True
         assert "no events" in message.lower()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Preallocation Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestPreallocation:
+    """Tests for preallocated history buffers (expected_cycles)."""
+
+    def test_preallocated_history_matches_unallocated(self):
+        """Test that preallocation does not change recorded samples."""
+        plain = LinkRunner()
+        prealloc = LinkRunner(expected_cycles=10)
+
+        for i in range(10):
+            event = CrcEvent(
+                cycle=i, chunk_idx=0, crc_fail=i % 3 == 0, crc_fail_prob=0.5
+            )
+            plain.step(event)
+            prealloc.step(event)
+
+        assert list(prealloc.get_samples()) == list(plain.get_samples())
+        assert list(prealloc.get_events()) == list(plain.get_events())
+        assert prealloc.get_current_state() == plain.get_current_state()
+
+    def test_views_exclude_unused_slots(self):
+        """Test that views only expose steps actually taken."""
+        runner = LinkRunner(expected_cycles=100)
+        assert len(runner.get_samples()) == 0
+        assert runner.get_current_state() is None
+
+        for i in range(3):
+            runner.step(CrcEvent(cycle=i, chunk_idx=0, crc_fail=False, crc_fail_prob=0.0))
+
+        assert len(runner.get_samples()) == 3
+        assert None not in list(runner.get_events())
+
+    def test_steps_beyond_expected_cycles(self):
+        """Test that stepping past the preallocated size still records."""
+        runner = LinkRunner(expected_cycles=2)
+
+        for i in range(5):
+            runner.step(CrcEvent(cycle=i, chunk_idx=0, crc_fail=False, crc_fail_prob=0.0))
+
+        assert [s.cycle for s in runner.get_samples()] == [0, 1, 2, 3, 4]
+
+    def test_reset_with_expected_cycles(self):
+        """Test that reset() can resize the preallocated history."""
+        runner = LinkRunner()
+        runner.step(CrcEvent(cycle=0, chunk_idx=0, crc_fail=True, crc_fail_prob=1.0))
+
+        runner.reset(expected_cycles=8)
+        assert len(runner.get_samples()) == 0
+        assert runner.get_current_state() is None
+
+        sample = runner.step(
+            CrcEvent(cycle=0, chunk_idx=0, crc_fail=False, crc_fail_prob=0.0)
+        )
+        assert sample.total_frames == 1
+        assert runner.get_current_state() == sample
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# RTL Comparison Tests (adapter replaced with recorded samples)
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestRtlComparison:
+    """Tests for the sample comparison in validate_against_rtl."""
+
+    @staticmethod
+    def _run(monkeypatch, rtl_samples_fn):
+        import thermalres.rtl.adapter as adapter
+
+        runner = LinkRunner(LinkMonitorConfig(use_rtl=True))
+        for i in range(12):
+            runner.step(
+                CrcEvent(cycle=i, chunk_idx=0, crc_fail=i < 5, crc_fail_prob=0.5)
+            )
+
+        monkeypatch.setattr(adapter, "check_verilator_available", lambda: True)
+        def fake_rtl(pattern=None, *, crc_fails=None, **kw):
+            assert pattern is None
+            assert crc_fails.tolist() == [e.crc_fail for e in runner.get_events()]
+            return _link_state_columns(rtl_samples_fn(list(runner.get_samples())))
+
+        monkeypatch.setattr(adapter, "run_link_monitor_rtl_columns", fake_rtl)
+        return runner.validate_against_rtl()
+
+    def test_matching_samples_pass(self, monkeypatch):
+        """Test that identical RTL samples validate successfully."""
+        success, message = self._run(monkeypatch, lambda samples: samples)
+        assert success is True
+        assert "12 samples verified" in message
+
+    def test_first_mismatch_reported(self, monkeypatch):
+        """Test that the earliest mismatching index and fields are reported."""
+        from dataclasses import replace
+
+        def corrupt(samples):
+            samples[7] = replace(samples[7], consec_passes=99)
+            samples[4] = replace(samples[4], link_up=True, total_frames=0)
+            return samples
+
+        success, message = self._run(monkeypatch, corrupt)
+        assert success is False
+        assert "index 4" in message
+        assert "link_up: Python=False, RTL=True" in message
+        assert "total_frames: Python=5, RTL=0" in message
+        assert "consec_passes" not in message
+
+    def test_get_columns_layout(self):
+        """Test that get_columns matches the recorded samples."""
+        runner = LinkRunner()
+        for i in range(6):
+            runner.step(CrcEvent(cycle=i, chunk_idx=0, crc_fail=True, crc_fail_prob=1.0))
+
+        cols = runner.get_columns()
+        samples = runner.get_samples()
+        assert cols["link_up"].dtype == bool
+        assert cols["link_up"].tolist() == [s.link_up for s in samples]
+        assert cols["total_frames"].tolist() == [1, 2, 3, 4, 5, 6]
+        assert cols["consec_fails"].tolist() == [s.consec_fails for s in samples]
+
+    def test_sample_count_mismatch(self, monkeypatch):
+        """Test that differing sample counts short-circuit the comparison."""
+        success, message = self._run(monkeypatch, lambda samples: samples[:-1])
+        assert success is False
+        assert "Sample count mismatch" in message
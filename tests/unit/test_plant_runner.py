@@ -0,0 +1,137 @@
+"""
+Unit tests for PlantRunner.
+
+Checks that the batched plant path (step_batch) matches stepping the
+plant chain one cycle at a time.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from thermalres.cosim.interfaces import PlantInputs
+from thermalres.cosim.plant_runner import PlantRunner
+from thermalres.plant import (
+    ImpairmentParams,
+    ResonatorParams,
+    ThermalParams,
+    ThermalState,
+    eval_plant_chain,
+)
+
+
+def _make_runner(use_jit: bool = False) -> PlantRunner:
+    return PlantRunner(
+        thermal_params=ThermalParams(
+            ambient_c=25.0,
+            r_th_c_per_w=10.0,
+            c_th_j_per_c=0.1,
+            heater_w_max=1.0,
+            workload_w_max=0.5,
+        ),
+        resonator_params=ResonatorParams(
+            lambda0_nm=1550.0,
+            thermo_optic_nm_per_c=0.1,
+            lock_window_nm=0.5,
+            target_lambda_nm=1550.5,
+            ambient_c=25.0,
+        ),
+        impairment_params=ImpairmentParams(
+            detune_50_nm=0.3,
+            detune_floor_nm=0.05,
+            detune_ceil_nm=0.45,
+        ),
+        initial_temp_c=25.0,
+        use_jit=use_jit,
+    )
+
+
+def _inputs(n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    cycles = np.arange(n)
+    heater = 0.5 + 0.6 * np.sin(cycles / 7.0)  # exercises clamping
+    workload = np.where(cycles < n // 2, 0.2, 0.9)
+    dt = np.full(n, 0.1)
+    return heater, workload, dt
+
+
+def test_step_batch_matches_step():
+    """Batched evaluation should match per-cycle step() results."""
+    n = 200
+    heater, workload, dt = _inputs(n)
+
+    scalar = _make_runner()
+    expected = [
+        scalar.step(PlantInputs(heater_duty=h, workload_frac=w, dt_s=d))
+        for h, w, d in zip(heater, workload, dt)
+    ]
+
+    batched = _make_runner()
+    out = batched.step_batch(heater, workload, dt)
+
+    assert len(out) == n
+    assert out.temp_c == pytest.approx([o.temp_c for o in expected])
+    assert out.resonance_nm == pytest.approx([o.resonance_nm for o in expected])
+    assert out.detune_nm == pytest.approx([o.detune_nm for o in expected])
+    assert out.locked.tolist() == [o.locked for o in expected]
+    assert out.crc_fail_prob == pytest.approx(
+        [o.crc_fail_prob for o in expected], abs=1e-12
+    )
+    assert batched.get_thermal_state().temp_c == pytest.approx(
+        scalar.get_thermal_state().temp_c
+    )
+
+
+def test_step_batch_continues_from_current_state():
+    """Consecutive batches should continue the thermal trajectory."""
+    heater, workload, dt = _inputs(100)
+
+    whole = _make_runner().step_batch(heater, workload, dt)
+
+    split = _make_runner()
+    first = split.step_batch(heater[:40], workload[:40], dt[:40])
+    second = split.step_batch(heater[40:], workload[40:], dt[40:])
+
+    assert np.concatenate([first.temp_c, second.temp_c]) == pytest.approx(whole.temp_c)
+
+
+def test_step_batch_empty():
+    """An empty batch should leave the state untouched."""
+    runner = _make_runner()
+    out = runner.step_batch(np.empty(0), np.empty(0), np.empty(0))
+
+    assert len(out) == 0
+    assert runner.get_thermal_state().temp_c == 25.0
+
+
+def test_step_batch_rejects_mismatched_lengths():
+    """Input arrays must have equal length."""
+    runner = _make_runner()
+    with pytest.raises(ValueError):
+        runner.step_batch(np.zeros(3), np.zeros(2), np.zeros(3))
+
+
+def test_step_defaults_to_python_chain():
+    """step() uses the Python chain unless use_jit is requested."""
+    assert _make_runner()._kernel is None
+
+
+@pytest.mark.parametrize("use_jit", [False, True])
+def test_step_matches_plant_chain_exactly(use_jit):
+    """step() should reproduce eval_plant_chain bit for bit, jit or not."""
+    heater, workload, dt = _inputs(200)
+    runner = _make_runner(use_jit=use_jit)
+    state = ThermalState(temp_c=25.0)
+
+    for h, w, d in zip(heater, workload, dt):
+        inputs = PlantInputs(heater_duty=float(h), workload_frac=float(w), dt_s=float(d))
+        state, expected = eval_plant_chain(
+            state,
+            inputs,
+            runner.thermal_params,
+            runner.resonator_params,
+            runner.impairment_params,
+        )
+        assert runner.step(inputs) == expected
+
+    assert runner.get_thermal_state() == state
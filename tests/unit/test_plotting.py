@@ -0,0 +1,222 @@
+"""
+Unit tests for plot data preparation (artifact loading, downsampling).
+"""
+
+from __future__ import annotations
+
+import json
+from operator import attrgetter
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+
+from thermalres.cosim.interfaces import RunMetrics, TimeSeriesSample
+from thermalres.cosim.metrics import write_run_artifacts
+from thermalres.cosim.plotting import (
+    _TS_PLOT_FIELDS,
+    _downsample,
+    _load_timeseries_columns,
+    _minmax_indices,
+    _timeseries_columns,
+)
+
+
+def _samples(n: int) -> list[TimeSeriesSample]:
+    return [
+        TimeSeriesSample(
+            cycle=10 * i,
+            temp_c=25.0 + 0.1 * i,
+            detune_nm=-0.5 + 0.01 * i,
+            locked=i % 3 == 0,
+            crc_fail_prob=i / n,
+            heater_duty=0.3,
+            workload_frac=(i % 5) / 4,
+        )
+        for i in range(n)
+    ]
+
+
+def _record_lines(path: Path) -> int:
+    """Count lines holding a whole sample object."""
+    lines = (line.strip().rstrip(",") for line in path.read_text(encoding="utf-8").splitlines())
+    return sum(line.startswith("{") and line.endswith("}") for line in lines)
+
+
+def test_load_timeseries_columns_both_layouts():
+    """
+    Line-per-sample files (write_run_artifacts) and fully indented files
+    from older runs load into the same columns.
+    """
+    samples = _samples(25)
+    expected = _timeseries_columns(samples, attrgetter(*_TS_PLOT_FIELDS))
+
+    with TemporaryDirectory() as td:
+        out_dir = Path(td)
+        write_run_artifacts(
+            out_path=out_dir.joinpath("new"),
+            metrics=RunMetrics(
+                total_cycles=250,
+                total_chunks=25,
+                start_time="t0",
+                finish_time="t1",
+                scenario_name="layout",
+            ),
+            chunks=[],
+            timeseries=samples,
+        )
+        new_path = out_dir.joinpath("new", "timeseries.json")
+
+        old_path = out_dir.joinpath("old_timeseries.json")
+        data = json.loads(new_path.read_text(encoding="utf-8"))
+        old_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+        # The line parser handles the new layout; the indented layout has
+        # no one-object-per-line records and takes the json.load fallback
+        assert _record_lines(new_path) == len(samples)
+        assert _record_lines(old_path) == 0
+
+        new_columns = _load_timeseries_columns(new_path)
+        old_columns = _load_timeseries_columns(old_path)
+
+    assert new_columns.shape == (len(_TS_PLOT_FIELDS), len(samples))
+    assert new_columns.tolist() == expected.tolist()
+    assert old_columns.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize("n, n_out", [(100, 10), (103, 10), (1000, 7), (17, 4)])
+def test_minmax_keeps_bucket_extremes(n, n_out):
+    """Every bucket's min and max survive, including an uneven tail bucket."""
+    rng = np.random.default_rng(n)
+    y = rng.standard_normal(n)
+
+    idx = _minmax_indices(y, n_out)
+
+    assert idx.tolist() == sorted(set(idx.tolist()))
+    assert idx[0] == 0
+    assert idx[-1] == n - 1
+    assert len(idx) <= n_out + 2
+
+    kept = set(idx.tolist())
+    size = -(-n // (n_out // 2))
+    for start in range(0, n, size):
+        bucket = y[start:start + size]
+        assert start + int(bucket.argmin()) in kept
+        assert start + int(bucket.argmax()) in kept
+
+
+@pytest.mark.parametrize("n_out", [1, 2])
+def test_minmax_small_n_out(n_out):
+    """n_out of 1 or 2 still keeps the endpoints and the global extremes."""
+    y = np.array([3.0, 9.0, -4.0, 1.0, 0.5, 2.0, 7.0])
+
+    idx = _minmax_indices(y, n_out)
+
+    assert idx.tolist() == [0, 1, 2, 6]
+
+
+def test_downsample_preserves_envelope():
+    """Downsampled traces keep the endpoints and the peak and trough."""
+    x = np.arange(1001)
+    y = np.sin(x / 50.0)
+    y[321] = 5.0
+    y[654] = -5.0
+
+    xs, ys = _downsample(x, y, 20)
+
+    assert len(xs) < len(x)
+    assert xs[0] == 0 and xs[-1] == 1000
+    assert ys.max() == 5.0 and xs[ys.argmax()] == 321
+    assert ys.min() == -5.0 and xs[ys.argmin()] == 654
+    assert np.array_equal(ys, y[xs])
+
+
+@pytest.mark.parametrize("n_out", [None, 50, 100])
+def test_downsample_short_trace_unchanged(n_out):
+    """Traces no longer than n_out (or n_out=None) are returned as is."""
+    x = np.arange(50)
+    y = x * 2.0
+
+    xs, ys = _downsample(x, y, n_out)
+
+    assert xs is x and ys is y
+
+
+def test_figure_renderer_reuse():
+    """
+    One renderer draws runs of different lengths and switches between the
+    3-panel and 4-panel layouts, writing every file.
+    """
+    pytest.importorskip("matplotlib")
+    from thermalres.cosim.interfaces import LinkStateSample, RunResult
+    from thermalres.cosim.plotting import FigureRenderer
+
+    def result(n: int, with_link: bool) -> RunResult:
+        link_states = None
+        if with_link:
+            link_states = [
+                LinkStateSample(
+                    cycle=10 * i,
+                    link_up=i % 4 != 0,
+                    total_frames=i,
+                    total_crc_fails=i // 4,
+                    consec_fails=int(i % 4 == 0),
+                    consec_passes=i % 4,
+                )
+                for i in range(n)
+            ]
+        return RunResult(
+            metrics=RunMetrics(
+                total_cycles=10 * n,
+                total_chunks=n,
+                start_time="t0",
+                finish_time="t1",
+                scenario_name=f"reuse_{n}",
+            ),
+            chunks=[],
+            timeseries=_samples(n),
+            events=[],
+            link_states=link_states,
+        )
+
+    runs = [result(40, False), result(300, False), result(120, True), result(60, True)]
+
+    with TemporaryDirectory() as td:
+        paths = [Path(td).joinpath(f"run_{i}.png") for i in range(len(runs))]
+        figures = []
+        with FigureRenderer(target_temp_c=25.0, lock_window_c=1.0, max_points=50) as renderer:
+            for run, path in zip(runs, paths):
+                renderer.render(run, path)
+                assert renderer._n_panels == (4 if run.link_states else 3)
+                figures.append(renderer._fig)
+
+        for path in paths:
+            assert path.exists()
+            assert path.stat().st_size > 0
+
+    # The figure is reused across lengths and rebuilt only on a layout change
+    assert figures[0] is figures[1]
+    assert figures[1] is not figures[2]
+    assert figures[2] is figures[3]
+
+
+@pytest.mark.parametrize("source", ["timeseries.npz", "timeseries.json"])
+def test_plot_from_artifacts_empty_names_source(source):
+    """The empty-data error names the timeseries file that was read."""
+    pytest.importorskip("matplotlib")
+    from thermalres.cosim.plotting import plot_from_artifacts
+
+    with TemporaryDirectory() as td:
+        artifact_dir = Path(td)
+        artifact_dir.joinpath("metrics.json").write_text('{"run": {}, "chunks": []}')
+        if source == "timeseries.npz":
+            np.savez(
+                artifact_dir.joinpath(source),
+                **{name: np.zeros(0) for name in _TS_PLOT_FIELDS},
+            )
+        else:
+            artifact_dir.joinpath(source).write_text('{"samples": []}')
+
+        with pytest.raises(ValueError, match=f"No samples in {source}"):
+            plot_from_artifacts(artifact_dir)
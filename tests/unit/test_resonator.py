@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
-from thermalres.plant.resonator import ResonatorParams, eval_resonator
+from thermalres.plant.resonator import (
+    ResonatorParams,
+    eval_resonator,
+    eval_resonator_batch,
+)
 
 
 @pytest.fixture
@@ -249,3 +254,21 @@ def test_resonator_outputs_immutability():
     # Should not be able to modify
     with pytest.raises(Exception):  # FrozenInstanceError
         outputs.resonance_nm = 1551.0  # type: ignore
+
+
+def test_resonator_batch_matches_scalar(default_params):
+    """
+    eval_resonator_batch should match eval_resonator element-wise, exactly.
+    """
+    temps = np.linspace(0.0, 60.0, 240).reshape(3, -1)
+
+    resonance, detune, locked = eval_resonator_batch(temps, default_params)
+
+    expected = [eval_resonator(temp_c=float(t), p=default_params) for t in temps.ravel()]
+    assert resonance.shape == detune.shape == locked.shape == temps.shape
+    assert locked.dtype == np.bool_
+    assert resonance.ravel().tolist() == [o.resonance_nm for o in expected]
+    assert detune.ravel().tolist() == [o.detune_nm for o in expected]
+    assert locked.ravel().tolist() == [o.locked for o in expected]
+    # Integer temperatures are promoted to float64
+    assert eval_resonator_batch(np.array([25]), default_params)[0].dtype == np.float64
@@ -0,0 +1,62 @@
+"""
+Unit tests for open-loop schedules and schedule materialization.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from thermalres.cosim.interfaces import PlantInputs
+from thermalres.scenarios import (
+    constant_heater,
+    heater_off_workload_on,
+    materialize,
+    ramp_workload,
+    step_workload,
+)
+
+
+@pytest.mark.parametrize(
+    "schedule",
+    [
+        constant_heater(heater=0.3, workload=0.1),
+        step_workload(heater=0.1, workload_low=0.2, workload_high=0.9, step_at_cycle=37),
+        ramp_workload(heater=0.0, workload_start=0.1, workload_end=0.7, ramp_cycles=93),
+        ramp_workload(heater=0.0, workload_start=0.1, workload_end=0.7, ramp_cycles=0),
+        heater_off_workload_on(workload=0.4),
+    ],
+)
+def test_materialize_matches_schedule(schedule):
+    """Vectorized schedules should match per-cycle calls exactly."""
+    cycles = np.arange(0, 400, 3)
+
+    heater, workload, dt = materialize(schedule, cycles)
+
+    expected = [schedule(int(c)) for c in cycles]
+    assert heater.tolist() == [e.heater_duty for e in expected]
+    assert workload.tolist() == [e.workload_frac for e in expected]
+    assert dt.tolist() == [e.dt_s for e in expected]
+
+
+@pytest.mark.filterwarnings("error")
+def test_ramp_workload_zero_cycles():
+    """A zero-length ramp holds the end workload without dividing by zero."""
+    schedule = ramp_workload(workload_start=0.1, workload_end=0.7, ramp_cycles=0)
+
+    _, workload, _ = materialize(schedule, 10)
+
+    assert workload.tolist() == [0.7] * 10
+
+
+def test_materialize_plain_callable():
+    """Arbitrary schedule callables are evaluated cycle by cycle."""
+
+    def schedule(cycle: int) -> PlantInputs:
+        return PlantInputs(heater_duty=cycle / 10, workload_frac=0.5, dt_s=0.1)
+
+    heater, workload, dt = materialize(schedule, 5)
+
+    assert heater.tolist() == [0.0, 0.1, 0.2, 0.3, 0.4]
+    assert workload.tolist() == [0.5] * 5
+    assert dt.tolist() == [0.1] * 5
@@ -36,6 +36,28 @@ def test_thermal_params_initialization():
     assert params.r_th_c_per_w == 10.0
 
 
+def test_thermal_params_derived_inverse_rc():
+    """1/(R_th*C_th) is precomputed and kept out of repr/equality."""
+    params = ThermalParams(
+        ambient_c=25.0,
+        r_th_c_per_w=10.0,
+        c_th_j_per_c=0.1,
+        heater_w_max=1.0,
+        workload_w_max=0.5,
+    )
+    assert params._inv_rc == pytest.approx(1.0)
+    assert "_inv_rc" not in repr(params)
+
+    with pytest.raises(ValueError):
+        ThermalParams(
+            ambient_c=25.0,
+            r_th_c_per_w=10.0,
+            c_th_j_per_c=0.0,
+            heater_w_max=1.0,
+            workload_w_max=0.5,
+        )
+
+
 def test_thermal_no_power_moves_toward_ambient(default_params):
     """
     With no power input and temp above ambient, temperature should decrease
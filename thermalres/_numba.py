@@ -0,0 +1,36 @@
+"""
+Optional Numba support.
+
+Numba is optional (pip install thermalres[jit]). Kernels are decorated with
+the njit exported here; without Numba it is an identity decorator, so the
+kernels run as ordinary Python, only slower. prange likewise falls back to
+the builtin range.
+
+Compiled and plain-Python runs give bit-identical results only because the
+kernels are compiled without fastmath (which would allow reassociation and
+FMA contraction); keep it off for any kernel whose results must not depend
+on whether Numba is installed.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Identity stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(fn):
+            return fn
+
+        return decorator
+
+    prange = range
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
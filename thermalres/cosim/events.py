@@ -1,12 +1,24 @@
 from __future__ import annotations
 
-import json
 import random
-from dataclasses import asdict
-from pathlib import Path
+
+from typing import Any
 
 from thermalres.cosim.interfaces import CrcEvent
 
+__all__ = ["EventSampler", "write_events_jsonl"]
+
+
+def __getattr__(name: str) -> Any:
+    # write_events_jsonl lives with the other artifact writers in metrics;
+    # it is re-exported lazily so importing the kernel (which imports this
+    # module) does not load the artifact writers
+    if name == "write_events_jsonl":
+        from thermalres.cosim.metrics import write_events_jsonl
+
+        return write_events_jsonl
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class EventSampler:
     """
@@ -59,26 +71,3 @@ class EventSampler:
             crc_fail=crc_fail,
             crc_fail_prob=crc_fail_prob,
         )
-
-
-def write_events_jsonl(out_path: Path, events: list[CrcEvent]) -> None:
-    """
-    Write events to JSONL format (one JSON object per line).
-
-    JSONL is efficient for streaming and appending.
-
-    Args:
-        out_path: Output directory
-        events: List of CRC events to write
-    """
-    if len(events) == 0:
-        return
-
-    out_path = Path(out_path)
-    out_path.mkdir(parents=True, exist_ok=True)
-
-    events_file = out_path.joinpath("events.jsonl")
-    with events_file.open("w", encoding="utf-8") as f:
-        for event in events:
-            json.dump(asdict(event), f, sort_keys=True)
-            f.write("\n")
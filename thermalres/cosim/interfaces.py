@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypedDict
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # slots are used to enfore good interface hygiene, disables dynamic attribute creation.
 @dataclass(frozen=True, slots=True)
@@ -42,6 +46,24 @@ class PlantOutputs:
     crc_fail_prob: float    # CRC failure probability [0, 1]
 
 
+@dataclass(frozen=True, slots=True)
+class PlantOutputsSoA:
+    """
+    Batched plant outputs in struct-of-arrays layout.
+
+    Element i of each array holds the PlantOutputs field for step i of
+    a PlantRunner.step_batch() call.
+    """
+    temp_c: np.ndarray         # Temperature (°C), float64
+    resonance_nm: np.ndarray   # Resonance wavelength (nm), float64
+    detune_nm: np.ndarray      # Detuning (nm, signed), float64
+    locked: np.ndarray         # Lock status, bool
+    crc_fail_prob: np.ndarray  # CRC failure probability [0, 1], float64
+
+    def __len__(self) -> int:
+        return len(self.temp_c)
+
+
 # Time-series recording
 
 @dataclass(frozen=True, slots=True)
@@ -136,6 +158,22 @@ class LinkStateSample:
     consec_passes: int      # Consecutive passes (resets on fail)
 
 
+class LinkStateColumns(TypedDict):
+    """
+    Link monitor state history in struct-of-arrays layout.
+
+    Column i of each array is the LinkStateSample field for sample i.
+    Produced by both LinkRunner.get_columns() (Python reference) and
+    run_link_monitor_rtl_columns() (RTL) so the two histories can be
+    compared with whole-array operations.
+    """
+    link_up: np.ndarray          # bool
+    total_frames: np.ndarray     # int64
+    total_crc_fails: np.ndarray  # int64
+    consec_fails: np.ndarray     # int64
+    consec_passes: np.ndarray    # int64
+
+
 # Run results
 
 @dataclass(frozen=True, slots=True)
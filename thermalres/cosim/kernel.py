@@ -19,7 +19,7 @@ Architecture:
         |
         +-- PlantRunner
         |   |-- ThermalState
-        |   |-- eval_plant_chain()
+        |   |-- plant_kernel() or the *_fast plant chain
         |
         +-- Controller (optional)
         |   |-- PIDController or BangBangController
@@ -72,8 +72,11 @@ from dataclasses import asdict
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Callable, Optional
 
+import numpy as np
+
 from ..config import SimConfig
 from ..control.interfaces import ControlInputs, Controller
+from ..scenarios.open_loop import materialize
 from .events import EventSampler
 from .interfaces import (
     ChunkSummary,
@@ -90,6 +93,12 @@ from .plant_runner import PlantRunner
 # the link_runner module being needed
 if TYPE_CHECKING:
     from .link_runner import LinkRunner
+    from .metrics import TimeseriesEncoder
+
+# Chunks per plant tile in open-loop runs. One step_batch call per tile
+# amortizes the call overhead, while the tile's outputs (converted to
+# Python lists for the per-chunk loop) stay small for any run length.
+_PLANT_TILE = 512
 
 
 class CoSimKernel:
@@ -112,6 +121,7 @@ class CoSimKernel:
         _schedule: Optional input schedule function (open-loop).
         _controller: Optional feedback controller.
         _link_runner: Optional link monitor runner.
+        _timeseries_encoder: Optional background encoder for timeseries.json.
     """
 
     def __init__(
@@ -122,6 +132,7 @@ class CoSimKernel:
         controller: Optional[Controller] = None,
         detune_target_nm: float = 0.0,
         link_runner: Optional["LinkRunner"] = None,
+        timeseries_encoder: Optional["TimeseriesEncoder"] = None,
     ) -> None:
         """
         Initialize the Co-Simulation Kernel.
@@ -152,6 +163,10 @@ class CoSimKernel:
                          link state from CRC events. When provided, CRC
                          events are processed through the link state machine
                          and recorded.
+            timeseries_encoder: Optional TimeseriesEncoder. When provided,
+                                each time-series sample is handed to it so
+                                JSON encoding overlaps with the simulation;
+                                pass the same encoder to write_run_artifacts.
         """
         # ─────────────────────────────────────────────────────────────
         # Store configuration and components
@@ -162,6 +177,7 @@ class CoSimKernel:
         self._controller = controller
         self._detune_target_nm = detune_target_nm
         self._link_runner = link_runner
+        self._timeseries_encoder = timeseries_encoder
 
         # ─────────────────────────────────────────────────────────────
         # Initialize event sampler for deterministic CRC event realization
@@ -230,7 +246,33 @@ class CoSimKernel:
             self._controller.reset()
 
         if self._link_runner is not None:
-            self._link_runner.reset()
+            # One link step per chunk: let the runner preallocate history
+            self._link_runner.reset(expected_cycles=-(-cycles // step))
+
+        if self._timeseries_encoder is not None:
+            self._timeseries_encoder.reset()
+
+        # ─────────────────────────────────────────────────────────────
+        # Evaluate the schedule for every chunk start up front, so the
+        # loop indexes lists (by chunk index) instead of calling the
+        # schedule and building a PlantInputs per chunk
+        # ─────────────────────────────────────────────────────────────
+        if self._schedule is not None and self._plant_runner is not None:
+            sched_cols = materialize(self._schedule, np.arange(0, cycles, step))
+            sched_heater, sched_workload, sched_dt = (col.tolist() for col in sched_cols)
+
+        # ─────────────────────────────────────────────────────────────
+        # Open-loop runs have no feedback into the plant inputs, so the
+        # plant is stepped a tile of chunks at a time (one compiled
+        # PlantRunner.step_batch call) and the tile's outputs are then
+        # consumed chunk by chunk
+        # ─────────────────────────────────────────────────────────────
+        tiled = (
+            self._controller is None
+            and self._schedule is not None
+            and self._plant_runner is not None
+        )
+        tile_start = tile_end = 0
 
         # ─────────────────────────────────────────────────────────────
         # Main simulation loop
@@ -272,9 +314,8 @@ class CoSimKernel:
                     # Controller only computes heater_duty; workload comes
                     # from the schedule (e.g., external disturbance)
                     if self._schedule is not None:
-                        scheduled_inputs = self._schedule(cur)
-                        workload_frac = scheduled_inputs.workload_frac
-                        dt_s = scheduled_inputs.dt_s
+                        workload_frac = sched_workload[idx]
+                        dt_s = sched_dt[idx]
                     else:
                         workload_frac = 0.0
                         dt_s = 0.1
@@ -284,10 +325,9 @@ class CoSimKernel:
                     # OPEN-LOOP MODE
                     # Schedule provides both heater_duty and workload
                     # ─────────────────────────────────────────────────
-                    scheduled_inputs = self._schedule(cur)
-                    heater_duty = scheduled_inputs.heater_duty
-                    workload_frac = scheduled_inputs.workload_frac
-                    dt_s = scheduled_inputs.dt_s
+                    heater_duty = sched_heater[idx]
+                    workload_frac = sched_workload[idx]
+                    dt_s = sched_dt[idx]
                     controller_error = None
                     controller_active = False
 
@@ -300,17 +340,49 @@ class CoSimKernel:
                     continue
 
                 # ─────────────────────────────────────────────────────
-                # Create plant inputs and step plant models
-                # ─────────────────────────────────────────────────────
-                inputs = PlantInputs(
-                    heater_duty=heater_duty,
-                    workload_frac=workload_frac,
-                    dt_s=dt_s,
-                )
-
                 # Step plant models (thermal -> resonator -> impairment)
-                outputs = self._plant_runner.step(inputs)
-                self._last_outputs = outputs
+                # ─────────────────────────────────────────────────────
+                if tiled:
+                    if idx >= tile_end:
+                        # Step the next tile of chunks in one batch
+                        tile_start = idx
+                        tile_end = min(idx + _PLANT_TILE, len(sched_heater))
+                        tile = self._plant_runner.step_batch(
+                            *(col[tile_start:tile_end] for col in sched_cols)
+                        )
+                        tile_temp = tile.temp_c.tolist()
+                        tile_detune = tile.detune_nm.tolist()
+                        tile_locked = tile.locked.tolist()
+                        tile_crc = tile.crc_fail_prob.tolist()
+
+                    j = idx - tile_start
+                    temp_c = tile_temp[j]
+                    detune_nm = tile_detune[j]
+                    locked = tile_locked[j]
+                    crc_fail_prob = tile_crc[j]
+                    if idx == tile_end - 1:
+                        # Last chunk of the tile: record its outputs, as the
+                        # per-chunk path does after every step
+                        self._last_outputs = PlantOutputs(
+                            temp_c=temp_c,
+                            resonance_nm=float(tile.resonance_nm[j]),
+                            detune_nm=detune_nm,
+                            locked=locked,
+                            crc_fail_prob=crc_fail_prob,
+                        )
+                else:
+                    outputs = self._plant_runner.step(
+                        PlantInputs(
+                            heater_duty=heater_duty,
+                            workload_frac=workload_frac,
+                            dt_s=dt_s,
+                        )
+                    )
+                    self._last_outputs = outputs
+                    temp_c = outputs.temp_c
+                    detune_nm = outputs.detune_nm
+                    locked = outputs.locked
+                    crc_fail_prob = outputs.crc_fail_prob
 
                 # ─────────────────────────────────────────────────────
                 # Sample CRC event from impairment probability
@@ -319,8 +391,8 @@ class CoSimKernel:
                 event = self._event_sampler.sample_crc_event(
                     cycle=cur,
                     chunk_idx=idx,
-                    crc_fail_prob=outputs.crc_fail_prob,
-                    locked=outputs.locked,
+                    crc_fail_prob=crc_fail_prob,
+                    locked=locked,
                 )
                 events.append(event)
 
@@ -337,16 +409,18 @@ class CoSimKernel:
                 # ─────────────────────────────────────────────────────
                 sample = TimeSeriesSample(
                     cycle=cur,
-                    temp_c=outputs.temp_c,
-                    detune_nm=outputs.detune_nm,
-                    locked=outputs.locked,
-                    crc_fail_prob=outputs.crc_fail_prob,
-                    heater_duty=inputs.heater_duty,
-                    workload_frac=inputs.workload_frac,
+                    temp_c=temp_c,
+                    detune_nm=detune_nm,
+                    locked=locked,
+                    crc_fail_prob=crc_fail_prob,
+                    heater_duty=heater_duty,
+                    workload_frac=workload_frac,
                     controller_error=controller_error,
                     controller_active=controller_active,
                 )
                 timeseries.append(sample)
+                if self._timeseries_encoder is not None:
+                    self._timeseries_encoder.add(sample)
 
             # Advance to next chunk
             cur = nxt
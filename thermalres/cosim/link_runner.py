@@ -59,9 +59,16 @@ Example usage:
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
+from itertools import islice
+from typing import Any, TypeVar
+
+import numpy as np
+
 from thermalres.cosim.interfaces import (
     CrcEvent,
     LinkMonitorConfig,
+    LinkStateColumns,
     LinkStateSample,
 )
 from thermalres.digital.reference import (
@@ -69,6 +76,73 @@ from thermalres.digital.reference import (
     LinkMonitorRef,
 )
 
+_T = TypeVar("_T")
+
+# LinkStateSample fields compared between the Python reference and RTL
+_LINK_STATE_FIELDS = (
+    "link_up",
+    "total_frames",
+    "total_crc_fails",
+    "consec_fails",
+    "consec_passes",
+)
+
+
+def _link_state_columns(samples: Sequence[LinkStateSample]) -> LinkStateColumns:
+    """Convert link state samples to the LinkStateColumns layout."""
+    n = len(samples)
+
+    def column(field: str, dtype: type) -> np.ndarray:
+        return np.fromiter((getattr(s, field) for s in samples), dtype=dtype, count=n)
+
+    return LinkStateColumns(
+        link_up=column("link_up", np.bool_),
+        total_frames=column("total_frames", np.int64),
+        total_crc_fails=column("total_crc_fails", np.int64),
+        consec_fails=column("consec_fails", np.int64),
+        consec_passes=column("consec_passes", np.int64),
+    )
+
+
+class _SamplesView(Sequence[_T]):
+    """
+    Read-only view over a LinkRunner history list.
+
+    Returned by get_samples()/get_events() instead of a full list copy.
+    The length is frozen when the view is created, so samples recorded by
+    later step() calls (or unused preallocated slots) are not visible
+    through an existing view.
+    """
+
+    __slots__ = ("_data", "_n")
+
+    def __init__(self, data: list[_T], n: int) -> None:
+        self._data = data
+        self._n = n
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._data[i] for i in range(self._n)[index]]
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("view index out of range")
+        return self._data[index]
+
+    def __iter__(self) -> Iterator[_T]:
+        return islice(self._data, self._n)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
 
 class LinkRunner:
     """
@@ -96,7 +170,11 @@ class LinkRunner:
         ...         print(f"Link went down at cycle {sample.cycle}")
     """
 
-    def __init__(self, config: LinkMonitorConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: LinkMonitorConfig | None = None,
+        expected_cycles: int | None = None,
+    ) -> None:
         """
         Initialize the link runner.
 
@@ -108,6 +186,11 @@ class LinkRunner:
             config: Link monitor configuration controlling thresholds
                     and RTL validation. Uses default LinkMonitorConfig()
                     if None.
+            expected_cycles: Optional number of step() calls expected in
+                             a run. When provided, the event and sample
+                             histories are preallocated to this size so
+                             step() does not grow the lists. Extra steps
+                             beyond this are still accepted.
         """
         # Store configuration (use defaults if not provided)
         self.config = config or LinkMonitorConfig()
@@ -128,12 +211,26 @@ class LinkRunner:
 
         # ─────────────────────────────────────────────────────────────
         # Event and sample history for analysis and RTL validation
-        # We store all events so we can replay them through RTL later
+        # We store all events so we can replay them through RTL later.
+        # Only the first _n entries are valid; the rest are preallocated.
         # ─────────────────────────────────────────────────────────────
+        self._expected_cycles = expected_cycles
         self._events: list[CrcEvent] = []
         self._samples: list[LinkStateSample] = []
+        self._n = 0
+        self._alloc_history()
+
+        # Most recent sample, kept so get_current_state() is a plain read
+        self._last_sample: LinkStateSample | None = None
+
+    def _alloc_history(self) -> None:
+        """Create fresh history lists, preallocated if the size is known."""
+        size = self._expected_cycles or 0
+        self._events = [None] * size  # type: ignore[list-item]
+        self._samples = [None] * size  # type: ignore[list-item]
+        self._n = 0
 
-    def reset(self) -> None:
+    def reset(self, expected_cycles: int | None = None) -> None:
         """
         Reset the link monitor to initial state.
 
@@ -143,13 +240,22 @@ class LinkRunner:
 
         This should be called at the start of each simulation run
         to ensure clean state.
+
+        Args:
+            expected_cycles: Optional number of step() calls expected in
+                             the next run. Replaces the value given at
+                             construction when provided.
         """
         # Reset the Python reference model
         self._ref.reset()
 
-        # Clear accumulated history
-        self._events.clear()
-        self._samples.clear()
+        if expected_cycles is not None:
+            self._expected_cycles = expected_cycles
+
+        # Start fresh history lists rather than clearing in place, so views
+        # handed out by get_samples()/get_events() stay valid
+        self._alloc_history()
+        self._last_sample = None
 
     def step(self, event: CrcEvent) -> LinkStateSample:
         """
@@ -178,8 +284,14 @@ class LinkRunner:
         """
         # ─────────────────────────────────────────────────────────────
         # Store event for history and potential RTL validation
+        # Fill preallocated slots first, append once they run out
         # ─────────────────────────────────────────────────────────────
-        self._events.append(event)
+        n = self._n
+        preallocated = n < len(self._events)
+        if preallocated:
+            self._events[n] = event
+        else:
+            self._events.append(event)
 
         # ─────────────────────────────────────────────────────────────
         # Step the Python reference model
@@ -197,47 +309,64 @@ class LinkRunner:
         sample = self._ref.to_link_state_sample(cycle=event.cycle)
 
         # Store sample for history
-        self._samples.append(sample)
+        if preallocated:
+            self._samples[n] = sample
+        else:
+            self._samples.append(sample)
+        self._n = n + 1
+        self._last_sample = sample
 
         return sample
 
-    def get_samples(self) -> list[LinkStateSample]:
+    def get_samples(self) -> Sequence[LinkStateSample]:
         """
         Get all link state samples collected during the run.
 
-        Returns a copy of the internal sample list. This is used for
-        artifact writing (link_state.json) and analysis.
+        Returns a read-only view of the internal sample list (no copy).
+        The view is fixed at the samples recorded so far. This is used
+        for artifact writing (link_state.json) and analysis.
 
         Returns:
-            List of LinkStateSample objects, one per step() call,
+            Sequence of LinkStateSample objects, one per step() call,
             in chronological order.
         """
-        return list(self._samples)
+        return _SamplesView(self._samples, self._n)
 
-    def get_events(self) -> list[CrcEvent]:
+    def get_events(self) -> Sequence[CrcEvent]:
         """
         Get all CRC events processed during the run.
 
-        Returns a copy of the internal event list. This is useful for
-        debugging and for replaying events through RTL.
+        Returns a read-only view of the internal event list (no copy).
+        This is useful for debugging and for replaying events through RTL.
 
         Returns:
-            List of CrcEvent objects, one per step() call,
+            Sequence of CrcEvent objects, one per step() call,
             in chronological order.
         """
-        return list(self._events)
+        return _SamplesView(self._events, self._n)
+
+    def get_columns(self) -> LinkStateColumns:
+        """
+        Get the link state history in struct-of-arrays layout.
+
+        Returns:
+            LinkStateColumns with one entry per step() call, in the same
+            layout as run_link_monitor_rtl_columns() returns for RTL.
+        """
+        return _link_state_columns(self.get_samples())
 
     def get_current_state(self) -> LinkStateSample | None:
         """
         Get the most recent link state sample.
 
+        The sample is cached by step() and cleared by reset(), so polling
+        this between cycles does not rebuild or look anything up.
+
         Returns:
             The last LinkStateSample, or None if no events have been
             processed yet.
         """
-        if self._samples:
-            return self._samples[-1]
-        return None
+        return self._last_sample
 
     def validate_against_rtl(self) -> tuple[bool, str]:
         """
@@ -275,7 +404,7 @@ class LinkRunner:
         # ─────────────────────────────────────────────────────────────
         # Check if we have any events to validate
         # ─────────────────────────────────────────────────────────────
-        if not self._events:
+        if not self._n:
             return (True, "No events to validate")
 
         # ─────────────────────────────────────────────────────────────
@@ -285,7 +414,7 @@ class LinkRunner:
         try:
             from thermalres.rtl.adapter import (
                 check_verilator_available,
-                run_link_monitor_rtl,
+                run_link_monitor_rtl_columns,
             )
         except ImportError as e:
             return (False, f"Failed to import RTL adapter: {e}")
@@ -298,17 +427,21 @@ class LinkRunner:
             )
 
         # ─────────────────────────────────────────────────────────────
-        # Convert events to RTL pattern format
-        # Each event becomes a (valid, crc_fail) tuple
+        # Convert events to RTL input format
+        # Every event is a valid frame, so only the crc_fail bits are
+        # passed (one bool per cycle, no per-event tuples)
         # ─────────────────────────────────────────────────────────────
-        pattern = [(True, e.crc_fail) for e in self._events]
+        events = self.get_events()
+        crc_fails = np.fromiter(
+            (e.crc_fail for e in events), dtype=np.bool_, count=len(events)
+        )
 
         # ─────────────────────────────────────────────────────────────
         # Run RTL simulation
         # ─────────────────────────────────────────────────────────────
         try:
-            rtl_samples = run_link_monitor_rtl(
-                pattern=pattern,
+            rtl_cols = run_link_monitor_rtl_columns(
+                crc_fails=crc_fails,
                 fails_to_down=self.config.fails_to_down,
                 passes_to_up=self.config.passes_to_up,
             )
@@ -318,59 +451,42 @@ class LinkRunner:
         # ─────────────────────────────────────────────────────────────
         # Compare RTL outputs against Python samples
         # ─────────────────────────────────────────────────────────────
-        if len(rtl_samples) != len(self._samples):
+        py_samples = self.get_samples()
+        n_rtl = len(rtl_cols["link_up"])
+        if n_rtl != len(py_samples):
             return (
                 False,
-                f"Sample count mismatch: Python={len(self._samples)}, "
-                f"RTL={len(rtl_samples)}",
+                f"Sample count mismatch: Python={len(py_samples)}, "
+                f"RTL={n_rtl}",
             )
 
-        for i, (py_sample, rtl_sample) in enumerate(
-            zip(self._samples, rtl_samples)
-        ):
-            # Check each field for equivalence
-            mismatches = []
-
-            if py_sample.link_up != rtl_sample.link_up:
-                mismatches.append(
-                    f"link_up: Python={py_sample.link_up}, RTL={rtl_sample.link_up}"
-                )
-
-            if py_sample.total_frames != rtl_sample.total_frames:
-                mismatches.append(
-                    f"total_frames: Python={py_sample.total_frames}, "
-                    f"RTL={rtl_sample.total_frames}"
-                )
-
-            if py_sample.total_crc_fails != rtl_sample.total_crc_fails:
-                mismatches.append(
-                    f"total_crc_fails: Python={py_sample.total_crc_fails}, "
-                    f"RTL={rtl_sample.total_crc_fails}"
-                )
-
-            if py_sample.consec_fails != rtl_sample.consec_fails:
-                mismatches.append(
-                    f"consec_fails: Python={py_sample.consec_fails}, "
-                    f"RTL={rtl_sample.consec_fails}"
-                )
-
-            if py_sample.consec_passes != rtl_sample.consec_passes:
-                mismatches.append(
-                    f"consec_passes: Python={py_sample.consec_passes}, "
-                    f"RTL={rtl_sample.consec_passes}"
-                )
-
-            if mismatches:
-                return (
-                    False,
-                    f"Mismatch at cycle {py_sample.cycle} (index {i}): "
-                    + "; ".join(mismatches),
-                )
+        # Compare all fields in one pass over (n_fields, n_samples) matrices;
+        # only on mismatch locate the first bad index and format its fields
+        py_cols = _link_state_columns(py_samples)
+        py_mat = np.stack([py_cols[f] for f in _LINK_STATE_FIELDS])
+        rtl_mat = np.stack([rtl_cols[f] for f in _LINK_STATE_FIELDS])
+        diff = py_mat != rtl_mat
+        bad = diff.any(axis=0)
+
+        if bad.any():
+            i = int(np.argmax(bad))
+            py_sample = py_samples[i]
+            mismatches = [
+                f"{field}: Python={getattr(py_sample, field)}, "
+                f"RTL={rtl_cols[field][i].item()}"
+                for k, field in enumerate(_LINK_STATE_FIELDS)
+                if diff[k, i]
+            ]
+            return (
+                False,
+                f"Mismatch at cycle {py_sample.cycle} (index {i}): "
+                + "; ".join(mismatches),
+            )
 
         # ─────────────────────────────────────────────────────────────
         # All checks passed
         # ─────────────────────────────────────────────────────────────
         return (
             True,
-            f"RTL validation passed: {len(self._samples)} samples verified",
+            f"RTL validation passed: {len(py_samples)} samples verified",
         )
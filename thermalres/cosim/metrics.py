@@ -10,6 +10,7 @@ Artifacts are first-class outputs of the simulation, enabling:
 Artifact files produced:
 - metrics.json: Run metadata and chunk summaries
 - timeseries.json: Per-chunk plant state samples
+- timeseries.npz: The same samples as NumPy columns (fast reload)
 - events.jsonl: Per-cycle CRC failure events
 - link_state.json: Per-cycle link monitor state
 
@@ -21,6 +22,7 @@ Example artifact directory structure:
 artifacts/runs/20240115_120000_example/
 ├── metrics.json       # Run metadata
 ├── timeseries.json    # Plant state history
+├── timeseries.npz     # Plant state history (NumPy columns)
 ├── events.jsonl       # CRC event stream
 └── link_state.json    # Link monitor history
 ```
@@ -28,9 +30,13 @@ artifacts/runs/20240115_120000_example/
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import fields
+from functools import lru_cache
+from operator import attrgetter, is_
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .interfaces import (
     ChunkSummary,
@@ -40,15 +46,254 @@ from .interfaces import (
     TimeSeriesSample,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+@lru_cache(maxsize=None)
+def _orjson():
+    """
+    Import orjson on first use, or return None if it is not installed.
+
+    orjson is optional (pip install thermalres[speedups]). It encodes
+    indented/sorted JSON natively and returns bytes; without it we fall back
+    to the stdlib encoder, which produces equivalent JSON. The encoders
+    (like the thread pools) are imported lazily so that importing this
+    module does not load them in runs that never write artifacts.
+    """
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - exercised only without orjson
+        return None
+    return orjson
+
+
+def _dumps_indented(payload: object, *, sort_keys: bool = False) -> bytes:
+    """Encode payload as 2-space indented JSON bytes with a trailing newline."""
+    orjson = _orjson()
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(payload, option=option) + b"\n"
+
+    import json
+
+    text = json.dumps(payload, indent=2, sort_keys=sort_keys, default=_numpy_default)
+    return (text + "\n").encode("utf-8")
+
+
+def _numpy_default(obj: object) -> object:
+    """
+    json.dumps default hook for NumPy scalars and arrays.
+
+    Mirrors orjson's OPT_SERIALIZE_NUMPY in the stdlib fallback, so
+    payloads holding np.float64/np.int64/np.bool_ values or arrays (e.g.
+    from batched plant outputs) encode the same way with either encoder.
+    """
+    tolist = getattr(obj, "tolist", None)
+    if tolist is not None and type(obj).__module__ == "numpy":
+        return tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write bytes to path with raw os-level I/O, replacing it atomically.
+
+    Skips the buffering/codec layers of Path.write_text for small artifacts.
+    Data goes to a sibling .tmp file that is moved into place with
+    os.replace, so readers never see a partially written file.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _dumps_compact(record: object) -> bytes:
+    """Encode a single record as one line of JSON bytes (no newline)."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    import json
+
+    return json.dumps(record, default=_numpy_default).encode("utf-8")
+
+
+# Field names and bulk getters for per-sample records, in dataclass order
+_TS_FIELDS = tuple(f.name for f in fields(TimeSeriesSample))
+_TS_GET = attrgetter(*_TS_FIELDS)
+_LS_FIELDS = tuple(f.name for f in fields(LinkStateSample))
+_LS_GET = attrgetter(*_LS_FIELDS)
+
+
+def _write_samples_json(path: Path, records: Iterable[bytes]) -> None:
+    """
+    Stream a {"samples": [...]} document to disk one record at a time.
+
+    Each encoded record is written as soon as it is produced, so peak
+    memory stays O(1) in the number of samples instead of holding the full
+    payload dict and its encoded string. Output is valid JSON with one
+    sample object per line inside the samples array. As in
+    _atomic_write_bytes, the document is built in a sibling .tmp file and
+    moved into place with os.replace, so an encoding error never leaves a
+    truncated file behind.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(b'{\n  "samples": [\n')
+            sep = b"    "
+            for record in records:
+                f.write(sep)
+                f.write(record)
+                sep = b",\n    "
+            f.write(b'\n  ]\n}\n')
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+
+
+def _iter_timeseries_records(samples: Iterable[TimeSeriesSample]) -> Iterator[bytes]:
+    """Lazily encode time-series samples as timeseries.json record bytes."""
+    return (_dumps_compact(dict(zip(_TS_FIELDS, _TS_GET(s)))) for s in samples)
+
+
+def _encode_timeseries(samples: Sequence[TimeSeriesSample]) -> list[bytes]:
+    """Encode a batch of samples up front (TimeseriesEncoder worker task)."""
+    return list(_iter_timeseries_records(samples))
+
+
+class TimeseriesEncoder:
+    """
+    Encode time-series samples in a background thread during a run.
+
+    The kernel hands each recorded sample to add(); samples are batched and
+    encoded to timeseries.json record bytes on a single worker thread while
+    the simulation continues. write_run_artifacts() then only has to copy
+    the precomputed bytes to disk.
+
+    Example:
+        >>> with TimeseriesEncoder() as encoder:
+        ...     kernel = CoSimKernel(cfg, ..., timeseries_encoder=encoder)
+        ...     result = kernel.run()
+        ...     write_run_artifacts(
+        ...         out_path=out_dir,
+        ...         metrics=result.metrics,
+        ...         chunks=result.chunks,
+        ...         timeseries=result.timeseries,
+        ...         timeseries_encoder=encoder,
+        ...     )
+    """
+
+    def __init__(self, batch_size: int = 256) -> None:
+        """
+        Args:
+            batch_size: Number of samples encoded per background task.
+
+        Raises:
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._batch_size = batch_size
+        self._pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="thermalres-encode"
+        )
+        self._closed = False
+        self._samples: list[TimeSeriesSample] = []
+        self._pending: list[TimeSeriesSample] = []
+        self._futures: list[Future[list[bytes]]] = []
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __enter__(self) -> TimeseriesEncoder:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def reset(self) -> None:
+        """Discard all samples added so far."""
+        for future in self._futures:
+            future.cancel()
+        self._samples = []
+        self._pending = []
+        self._futures = []
+
+    def add(self, sample: TimeSeriesSample) -> None:
+        """
+        Queue a sample; a full batch is submitted for encoding.
+
+        After close() samples are only queued, and encoded() encodes them
+        in the calling thread.
+        """
+        self._samples.append(sample)
+        self._pending.append(sample)
+        if len(self._pending) >= self._batch_size and not self._closed:
+            self._submit()
+
+    def fed_with(self, samples: Sequence[TimeSeriesSample]) -> bool:
+        """Return True if exactly these sample objects were added, in order."""
+        return len(samples) == len(self._samples) and all(
+            map(is_, samples, self._samples)
+        )
+
+    def encoded(self) -> Iterator[bytes]:
+        """
+        Yield encoded records for every sample added, in order.
+
+        Submits any partial batch first and blocks on outstanding work.
+        Once the encoder is closed, samples still queued are encoded in
+        the calling thread instead.
+        """
+        if self._pending and not self._closed:
+            self._submit()
+        for future in self._futures:
+            yield from future.result()
+        yield from _iter_timeseries_records(self._pending)
+
+    def close(self) -> None:
+        """
+        Flush the partial batch, wait for it and stop the worker thread.
+
+        encoded() keeps working after close().
+        """
+        if self._closed:
+            return
+        if self._pending:
+            self._submit()
+        self._closed = True
+        self._pool.shutdown(wait=True)
+
+    def _submit(self) -> None:
+        batch, self._pending = self._pending, []
+        self._futures.append(self._pool.submit(_encode_timeseries, batch))
+
 
 def write_run_artifacts(
     *,
     out_path: Path,
     metrics: RunMetrics,
-    chunks: list[ChunkSummary],
-    timeseries: list[TimeSeriesSample] | None = None,
-    events: list[CrcEvent] | None = None,
-    link_states: list[LinkStateSample] | None = None,
+    chunks: Sequence[ChunkSummary],
+    timeseries: Sequence[TimeSeriesSample] | None = None,
+    events: Sequence[CrcEvent] | None = None,
+    link_states: Sequence[LinkStateSample] | None = None,
+    timeseries_encoder: TimeseriesEncoder | None = None,
 ) -> None:
     """
     Write all simulation artifacts to disk.
@@ -62,14 +307,25 @@ def write_run_artifacts(
                   exist, including parent directories.
         metrics: Run-level metrics containing timing, cycle counts,
                  and scenario name. Always written.
-        chunks: List of chunk summaries with cycle ranges. Written
+        chunks: Sequence of chunk summaries with cycle ranges. Written
                 as part of metrics.json.
-        timeseries: Optional list of time-series samples.
-                    When provided and non-empty, writes timeseries.json.
-        events: Optional list of CRC events.
+        timeseries: Optional sequence of time-series samples.
+                    When provided and non-empty, writes timeseries.json
+                    and timeseries.npz.
+        events: Optional sequence of CRC events (e.g. the read-only view
+                from LinkRunner.get_events()).
                 When provided and non-empty, writes events.jsonl.
-        link_states: Optional list of link state samples.
+        link_states: Optional sequence of link state samples (e.g. the
+                     read-only view from LinkRunner.get_samples()).
                      When provided and non-empty, writes link_state.json.
+        timeseries_encoder: Optional encoder that was fed the same
+                            timeseries during the run (see
+                            TimeseriesEncoder). Its precomputed records
+                            are written instead of re-encoding the samples.
+
+    Raises:
+        ValueError: If timeseries_encoder was not fed exactly the samples
+                    in timeseries (e.g. it belongs to another run).
 
     Example:
         >>> from thermalres.cosim.metrics import write_run_artifacts
@@ -82,6 +338,16 @@ def write_run_artifacts(
         ...     link_states=result.link_states,
         ... )
     """
+    if (
+        timeseries_encoder is not None
+        and timeseries
+        and not timeseries_encoder.fed_with(timeseries)
+    ):
+        raise ValueError(
+            "timeseries_encoder was not fed these timeseries samples "
+            f"({len(timeseries_encoder)} encoded, {len(timeseries)} given)"
+        )
+
     # ─────────────────────────────────────────────────────────────────
     # Ensure output directory exists
     # ─────────────────────────────────────────────────────────────────
@@ -89,38 +355,56 @@ def write_run_artifacts(
     out_path.mkdir(parents=True, exist_ok=True)
 
     # ─────────────────────────────────────────────────────────────────
-    # Write metrics.json
-    # Contains run-level metadata and chunk summaries
-    # Always written regardless of other artifacts
+    # Collect the artifact writers that apply to this run
     # ─────────────────────────────────────────────────────────────────
-    _write_metrics_json(out_path, metrics, chunks)
+    # metrics.json: run-level metadata and chunk summaries (always written)
+    writers: list[tuple[Callable[..., None], tuple]] = [
+        (_write_metrics_json, (out_path, metrics, chunks)),
+    ]
 
-    # ─────────────────────────────────────────────────────────────────
-    # Write timeseries.json
-    # Contains per-chunk plant state samples
-    # ─────────────────────────────────────────────────────────────────
+    # timeseries.json: per-chunk plant state samples
     if timeseries is not None and len(timeseries) > 0:
-        _write_timeseries_json(out_path, timeseries)
-
-    # ─────────────────────────────────────────────────────────────────
-    # Write events.jsonl
-    # Contains per-cycle CRC events in JSON Lines format
-    # ─────────────────────────────────────────────────────────────────
+        if timeseries_encoder is not None:
+            writers.append(
+                (
+                    _write_samples_json,
+                    (out_path / "timeseries.json", timeseries_encoder.encoded()),
+                )
+            )
+        else:
+            writers.append((_write_timeseries_json, (out_path, timeseries)))
+        writers.append((_write_timeseries_npz, (out_path, timeseries)))
+
+    # events.jsonl: per-cycle CRC events in JSON Lines format
     if events is not None and len(events) > 0:
-        _write_events_jsonl(out_path, events)
+        writers.append((write_events_jsonl, (out_path, events)))
+
+    # link_state.json: per-cycle link monitor state samples
+    if link_states is not None and len(link_states) > 0:
+        writers.append((_write_link_state_json, (out_path, link_states)))
 
     # ─────────────────────────────────────────────────────────────────
-    # Write link_state.json
-    # Contains per-cycle link monitor state samples
+    # Write artifacts
+    # Each file is independent, so the writers run concurrently; file I/O
+    # releases the GIL. result() re-raises any writer exception here.
     # ─────────────────────────────────────────────────────────────────
-    if link_states is not None and len(link_states) > 0:
-        _write_link_state_json(out_path, link_states)
+    if len(writers) == 1:
+        fn, args = writers[0]
+        fn(*args)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(writers)) as pool:
+        futures = [pool.submit(fn, *args) for fn, args in writers]
+        for future in futures:
+            future.result()
 
 
 def _write_metrics_json(
     out_path: Path,
     metrics: RunMetrics,
-    chunks: list[ChunkSummary],
+    chunks: Sequence[ChunkSummary],
 ) -> None:
     """
     Write metrics.json artifact.
@@ -144,21 +428,32 @@ def _write_metrics_json(
         ]
     }
     """
+    from dataclasses import asdict
+
     payload = {
         "run": asdict(metrics),
-        "chunks": [asdict(c) for c in chunks],
+        "chunks": _chunks_to_jsonable(chunks),
     }
 
     metrics_path = out_path / "metrics.json"
-    metrics_path.write_text(
-        json.dumps(payload, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    _atomic_write_bytes(metrics_path, _dumps_indented(payload, sort_keys=True))
+
+
+def _chunks_to_jsonable(chunks: Sequence[ChunkSummary]) -> list[dict[str, int]]:
+    """Convert chunk summaries to JSON-ready dicts (cheaper than asdict)."""
+    return [
+        {
+            "chunk_idx": c.chunk_idx,
+            "start_cycle": c.start_cycle,
+            "end_cycle": c.end_cycle,
+        }
+        for c in chunks
+    ]
 
 
 def _write_timeseries_json(
     out_path: Path,
-    timeseries: list[TimeSeriesSample],
+    timeseries: Sequence[TimeSeriesSample],
 ) -> None:
     """
     Write timeseries.json artifact.
@@ -181,23 +476,57 @@ def _write_timeseries_json(
         ]
     }
     """
-    timeseries_payload = {
-        "samples": [asdict(s) for s in timeseries],
-    }
-    timeseries_path = out_path / "timeseries.json"
-    timeseries_path.write_text(
-        json.dumps(timeseries_payload, indent=2) + "\n",
-        encoding="utf-8",
+    _write_samples_json(
+        out_path / "timeseries.json", _iter_timeseries_records(timeseries)
+    )
+
+
+def _write_timeseries_npz(
+    out_path: Path,
+    timeseries: Sequence[TimeSeriesSample],
+) -> None:
+    """
+    Write timeseries.npz artifact.
+
+    Same samples as timeseries.json, stored as one NumPy array per
+    TimeSeriesSample field (uncompressed np.savez) so tools can reload
+    contiguous columns without parsing JSON. controller_error uses NaN
+    where the sample has None.
+
+    Arrays:
+        cycle: int64
+        temp_c, detune_nm, crc_fail_prob, heater_duty, workload_frac,
+        controller_error: float64
+        locked, controller_active: bool
+    """
+    import numpy as np
+
+    columns = dict(zip(_TS_FIELDS, zip(*map(_TS_GET, timeseries))))
+    columns["controller_error"] = [
+        np.nan if e is None else e for e in columns["controller_error"]
+    ]
+    dtypes = {"cycle": np.int64, "locked": np.bool_, "controller_active": np.bool_}
+
+    np.savez(
+        out_path / "timeseries.npz",
+        **{
+            name: np.asarray(values, dtype=dtypes.get(name, np.float64))
+            for name, values in columns.items()
+        },
     )
 
 
-def _write_events_jsonl(
+def write_events_jsonl(
     out_path: Path,
-    events: list[CrcEvent],
+    events: Sequence[CrcEvent],
 ) -> None:
     """
     Write events.jsonl artifact.
 
+    Used by write_run_artifacts and re-exported from thermalres.cosim.events
+    for writing events on their own. Nothing is written for an empty event
+    sequence; the output directory is created if needed.
+
     Uses JSON Lines format (one JSON object per line) for:
     - Streaming efficiency with large event counts
     - Easy line-by-line processing
@@ -205,18 +534,38 @@ def _write_events_jsonl(
 
     Each line schema:
     {"cycle": int, "chunk_idx": int, "crc_fail": bool, "crc_fail_prob": float}
+
+    Args:
+        out_path: Output directory
+        events: Sequence of CRC events to write
     """
+    if len(events) == 0:
+        return
+
+    out_path = Path(out_path)
+    out_path.mkdir(parents=True, exist_ok=True)
     events_path = out_path / "events.jsonl"
-    with events_path.open("w", encoding="utf-8") as f:
+    with events_path.open("wb") as f:
         for event in events:
-            # Write each event as a single JSON line
-            json.dump(asdict(event), f, sort_keys=True)
-            f.write("\n")
+            # Write each event as a single JSON line. Keys are inserted in
+            # sorted order so the output is deterministic without paying
+            # for sort_keys on every line.
+            f.write(
+                _dumps_compact(
+                    {
+                        "chunk_idx": event.chunk_idx,
+                        "crc_fail": event.crc_fail,
+                        "crc_fail_prob": event.crc_fail_prob,
+                        "cycle": event.cycle,
+                    }
+                )
+            )
+            f.write(b"\n")
 
 
 def _write_link_state_json(
     out_path: Path,
-    link_states: list[LinkStateSample],
+    link_states: Sequence[LinkStateSample],
 ) -> None:
     """
     Write link_state.json artifact.
@@ -244,11 +593,7 @@ def _write_link_state_json(
     - Transitions to False after N consecutive failures
     - Transitions back to True after M consecutive passes
     """
-    link_state_payload = {
-        "samples": [asdict(s) for s in link_states],
-    }
-    link_state_path = out_path / "link_state.json"
-    link_state_path.write_text(
-        json.dumps(link_state_payload, indent=2) + "\n",
-        encoding="utf-8",
+    _write_samples_json(
+        out_path / "link_state.json",
+        (_dumps_compact(dict(zip(_LS_FIELDS, _LS_GET(s)))) for s in link_states),
     )
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from thermalres.cosim.interfaces import PlantInputs, PlantOutputs
+from typing import TYPE_CHECKING
+
+from thermalres.cosim.interfaces import PlantInputs, PlantOutputs, PlantOutputsSoA
 from thermalres.plant import (
     ThermalParams,
     ThermalState,
     ResonatorParams,
     ImpairmentParams,
-    eval_plant_chain,
+    eval_impairment_fast,
+    eval_resonator_fast,
+    step_thermal_fast,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class PlantRunner:
     """
@@ -32,6 +39,7 @@ class PlantRunner:
         resonator_params: ResonatorParams,
         impairment_params: ImpairmentParams,
         initial_temp_c: float,
+        use_jit: bool = False,
     ):
         """
         Initialize the plant runner.
@@ -41,6 +49,11 @@ class PlantRunner:
             resonator_params: Resonator model parameters
             impairment_params: Impairment model parameters
             initial_temp_c: Initial temperature (°C)
+            use_jit: If True and Numba is installed, step() runs the fused
+                     compiled plant kernel instead of the Python chain.
+                     Off by default: a per-step call gains little over
+                     the Python chain. step_batch() always uses the
+                     compiled loop when Numba is installed.
         """
         self.thermal_params = thermal_params
         self.resonator_params = resonator_params
@@ -49,6 +62,28 @@ class PlantRunner:
         # Initialize thermal state
         self.thermal_state = ThermalState(temp_c=initial_temp_c)
 
+        # Fused scalar kernel and its packed params (None: pure-Python chain)
+        self._kernel = None
+        self._packed_params: tuple = ()
+        if use_jit:
+            self._bind_kernel()
+
+    def _bind_kernel(self) -> None:
+        """Bind the compiled plant kernel if Numba is available."""
+        from thermalres._numba import NUMBA_AVAILABLE
+
+        if not NUMBA_AVAILABLE:
+            return
+
+        from thermalres.plant import _jit
+
+        self._kernel = _jit.plant_kernel
+        self._packed_params = (
+            _jit.pack_thermal_params(self.thermal_params),
+            _jit.pack_resonator_params(self.resonator_params),
+            _jit.pack_impairment_params(self.impairment_params),
+        )
+
     def step(self, inputs: PlantInputs) -> PlantOutputs:
         """
         Step the plant models forward by one timestep.
@@ -59,16 +94,84 @@ class PlantRunner:
         Returns:
             PlantOutputs with updated state and computed metrics
         """
-        # Evaluate the plant chain
-        self.thermal_state, outputs = eval_plant_chain(
-            thermal_state=self.thermal_state,
-            inputs=inputs,
-            thermal_params=self.thermal_params,
-            resonator_params=self.resonator_params,
-            impairment_params=self.impairment_params,
+        kernel = self._kernel
+        if kernel is not None:
+            # One compiled call for the whole chain; no intermediate outputs
+            temp_c, resonance_nm, detune_nm, locked, crc_fail_prob = kernel(
+                self.thermal_state.temp_c,
+                inputs.heater_duty,
+                inputs.workload_frac,
+                inputs.dt_s,
+                *self._packed_params,
+            )
+            self.thermal_state = ThermalState(temp_c=temp_c)
+            return PlantOutputs(
+                temp_c=temp_c,
+                resonance_nm=resonance_nm,
+                detune_nm=detune_nm,
+                locked=locked,
+                crc_fail_prob=crc_fail_prob,
+            )
+
+        # Pure-Python chain on bare floats: only PlantOutputs and the new
+        # ThermalState are allocated per step
+        temp_c = step_thermal_fast(
+            self.thermal_state.temp_c,
+            inputs.dt_s,
+            inputs.heater_duty,
+            inputs.workload_frac,
+            self.thermal_params,
+        )
+        resonance_nm, detune_nm, locked = eval_resonator_fast(temp_c, self.resonator_params)
+        crc_fail_prob = eval_impairment_fast(detune_nm, locked, self.impairment_params)
+
+        self.thermal_state = ThermalState(temp_c=temp_c)
+        return PlantOutputs(
+            temp_c=temp_c,
+            resonance_nm=resonance_nm,
+            detune_nm=detune_nm,
+            locked=locked,
+            crc_fail_prob=crc_fail_prob,
+        )
+
+    def step_batch(
+        self,
+        heater_duty: np.ndarray,
+        workload_frac: np.ndarray,
+        dt_s: np.ndarray,
+    ) -> PlantOutputsSoA:
+        """
+        Step the plant models forward over a batch of timesteps.
+
+        Equivalent to calling step() once per element, but runs the whole
+        batch in a single compiled loop (Numba, when installed) without
+        per-step object allocation. Thermal state advances to the end of
+        the batch.
+
+        Args:
+            heater_duty: Heater duty per step, shape (n,)
+            workload_frac: Workload fraction per step, shape (n,)
+            dt_s: Timestep per step (seconds), shape (n,)
+
+        Returns:
+            PlantOutputsSoA with one entry per step
+
+        Raises:
+            ValueError: If the input arrays are not 1-D and of equal length
+        """
+        from thermalres.plant.fused import run_plant_batch
+
+        self.thermal_state, out = run_plant_batch(
+            self.thermal_state,
+            heater_duty,
+            workload_frac,
+            dt_s,
+            self.thermal_params,
+            self.resonator_params,
+            self.impairment_params,
         )
 
-        return outputs
+        return out
 
     def get_thermal_state(self) -> ThermalState:
         """Get the current thermal state (for inspection/testing)."""
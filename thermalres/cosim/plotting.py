@@ -11,20 +11,561 @@ Requires matplotlib: pip install thermalres[plot]
 from __future__ import annotations
 
 import json
+from collections.abc import Callable, Sequence
+from functools import lru_cache, wraps
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 
 if TYPE_CHECKING:
     from .interfaces import RunResult
 
+# Time-series fields drawn by the plots, in the order they are unpacked
+_TS_PLOT_FIELDS = (
+    "cycle",
+    "temp_c",
+    "detune_nm",
+    "crc_fail_prob",
+    "heater_duty",
+    "workload_frac",
+)
+_TS_PLOT_ROW = np.dtype((np.float64, len(_TS_PLOT_FIELDS)))
+
+# Link state fields drawn in the link panel, with the dtype of each column
+_LINK_PLOT_FIELDS = ("cycle", "link_up", "consec_fails", "consec_passes")
+_LINK_PLOT_ROW = np.dtype(
+    [("cycle", np.int64), ("link_up", np.uint8),
+     ("consec_fails", np.int32), ("consec_passes", np.int32)]
+)
+
+# Render settings for long line plots: simplify away sub-pixel vertices
+# more aggressively than the default threshold (0.111) and let Agg draw
+# long paths in chunks instead of one huge path
+_FAST_RC = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+
+# PNG encoder settings: zlib level 1 encodes several times faster than
+# Pillow's default (6) for a modestly larger file
+_PNG_PIL_KWARGS = {"compress_level": 1}
+
+
+def _fast_render(fn: Callable[..., None]) -> Callable[..., None]:
+    """Run a plot function with _FAST_RC applied (without changing globals)."""
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> None:
+        if not check_matplotlib_available():
+            return fn(*args, **kwargs)  # raises the install hint
+
+        import matplotlib
+
+        with matplotlib.rc_context(_FAST_RC):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def _timeseries_columns(
+    samples: Sequence[Any],
+    get: Callable[[Any], tuple],
+) -> np.ndarray:
+    """
+    Extract the plotted time-series fields into float64 columns in one pass.
+
+    Args:
+        samples: TimeSeriesSample objects or timeseries.json sample dicts.
+        get: Getter returning the _TS_PLOT_FIELDS values of one sample.
+
+    Returns:
+        Array of shape (len(_TS_PLOT_FIELDS), len(samples)); row i holds
+        field i, so it unpacks as cycles, temps, detunes, ...
+    """
+    rows = np.fromiter(map(get, samples), dtype=_TS_PLOT_ROW, count=len(samples))
+    return rows.T
+
+
+def _link_columns(
+    samples: Sequence[Any],
+    get: Callable[[Any], tuple],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Extract the plotted link state fields into typed columns in one pass.
+
+    Args:
+        samples: LinkStateSample objects or link_state.json sample dicts.
+        get: Getter returning the _LINK_PLOT_FIELDS values of one sample.
+
+    Returns:
+        (cycles, link_up, consec_fails, consec_passes); link_up is uint8
+        (1 = up) so it can be drawn as a step trace directly.
+    """
+    rows = np.fromiter(map(get, samples), dtype=_LINK_PLOT_ROW, count=len(samples))
+    return tuple(rows[name] for name in _LINK_PLOT_FIELDS)
+
+
+def _load_timeseries_columns(path: Path) -> np.ndarray:
+    """
+    Stream timeseries.json into float64 columns without loading it whole.
+
+    write_run_artifacts puts one sample object per line, so each record is
+    parsed on its own and copied into a preallocated array sized from the
+    line count; the full list of sample dicts is never held in memory.
+    Files in any other layout (e.g. fully indented JSON from older runs)
+    fall back to json.load.
+
+    Returns:
+        Array of shape (len(_TS_PLOT_FIELDS), n_samples), as from
+        _timeseries_columns.
+    """
+    get = itemgetter(*_TS_PLOT_FIELDS)
+
+    with path.open("rb") as f:
+        # Line count is an upper bound on the number of records
+        n_max = sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 20), b""))
+        rows = np.empty((n_max, len(_TS_PLOT_FIELDS)), dtype=np.float64)
 
+        f.seek(0)
+        n = 0
+        in_samples = False
+        for line in f:
+            line = line.strip().rstrip(b",")
+            if not in_samples:
+                in_samples = line == b'"samples": ['
+            elif line.startswith(b"{") and line.endswith(b"}"):
+                rows[n] = get(json.loads(line))
+                n += 1
+
+    if n == 0:
+        with path.open() as f:
+            samples = json.load(f).get("samples", [])
+        return _timeseries_columns(samples, get)
+
+    return rows[:n].T
+
+
+def _minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select indices that preserve the visual envelope of y (MinMax).
+
+    y is split into n_out // 2 equal buckets and the positions of each
+    bucket's minimum and maximum are kept, along with the first and last
+    points. Peaks and troughs survive, unlike plain striding.
+
+    Returns:
+        Sorted, unique indices into y (at most n_out + 2 of them).
+    """
+    n = len(y)
+    size = -(-n // max(n_out // 2, 1))
+    full = n - n % size
+    buckets = y[:full].reshape(-1, size)
+    starts = np.arange(0, full, size)
+    picks = [
+        [0, n - 1],
+        starts + buckets.argmin(axis=1),
+        starts + buckets.argmax(axis=1),
+    ]
+    if full < n:
+        tail = y[full:]
+        picks.append([full + tail.argmin(), full + tail.argmax()])
+    return np.unique(np.concatenate(picks))
+
+
+def _downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_out: int | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    MinMax-downsample a trace to about n_out points for plotting.
+
+    Matplotlib cannot show more points than the figure has pixels, so long
+    traces are reduced to their per-bucket extremes before drawing.
+
+    Args:
+        x: X values (cycles).
+        y: Y values.
+        n_out: Target point count. None, or a value >= len(y), returns the
+               trace unchanged.
+    """
+    if n_out is None or len(y) <= n_out:
+        return x, y
+    idx = _minmax_indices(y, n_out)
+    return x[idx], y[idx]
+
+
+def _downsample_nearest(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_out: int | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Nearest-neighbour downsample for step traces (e.g. link up/down)."""
+    if n_out is None or len(y) <= n_out:
+        return x, y
+    idx = np.linspace(0, len(y) - 1, n_out).round().astype(np.intp)
+    return x[idx], y[idx]
+
+
+@lru_cache(maxsize=None)
 def check_matplotlib_available() -> bool:
-    """Check if matplotlib is available."""
+    """Check if matplotlib is available (the import is attempted once)."""
     try:
-        import matplotlib
-        return True
+        import matplotlib  # noqa: F401
     except ImportError:
         return False
+    return True
+
+
+class FigureRenderer:
+    """
+    Reusable results figure for rendering many runs (e.g. a parameter sweep).
+
+    The figure, axes, legends and line artists are built on the first
+    render and kept; later renders only swap the line data with
+    Line2D.set_data, rescale the axes and save, so figure construction is
+    paid once per sweep instead of once per plot. The figure uses the
+    constrained layout engine, which solves the layout (suptitle
+    included) once per draw rather than iterating like tight_layout.
+    The figure is rebuilt only if the panel layout changes (link state
+    present or not).
+
+    Example:
+        >>> with FigureRenderer(max_points=2000) as renderer:
+        ...     for i, result in enumerate(results):
+        ...         renderer.render(result, f"sweep_{i}.png")
+    """
+
+    def __init__(
+        self,
+        target_temp_c: float | None = None,
+        lock_window_c: float | None = None,
+        max_points: int | None = 5000,
+        interactive: bool = False,
+        dpi: int = 100,
+    ) -> None:
+        """
+        Args:
+            target_temp_c: Target temperature for the lock window lines (°C).
+            lock_window_c: Temperature tolerance around target (±°C).
+            max_points: Maximum points drawn per trace (see _downsample).
+            interactive: If True, register the figure with pyplot so it can
+                         be displayed with plt.show(). Otherwise the figure
+                         is a standalone Figure on an Agg canvas that never
+                         enters pyplot's global figure registry.
+            dpi: Resolution of saved raster images (dots per inch).
+
+        Raises:
+            RuntimeError: If matplotlib is not installed.
+        """
+        if not check_matplotlib_available():
+            raise RuntimeError(
+                "matplotlib not installed. Install with: pip install thermalres[plot]"
+            )
+        self._target_temp_c = target_temp_c
+        self._lock_window_c = lock_window_c
+        self._max_points = max_points
+        self._interactive = interactive
+        self._dpi = dpi
+        self._fig = None
+        self._n_panels = 0
+        self._axes: dict[str, Any] = {}
+        self._lines: dict[str, Any] = {}
+        self._link_fill = None
+
+    def __enter__(self) -> FigureRenderer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the cached figure."""
+        if self._fig is not None:
+            if self._interactive:
+                import matplotlib.pyplot as plt
+
+                plt.close(self._fig)
+            self._fig = None
+
+    def render(
+        self,
+        result: "RunResult",
+        output_path: Path | str,
+        title: str | None = None,
+    ) -> None:
+        """
+        Render a RunResult and save it to output_path.
+
+        Raises:
+            ValueError: If the result has no timeseries data.
+        """
+        columns, link, title = _result_panel_data(result, title)
+        self.draw(*columns, link=link, title=title)
+        self.save(Path(output_path))
+
+    @_fast_render
+    def draw(
+        self,
+        cycles: np.ndarray,
+        temps: np.ndarray,
+        detunes: np.ndarray,
+        crc_probs: np.ndarray,
+        heater_duties: np.ndarray,
+        workloads: np.ndarray,
+        link: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None,
+        title: str,
+    ) -> None:
+        """
+        Load extracted arrays into the figure, building it if needed.
+
+        Args:
+            cycles, temps, detunes, crc_probs, heater_duties, workloads:
+                Time-series columns (see _timeseries_columns).
+            link: (cycles, link_up, consec_fails, consec_passes) for the link
+                  state panel, or None to draw 3 panels.
+            title: Figure title.
+        """
+        n_panels = 4 if link is not None else 3
+        if self._fig is None or self._n_panels != n_panels:
+            self.close()
+            self._build(n_panels)
+
+        max_points = self._max_points
+        lines = self._lines
+        lines["temp"].set_data(*_downsample(cycles, temps, max_points))
+        lines["detune"].set_data(*_downsample(cycles, detunes, max_points))
+        # CRC probability shares the detuning axis: 1.0 maps to max |detune|
+        detune_scale = float(np.max(np.abs(detunes), initial=0.0)) or 1.0
+        lines["crc"].set_data(
+            *_downsample(cycles, np.asarray(crc_probs) * detune_scale, max_points)
+        )
+        lines["heater"].set_data(*_downsample(cycles, heater_duties, max_points))
+        lines["workload"].set_data(*_downsample(cycles, workloads, max_points))
+
+        if link is not None:
+            link_cycles, link_up, consec_fails, consec_passes = link
+            link_x, link_y = _downsample_nearest(link_cycles, link_up, max_points)
+
+            # fill_between has no set_data; replace the collection
+            ax4 = self._axes["link"]
+            if self._link_fill is not None:
+                self._link_fill.remove()
+            self._link_fill = ax4.fill_between(
+                link_x, link_y, alpha=0.3, color="green", step="post",
+                label="Link UP", rasterized=True,
+            )
+            lines["link_up"].set_data(link_x, link_y)
+            lines["consec_fails"].set_data(
+                *_downsample(link_cycles, consec_fails, max_points)
+            )
+            lines["consec_passes"].set_data(
+                *_downsample(link_cycles, consec_passes, max_points)
+            )
+
+        # Rescale to the new data (fixed y limits are left alone)
+        for ax in self._axes.values():
+            ax.relim()
+            ax.autoscale_view()
+
+        self._fig.suptitle(title, fontsize=14, fontweight="bold")
+
+    @_fast_render
+    def save(self, output_path: Path) -> None:
+        """Save the current figure to output_path."""
+        kwargs = {}
+        if output_path.suffix.lower() == ".png":
+            kwargs["pil_kwargs"] = _PNG_PIL_KWARGS
+        self._fig.savefig(output_path, dpi=self._dpi, bbox_inches="tight", **kwargs)
+        print(f"Plot saved to: {output_path}")
+
+    def _build(self, n_panels: int) -> None:
+        """Create the figure, axes, styling and (empty) data artists."""
+        figsize = (10, 2.5 * n_panels)
+        if self._interactive:
+            import matplotlib.pyplot as plt
+
+            fig = plt.figure(figsize=figsize, layout="constrained")
+        else:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            fig = Figure(figsize=figsize, layout="constrained")
+            FigureCanvasAgg(fig)
+
+        axes = fig.subplots(n_panels, 1, sharex=True)
+        self._fig = fig
+        self._n_panels = n_panels
+        self._axes = {}
+        self._lines = {}
+        self._link_fill = None
+        lines = self._lines
+
+        # Panel 1: Temperature
+        ax1 = axes[0]
+        (lines["temp"],) = ax1.plot([], [], "r-", linewidth=1.5,
+                                    label="Temperature", rasterized=True)
+
+        # Add target temperature reference lines if provided
+        target_temp_c = self._target_temp_c
+        lock_window_c = self._lock_window_c
+        if target_temp_c is not None and lock_window_c is not None:
+            upper_bound = target_temp_c + lock_window_c
+            lower_bound = target_temp_c - lock_window_c
+            ax1.axhline(y=upper_bound, color="black", linestyle=":", linewidth=1.5,
+                        label=f"Lock window ({lower_bound:.1f}-{upper_bound:.1f}°C)")
+            ax1.axhline(y=lower_bound, color="black", linestyle=":", linewidth=1.5)
+
+        ax1.set_ylabel("Temperature (°C)", color="r")
+        ax1.tick_params(axis="y", labelcolor="r")
+        ax1.grid(True, alpha=0.3)
+        ax1.legend(loc="upper left")
+
+        # Panel 2: Detuning and CRC probability
+        ax2 = axes[1]
+        color_detune = "tab:blue"
+        color_crc = "tab:orange"
+
+        (lines["detune"],) = ax2.plot([], [], color=color_detune, linewidth=1.5,
+                                      label="Detuning", rasterized=True)
+        # Drawn on the same axes, scaled so 1.0 sits at the peak detuning,
+        # instead of on a twinx() axis with its own transforms and ticks
+        (lines["crc"],) = ax2.plot([], [], color=color_crc, linewidth=1.5,
+                                   linestyle="--", label="CRC Fail Prob (scaled)",
+                                   rasterized=True)
+        ax2.set_ylabel("Detuning (nm)", color=color_detune)
+        ax2.tick_params(axis="y", labelcolor=color_detune)
+        ax2.grid(True, alpha=0.3)
+        ax2.legend(loc="upper left")
+
+        # Panel 3: Heater duty and workload
+        ax3 = axes[2]
+        (lines["heater"],) = ax3.plot([], [], "g-", linewidth=1.5,
+                                      label="Heater Duty", rasterized=True)
+        (lines["workload"],) = ax3.plot([], [], "m--", linewidth=1.5,
+                                        label="Workload", rasterized=True)
+        ax3.set_ylabel("Duty Cycle / Fraction")
+        ax3.set_ylim(-0.05, 1.05)
+        ax3.grid(True, alpha=0.3)
+        ax3.legend(loc="upper left")
+
+        self._axes.update(temp=ax1, detune=ax2, drive=ax3)
+
+        # Panel 4: Link state (if available)
+        if n_panels == 4:
+            ax4 = axes[3]
+            (lines["link_up"],) = ax4.step([], [], where="post", color="green",
+                                           linewidth=2, rasterized=True)
+
+            # Consecutive counters on secondary axis
+            ax4_twin = ax4.twinx()
+            (lines["consec_fails"],) = ax4_twin.plot(
+                [], [], "r-", linewidth=1, alpha=0.7, antialiased=False,
+                label="Consec Fails", rasterized=True,
+            )
+            (lines["consec_passes"],) = ax4_twin.plot(
+                [], [], "b-", linewidth=1, alpha=0.7, antialiased=False,
+                label="Consec Passes", rasterized=True,
+            )
+            ax4_twin.set_ylabel("Consecutive Count")
+
+            ax4.set_ylabel("Link State")
+            ax4.set_yticks([0, 1])
+            ax4.set_yticklabels(["DOWN", "UP"])
+            ax4.set_ylim(-0.1, 1.1)
+            ax4.grid(True, alpha=0.3)
+
+            # Combined legend; the fill is recreated on every draw, so a
+            # proxy patch with the same style stands in for it
+            from matplotlib.patches import Patch
+
+            lines2, labels2 = ax4_twin.get_legend_handles_labels()
+            ax4.legend([Patch(color="green", alpha=0.3)] + lines2,
+                       ["Link UP"] + labels2, loc="upper right")
+
+            ax4.set_xlabel("Cycle")
+            self._axes.update(link=ax4, consec=ax4_twin)
+        else:
+            ax3.set_xlabel("Cycle")
+
+
+def _render_panels(
+    cycles: np.ndarray,
+    temps: np.ndarray,
+    detunes: np.ndarray,
+    crc_probs: np.ndarray,
+    heater_duties: np.ndarray,
+    workloads: np.ndarray,
+    link: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None,
+    title: str,
+    output_path: Path | None,
+    show: bool,
+    target_temp_c: float | None = None,
+    lock_window_c: float | None = None,
+    max_points: int | None = 5000,
+    dpi: int = 100,
+) -> None:
+    """
+    Draw the 3- or 4-panel results figure once from extracted arrays.
+
+    Shared by plot_simulation_results and plot_from_artifacts, which only
+    differ in where the data comes from. Data artists are rasterized, so
+    vector outputs (PDF/SVG) embed one bitmap per axes instead of every
+    line segment; axes, labels and text stay vector.
+
+    Args:
+        cycles, temps, detunes, crc_probs, heater_duties, workloads,
+        link, title: See FigureRenderer.draw.
+        output_path: Where to save the figure; None to skip saving.
+        show: If True, display the plot interactively.
+        target_temp_c, lock_window_c, max_points, dpi: See FigureRenderer.
+    """
+    with FigureRenderer(
+        target_temp_c, lock_window_c, max_points, interactive=show, dpi=dpi
+    ) as renderer:
+        renderer.draw(
+            cycles, temps, detunes, crc_probs, heater_duties, workloads,
+            link=link, title=title,
+        )
+
+        # Save or show
+        if output_path is not None:
+            renderer.save(output_path)
+
+        if show:
+            import matplotlib.pyplot as plt
+
+            plt.show()
+
+
+def _result_panel_data(
+    result: "RunResult",
+    title: str | None,
+) -> tuple[np.ndarray, tuple | None, str]:
+    """
+    Extract plot columns, link arrays and the figure title from a RunResult.
+
+    Raises:
+        ValueError: If the result has no timeseries data.
+    """
+    if not result.timeseries:
+        raise ValueError("No timeseries data in result")
+
+    columns = _timeseries_columns(result.timeseries, attrgetter(*_TS_PLOT_FIELDS))
+
+    link = None
+    if result.link_states:
+        link = _link_columns(result.link_states, attrgetter(*_LINK_PLOT_FIELDS))
+
+    if not title:
+        scenario = result.metrics.scenario_name
+        total_cycles = result.metrics.total_cycles
+        title = f"ThermalRes Simulation: {scenario} ({total_cycles} cycles)"
+
+    return columns, link, title
 
 
 def plot_simulation_results(
@@ -34,6 +575,8 @@ def plot_simulation_results(
     title: str | None = None,
     target_temp_c: float | None = None,
     lock_window_c: float | None = None,
+    max_points: int | None = 5000,
+    dpi: int = 100,
 ) -> None:
     """
     Generate a multi-panel plot of simulation results.
@@ -54,6 +597,11 @@ def plot_simulation_results(
                        If provided, draws horizontal reference lines.
         lock_window_c: Temperature tolerance around target (±°C).
                        If provided with target_temp_c, draws upper/lower bounds.
+        max_points: Maximum points drawn per trace. Longer traces are
+                    MinMax-downsampled (link state by nearest neighbour).
+                    None draws every point.
+        dpi: Resolution of saved raster images. Lower it (e.g. 72) for
+             large batch sweeps.
 
     Raises:
         RuntimeError: If matplotlib is not installed.
@@ -63,166 +611,63 @@ def plot_simulation_results(
             "matplotlib not installed. Install with: pip install thermalres[plot]"
         )
 
-    import matplotlib.pyplot as plt
-
     # Extract data from timeseries
-    if not result.timeseries:
-        raise ValueError("No timeseries data in result")
-
-    cycles = [s.cycle for s in result.timeseries]
-    temps = [s.temp_c for s in result.timeseries]
-    detunes = [s.detune_nm for s in result.timeseries]
-    crc_probs = [s.crc_fail_prob for s in result.timeseries]
-    heater_duties = [s.heater_duty for s in result.timeseries]
-    workloads = [s.workload_frac for s in result.timeseries]
-
-    # Determine number of panels
-    has_link_states = result.link_states is not None and len(result.link_states) > 0
-    n_panels = 4 if has_link_states else 3
-
-    # Create figure
-    fig, axes = plt.subplots(n_panels, 1, figsize=(10, 2.5 * n_panels), sharex=True)
-    if n_panels == 1:
-        axes = [axes]
-
-    # Panel 1: Temperature
-    ax1 = axes[0]
-    ax1.plot(cycles, temps, "r-", linewidth=1.5, label="Temperature")
-
-    # Add target temperature reference lines if provided
-    if target_temp_c is not None and lock_window_c is not None:
-        upper_bound = target_temp_c + lock_window_c
-        lower_bound = target_temp_c - lock_window_c
-        ax1.axhline(y=upper_bound, color="black", linestyle=":", linewidth=1.5,
-                    label=f"Lock window ({lower_bound:.1f}-{upper_bound:.1f}°C)")
-        ax1.axhline(y=lower_bound, color="black", linestyle=":", linewidth=1.5)
-
-    ax1.set_ylabel("Temperature (°C)", color="r")
-    ax1.tick_params(axis="y", labelcolor="r")
-    ax1.grid(True, alpha=0.3)
-    ax1.legend(loc="upper left")
-
-    # Panel 2: Detuning and CRC probability
-    ax2 = axes[1]
-    color_detune = "tab:blue"
-    color_crc = "tab:orange"
-
-    ax2.plot(cycles, detunes, color=color_detune, linewidth=1.5, label="Detuning")
-    ax2.set_ylabel("Detuning (nm)", color=color_detune)
-    ax2.tick_params(axis="y", labelcolor=color_detune)
-
-    ax2_twin = ax2.twinx()
-    ax2_twin.plot(cycles, crc_probs, color=color_crc, linewidth=1.5,
-                  linestyle="--", label="CRC Fail Prob")
-    ax2_twin.set_ylabel("CRC Fail Probability", color=color_crc)
-    ax2_twin.tick_params(axis="y", labelcolor=color_crc)
-    ax2_twin.set_ylim(-0.05, 1.05)
-
-    ax2.grid(True, alpha=0.3)
-
-    # Combined legend
-    lines1, labels1 = ax2.get_legend_handles_labels()
-    lines2, labels2 = ax2_twin.get_legend_handles_labels()
-    ax2.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
-
-    # Panel 3: Heater duty and workload
-    ax3 = axes[2]
-    ax3.plot(cycles, heater_duties, "g-", linewidth=1.5, label="Heater Duty")
-    ax3.plot(cycles, workloads, "m--", linewidth=1.5, label="Workload")
-    ax3.set_ylabel("Duty Cycle / Fraction")
-    ax3.set_ylim(-0.05, 1.05)
-    ax3.grid(True, alpha=0.3)
-    ax3.legend(loc="upper left")
-
-    # Panel 4: Link state (if available)
-    if has_link_states:
-        ax4 = axes[3]
-        link_cycles = [s.cycle for s in result.link_states]
-        link_up = [1 if s.link_up else 0 for s in result.link_states]
-        consec_fails = [s.consec_fails for s in result.link_states]
-        consec_passes = [s.consec_passes for s in result.link_states]
-
-        # Link state as filled area
-        ax4.fill_between(link_cycles, link_up, alpha=0.3, color="green",
-                         step="post", label="Link UP")
-        ax4.step(link_cycles, link_up, where="post", color="green", linewidth=2)
-
-        # Consecutive counters on secondary axis
-        ax4_twin = ax4.twinx()
-        ax4_twin.plot(link_cycles, consec_fails, "r-", linewidth=1,
-                      alpha=0.7, label="Consec Fails")
-        ax4_twin.plot(link_cycles, consec_passes, "b-", linewidth=1,
-                      alpha=0.7, label="Consec Passes")
-        ax4_twin.set_ylabel("Consecutive Count")
-
-        ax4.set_ylabel("Link State")
-        ax4.set_yticks([0, 1])
-        ax4.set_yticklabels(["DOWN", "UP"])
-        ax4.set_ylim(-0.1, 1.1)
-        ax4.grid(True, alpha=0.3)
-
-        # Combined legend
-        lines1, labels1 = ax4.get_legend_handles_labels()
-        lines2, labels2 = ax4_twin.get_legend_handles_labels()
-        ax4.legend(lines1 + lines2, labels1 + labels2, loc="upper right")
-
-        ax4.set_xlabel("Cycle")
-    else:
-        ax3.set_xlabel("Cycle")
+    columns, link, title = _result_panel_data(result, title)
 
-    # Title
-    if title:
-        fig.suptitle(title, fontsize=14, fontweight="bold")
-    else:
-        scenario = result.metrics.scenario_name
-        total_cycles = result.metrics.total_cycles
-        fig.suptitle(f"ThermalRes Simulation: {scenario} ({total_cycles} cycles)",
-                     fontsize=14, fontweight="bold")
-
-    plt.tight_layout()
-
-    # Save or show
     if output_path:
         output_path = Path(output_path)
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
-        print(f"Plot saved to: {output_path}")
     elif not show:
-        plt.savefig("simulation_plot.png", dpi=150, bbox_inches="tight")
-        print("Plot saved to: simulation_plot.png")
-
-    if show:
-        plt.show()
+        output_path = Path("simulation_plot.png")
+    else:
+        output_path = None
 
-    plt.close(fig)
+    _render_panels(
+        *columns,
+        link=link,
+        title=title,
+        output_path=output_path,
+        show=show,
+        target_temp_c=target_temp_c,
+        lock_window_c=lock_window_c,
+        max_points=max_points,
+        dpi=dpi,
+    )
 
 
 def plot_from_artifacts(
     artifact_dir: Path | str,
     output_path: Path | str | None = None,
     show: bool = False,
+    max_points: int | None = 5000,
+    dpi: int = 100,
 ) -> None:
     """
     Generate a plot from artifact files on disk.
 
-    Loads timeseries.json and optionally link_state.json from the artifact
-    directory and generates a visualization.
+    Loads timeseries.npz (or timeseries.json for runs without it) and
+    optionally link_state.json from the artifact directory and generates
+    a visualization.
 
     Args:
         artifact_dir: Path to the artifact directory containing JSON files.
         output_path: Path to save the figure. If None, saves to artifact_dir/plot.png.
         show: If True, display the plot interactively.
+        max_points: Maximum points drawn per trace. Longer traces are
+                    MinMax-downsampled (link state by nearest neighbour).
+                    None draws every point.
+        dpi: Resolution of saved raster images. Lower it (e.g. 72) for
+             large batch sweeps.
 
     Raises:
         RuntimeError: If matplotlib is not installed.
         FileNotFoundError: If required artifact files are missing.
+        ValueError: If the timeseries file that was read holds no samples.
     """
     if not check_matplotlib_available():
         raise RuntimeError(
             "matplotlib not installed. Install with: pip install thermalres[plot]"
         )
 
-    import matplotlib.pyplot as plt
-
     artifact_dir = Path(artifact_dir)
 
     # Load metrics
@@ -233,122 +678,37 @@ def plot_from_artifacts(
     with metrics_path.open() as f:
         metrics_data = json.load(f)
 
-    # Load timeseries
+    # Load timeseries, preferring the NumPy columns written alongside the JSON
+    npz_path = artifact_dir / "timeseries.npz"
     timeseries_path = artifact_dir / "timeseries.json"
-    if not timeseries_path.exists():
+    if npz_path.exists():
+        source_path = npz_path
+        with np.load(npz_path) as data:
+            columns = np.stack([data[name] for name in _TS_PLOT_FIELDS]).astype(
+                np.float64
+            )
+    elif timeseries_path.exists():
+        source_path = timeseries_path
+        columns = _load_timeseries_columns(timeseries_path)
+    else:
         raise FileNotFoundError(f"timeseries.json not found in {artifact_dir}")
-
-    with timeseries_path.open() as f:
-        timeseries_data = json.load(f)
-
-    samples = timeseries_data.get("samples", [])
-    if not samples:
-        raise ValueError("No samples in timeseries.json")
-
-    # Extract data
-    cycles = [s["cycle"] for s in samples]
-    temps = [s["temp_c"] for s in samples]
-    detunes = [s["detune_nm"] for s in samples]
-    crc_probs = [s["crc_fail_prob"] for s in samples]
-    heater_duties = [s["heater_duty"] for s in samples]
-    workloads = [s["workload_frac"] for s in samples]
+    if columns.shape[1] == 0:
+        raise ValueError(f"No samples in {source_path.name}")
 
     # Try to load link state
     link_state_path = artifact_dir / "link_state.json"
-    link_states = None
+    link = None
     if link_state_path.exists():
         with link_state_path.open() as f:
             link_data = json.load(f)
         link_states = link_data.get("samples", [])
-
-    has_link_states = link_states is not None and len(link_states) > 0
-    n_panels = 4 if has_link_states else 3
-
-    # Create figure
-    fig, axes = plt.subplots(n_panels, 1, figsize=(10, 2.5 * n_panels), sharex=True)
-    if n_panels == 1:
-        axes = [axes]
-
-    # Panel 1: Temperature
-    ax1 = axes[0]
-    ax1.plot(cycles, temps, "r-", linewidth=1.5, label="Temperature")
-    ax1.set_ylabel("Temperature (°C)", color="r")
-    ax1.tick_params(axis="y", labelcolor="r")
-    ax1.grid(True, alpha=0.3)
-    ax1.legend(loc="upper left")
-
-    # Panel 2: Detuning and CRC probability
-    ax2 = axes[1]
-    color_detune = "tab:blue"
-    color_crc = "tab:orange"
-
-    ax2.plot(cycles, detunes, color=color_detune, linewidth=1.5, label="Detuning")
-    ax2.set_ylabel("Detuning (nm)", color=color_detune)
-    ax2.tick_params(axis="y", labelcolor=color_detune)
-
-    ax2_twin = ax2.twinx()
-    ax2_twin.plot(cycles, crc_probs, color=color_crc, linewidth=1.5,
-                  linestyle="--", label="CRC Fail Prob")
-    ax2_twin.set_ylabel("CRC Fail Probability", color=color_crc)
-    ax2_twin.tick_params(axis="y", labelcolor=color_crc)
-    ax2_twin.set_ylim(-0.05, 1.05)
-
-    ax2.grid(True, alpha=0.3)
-
-    lines1, labels1 = ax2.get_legend_handles_labels()
-    lines2, labels2 = ax2_twin.get_legend_handles_labels()
-    ax2.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
-
-    # Panel 3: Heater duty and workload
-    ax3 = axes[2]
-    ax3.plot(cycles, heater_duties, "g-", linewidth=1.5, label="Heater Duty")
-    ax3.plot(cycles, workloads, "m--", linewidth=1.5, label="Workload")
-    ax3.set_ylabel("Duty Cycle / Fraction")
-    ax3.set_ylim(-0.05, 1.05)
-    ax3.grid(True, alpha=0.3)
-    ax3.legend(loc="upper left")
-
-    # Panel 4: Link state (if available)
-    if has_link_states:
-        ax4 = axes[3]
-        link_cycles = [s["cycle"] for s in link_states]
-        link_up = [1 if s["link_up"] else 0 for s in link_states]
-        consec_fails = [s["consec_fails"] for s in link_states]
-        consec_passes = [s["consec_passes"] for s in link_states]
-
-        ax4.fill_between(link_cycles, link_up, alpha=0.3, color="green",
-                         step="post", label="Link UP")
-        ax4.step(link_cycles, link_up, where="post", color="green", linewidth=2)
-
-        ax4_twin = ax4.twinx()
-        ax4_twin.plot(link_cycles, consec_fails, "r-", linewidth=1,
-                      alpha=0.7, label="Consec Fails")
-        ax4_twin.plot(link_cycles, consec_passes, "b-", linewidth=1,
-                      alpha=0.7, label="Consec Passes")
-        ax4_twin.set_ylabel("Consecutive Count")
-
-        ax4.set_ylabel("Link State")
-        ax4.set_yticks([0, 1])
-        ax4.set_yticklabels(["DOWN", "UP"])
-        ax4.set_ylim(-0.1, 1.1)
-        ax4.grid(True, alpha=0.3)
-
-        lines1, labels1 = ax4.get_legend_handles_labels()
-        lines2, labels2 = ax4_twin.get_legend_handles_labels()
-        ax4.legend(lines1 + lines2, labels1 + labels2, loc="upper right")
-
-        ax4.set_xlabel("Cycle")
-    else:
-        ax3.set_xlabel("Cycle")
+        if link_states:
+            link = _link_columns(link_states, itemgetter(*_LINK_PLOT_FIELDS))
 
     # Title from metrics
     run_info = metrics_data.get("run", {})
     scenario = run_info.get("scenario_name", "unknown")
-    total_cycles = run_info.get("total_cycles", len(cycles))
-    fig.suptitle(f"ThermalRes Simulation: {scenario} ({total_cycles} cycles)",
-                 fontsize=14, fontweight="bold")
-
-    plt.tight_layout()
+    total_cycles = run_info.get("total_cycles", columns.shape[1])
 
     # Determine output path
     if output_path is None:
@@ -356,10 +716,12 @@ def plot_from_artifacts(
     else:
         output_path = Path(output_path)
 
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
-    print(f"Plot saved to: {output_path}")
-
-    if show:
-        plt.show()
-
-    plt.close(fig)
+    _render_panels(
+        *columns,
+        link=link,
+        title=f"ThermalRes Simulation: {scenario} ({total_cycles} cycles)",
+        output_path=output_path,
+        show=show,
+        max_points=max_points,
+        dpi=dpi,
+    )
@@ -4,6 +4,12 @@ Digital link monitoring models.
 Python reference implementations of RTL digital logic.
 """
 
+from .bitstream import run_link_monitor_bitstream
 from .reference import LinkMonitorRef, LinkMonitorParams, LinkMonitorState
 
-__all__ = ["LinkMonitorRef", "LinkMonitorParams", "LinkMonitorState"]
+__all__ = [
+    "LinkMonitorRef",
+    "LinkMonitorParams",
+    "LinkMonitorState",
+    "run_link_monitor_bitstream",
+]
@@ -0,0 +1,76 @@
+"""
+Batched link monitor kernel.
+
+Restates LinkMonitorRef.step() as a loop over frame arrays so a whole
+stream is processed in one call, compiled with Numba when it is installed
+(see thermalres._numba). State travels as an int64 vector in
+LINK_STATE_FIELDS order.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from thermalres._numba import njit
+
+# Order of the state vector and of the output columns
+LINK_STATE_FIELDS = (
+    "link_up",
+    "total_frames",
+    "total_crc_fails",
+    "consec_fails",
+    "consec_passes",
+)
+
+
+@njit(cache=True)
+def link_monitor_batch(valid, crc_fail, state, fails_to_down, passes_to_up):
+    """
+    Run the link monitor over frame arrays.
+
+    Args:
+        valid: bool array, frame present per cycle.
+        crc_fail: bool array, CRC failure per cycle.
+        state: int64[5] state vector; updated in place to the final state.
+        fails_to_down: Consecutive fails to bring the link down.
+        passes_to_up: Consecutive passes to bring the link up.
+
+    Returns:
+        int64 array of shape (5, n): the state after each cycle.
+    """
+    n = valid.shape[0]
+    out = np.empty((5, n), dtype=np.int64)
+
+    link_up = state[0]
+    total_frames = state[1]
+    total_crc_fails = state[2]
+    consec_fails = state[3]
+    consec_passes = state[4]
+
+    for i in range(n):
+        if valid[i]:
+            total_frames += 1
+            if crc_fail[i]:
+                total_crc_fails += 1
+                consec_fails += 1
+                consec_passes = 0
+                if link_up and consec_fails >= fails_to_down:
+                    link_up = 0
+            else:
+                consec_passes += 1
+                consec_fails = 0
+                if not link_up and consec_passes >= passes_to_up:
+                    link_up = 1
+
+        out[0, i] = link_up
+        out[1, i] = total_frames
+        out[2, i] = total_crc_fails
+        out[3, i] = consec_fails
+        out[4, i] = consec_passes
+
+    state[0] = link_up
+    state[1] = total_frames
+    state[2] = total_crc_fails
+    state[3] = consec_fails
+    state[4] = consec_passes
+    return out
@@ -0,0 +1,131 @@
+"""
+Run-length evaluation of the link monitor over a crc_fail bit stream.
+
+LinkMonitorRef.step() walks the state machine one frame at a time. When the
+whole crc_fail stream is known up front (e.g. post-run analysis of recorded
+CrcEvents), the same outputs can be derived without a per-cycle loop:
+
+- total_crc_fails is a running count (cumsum) of the stream
+- consec_fails / consec_passes only depend on the position inside the
+  current run of equal bits
+- link_up only changes at the end of a run long enough to cross its
+  threshold, so it is a forward-fill over "decisive" runs
+
+Counters are emitted only at the requested sample indices, so callers that
+need the final state (or a sparse subset) never materialize a per-cycle
+history. Every frame is treated as valid, matching LinkRunner.
+
+Example usage:
+    >>> import numpy as np
+    >>> from thermalres.digital.bitstream import run_link_monitor_bitstream
+    >>> fails = np.array([1, 1, 1, 1, 0, 0], dtype=bool)
+    >>> cols = run_link_monitor_bitstream(fails, sample_idx=[3, 5])
+    >>> cols["link_up"].tolist()
+    [False, False]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .reference import LinkMonitorParams
+
+if TYPE_CHECKING:
+    from thermalres.cosim.interfaces import LinkStateColumns
+
+
+def run_link_monitor_bitstream(
+    crc_fails: np.ndarray | Sequence[bool],
+    params: LinkMonitorParams | None = None,
+    sample_idx: np.ndarray | Sequence[int] | None = None,
+) -> LinkStateColumns:
+    """
+    Evaluate the link monitor from reset over a whole crc_fail stream.
+
+    Produces the same values LinkMonitorRef would report after processing
+    frame i (with valid=True on every frame), but only for the requested
+    sample indices.
+
+    Args:
+        crc_fails: One CRC failure flag per frame.
+        params: Link monitor thresholds. Uses default LinkMonitorParams()
+                if None.
+        sample_idx: Frame indices to report state after. Defaults to every
+                    frame, which reproduces the full per-cycle history.
+
+    Returns:
+        LinkStateColumns with one entry per sample index.
+
+    Raises:
+        IndexError: If a sample index is outside [0, len(crc_fails)).
+    """
+    params = params or LinkMonitorParams()
+    bits = np.asarray(crc_fails, dtype=np.bool_)
+    n = bits.shape[0]
+
+    if sample_idx is None:
+        idx = np.arange(n, dtype=np.int64)
+    else:
+        idx = np.asarray(sample_idx, dtype=np.int64)
+        if idx.size and (idx.min() < 0 or idx.max() >= n):
+            raise IndexError(f"sample_idx out of range for {n} frames")
+
+    if idx.size == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return {
+            "link_up": np.zeros(0, dtype=np.bool_),
+            "total_frames": empty,
+            "total_crc_fails": empty.copy(),
+            "consec_fails": empty.copy(),
+            "consec_passes": empty.copy(),
+        }
+
+    # ─────────────────────────────────────────────────────────────
+    # Split the stream into runs of equal bits
+    # ─────────────────────────────────────────────────────────────
+    starts = np.flatnonzero(np.concatenate(([True], bits[1:] != bits[:-1])))
+    lengths = np.diff(np.append(starts, n))
+    run_fail = bits[starts]
+
+    # ─────────────────────────────────────────────────────────────
+    # Link state at the start of each run
+    # ─────────────────────────────────────────────────────────────
+    # A run is decisive if it is long enough to cross its threshold from
+    # the opposite state; its outcome then holds until the next decisive
+    # run. Runs alternate, and consec counters start at zero after reset,
+    # so each run's streak starts from zero as well.
+    threshold = np.where(run_fail, params.fails_to_down, params.passes_to_up)
+    decisive = lengths >= threshold
+    last_decisive = np.maximum.accumulate(
+        np.where(decisive, np.arange(starts.size), -1)
+    )
+    # Link is up after run r unless the last decisive run was a fail run
+    up_after = (last_decisive < 0) | ~run_fail[np.maximum(last_decisive, 0)]
+    up_before = np.concatenate(([True], up_after[:-1]))
+
+    # ─────────────────────────────────────────────────────────────
+    # Evaluate counters at the requested indices
+    # ─────────────────────────────────────────────────────────────
+    run = np.searchsorted(starts, idx, side="right") - 1
+    streak = idx - starts[run] + 1
+    is_fail = run_fail[run]
+    was_up = up_before[run]
+
+    # Within a run the link can only flip once, when the streak reaches
+    # the threshold for the state it started in
+    link_up = np.where(
+        is_fail,
+        was_up & (streak < params.fails_to_down),
+        was_up | (streak >= params.passes_to_up),
+    )
+
+    return {
+        "link_up": link_up,
+        "total_frames": idx + 1,
+        "total_crc_fails": np.cumsum(bits, dtype=np.int64)[idx],
+        "consec_fails": np.where(is_fail, streak, 0),
+        "consec_passes": np.where(is_fail, 0, streak),
+    }
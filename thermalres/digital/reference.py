@@ -26,17 +26,20 @@ Example usage:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 # Import LinkStateSample for the get_sample method
 # This creates a circular import risk, so we use TYPE_CHECKING
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
-    from thermalres.cosim.interfaces import LinkStateSample
+    from thermalres.cosim.interfaces import LinkStateColumns, LinkStateSample
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkMonitorParams:
     """
     Parameters for the link monitor state machine.
@@ -64,7 +67,7 @@ class LinkMonitorParams:
     passes_to_up: int = 8   # Consecutive passes to trigger link up
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkMonitorState:
     """
     Link monitor internal state.
@@ -211,46 +214,105 @@ class LinkMonitorRef:
         # Frame is valid - update counters and check for state transitions
         # ─────────────────────────────────────────────────────────────
 
+        # Bind locals once; each self.state.x would be two attribute loads
+        state = self.state
+        params = self.params
+
         # Always increment total frame counter
-        self.state.total_frames += 1
+        state.total_frames += 1
 
         if crc_fail:
             # ─────────────────────────────────────────────────────────
             # CRC FAILURE PATH
             # ─────────────────────────────────────────────────────────
             # Increment failure counters, reset pass streak
-            self.state.total_crc_fails += 1
-            self.state.consec_fails += 1
-            self.state.consec_passes = 0  # Reset consecutive pass counter
+            state.total_crc_fails += 1
+            state.consec_fails += 1
+            state.consec_passes = 0  # Reset consecutive pass counter
 
             # Check if we should transition to link DOWN
             # Only transition if currently UP and threshold reached
             # With fails_to_down=4, the 4th consecutive failure triggers
             # the transition (consec_fails will be 4 after increment).
-            if (
-                self.state.link_up
-                and self.state.consec_fails >= self.params.fails_to_down
-            ):
-                self.state.link_up = False
+            if state.link_up and state.consec_fails >= params.fails_to_down:
+                state.link_up = False
         else:
             # ─────────────────────────────────────────────────────────
             # CRC PASS PATH
             # ─────────────────────────────────────────────────────────
             # Increment pass counter, reset failure streak
-            self.state.consec_passes += 1
-            self.state.consec_fails = 0  # Reset consecutive fail counter
+            state.consec_passes += 1
+            state.consec_fails = 0  # Reset consecutive fail counter
 
             # Check if we should transition to link UP
             # Only transition if currently DOWN and threshold reached
             # With passes_to_up=8, the 8th consecutive pass triggers
             # the transition (consec_passes will be 8 after increment).
-            if (
-                not self.state.link_up
-                and self.state.consec_passes >= self.params.passes_to_up
-            ):
-                self.state.link_up = True
+            if not state.link_up and state.consec_passes >= params.passes_to_up:
+                state.link_up = True
 
-        return self.state
+        return state
+
+    def run_batch(
+        self,
+        valid: np.ndarray | Sequence[bool],
+        crc_fail: np.ndarray | Sequence[bool],
+    ) -> LinkStateColumns:
+        """
+        Step the link monitor over whole frame arrays in one call.
+
+        Equivalent to calling step(valid[i], crc_fail[i]) for every i,
+        but the loop runs in a compiled kernel (Numba, when installed)
+        instead of per-cycle Python. The internal state is left at the
+        final values, so batches can be chained with each other and with
+        step().
+
+        Args:
+            valid: Frame present flag per cycle.
+            crc_fail: CRC failure flag per cycle.
+
+        Returns:
+            LinkStateColumns holding the state after each cycle.
+
+        Raises:
+            ValueError: If valid and crc_fail differ in length.
+        """
+        from ._jit import LINK_STATE_FIELDS, link_monitor_batch
+
+        valid = np.ascontiguousarray(valid, dtype=np.bool_)
+        crc_fail = np.ascontiguousarray(crc_fail, dtype=np.bool_)
+        if valid.shape != crc_fail.shape:
+            raise ValueError(
+                f"valid and crc_fail length mismatch: "
+                f"{valid.shape[0]} != {crc_fail.shape[0]}"
+            )
+
+        state = np.array(
+            [getattr(self.state, f) for f in LINK_STATE_FIELDS], dtype=np.int64
+        )
+        out = link_monitor_batch(
+            valid,
+            crc_fail,
+            state,
+            self.params.fails_to_down,
+            self.params.passes_to_up,
+        )
+
+        self.state = LinkMonitorState(
+            link_up=bool(state[0]),
+            total_frames=int(state[1]),
+            total_crc_fails=int(state[2]),
+            consec_fails=int(state[3]),
+            consec_passes=int(state[4]),
+        )
+
+        return {
+            "link_up": out[0].astype(np.bool_),
+            "total_frames": out[1],
+            "total_crc_fails": out[2],
+            "consec_fails": out[3],
+            "consec_passes": out[4],
+        }
 
     def get_state(self) -> LinkMonitorState:
         """
@@ -1,19 +1,51 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from thermalres.cosim.interfaces import PlantInputs, PlantOutputs
-from thermalres.plant.impairment import ImpairmentParams, eval_impairment
-from thermalres.plant.resonator import ResonatorParams, eval_resonator
-from thermalres.plant.thermal import ThermalParams, ThermalState, step_thermal
+from thermalres.plant.impairment import (
+    ImpairmentLUT,
+    ImpairmentParams,
+    eval_impairment,
+    eval_impairment_batch,
+    eval_impairment_fast,
+    eval_impairment_lut,
+)
+from thermalres.plant.resonator import (
+    ResonatorParams,
+    eval_resonator,
+    eval_resonator_batch,
+    eval_resonator_fast,
+)
+from thermalres.plant.thermal import (
+    ThermalParams,
+    ThermalState,
+    step_thermal,
+    step_thermal_fast,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from thermalres.cosim.interfaces import PlantOutputsSoA
 
 __all__ = [
     "ThermalParams",
     "ThermalState",
     "ResonatorParams",
     "ImpairmentParams",
+    "ImpairmentLUT",
     "step_thermal",
+    "step_thermal_fast",
     "eval_resonator",
+    "eval_resonator_fast",
+    "eval_resonator_batch",
     "eval_impairment",
+    "eval_impairment_fast",
+    "eval_impairment_batch",
+    "eval_impairment_lut",
     "eval_plant_chain",
+    "run_plant_trace",
 ]
 
 
@@ -73,3 +105,56 @@ def eval_plant_chain(
     )
 
     return new_thermal_state, plant_outputs
+
+
+def run_plant_trace(
+    heater_duty: np.ndarray,
+    workload_frac: np.ndarray,
+    dt_s: np.ndarray | float,
+    thermal_params: ThermalParams,
+    resonator_params: ResonatorParams,
+    impairment_params: ImpairmentParams,
+    initial_temp_c: float,
+) -> PlantOutputsSoA:
+    """
+    Evaluate the plant chain over a whole input trace.
+
+    Convenience wrapper around thermalres.plant.fused.run_plant_batch for
+    callers that have input arrays rather than a PlantRunner: the trace is
+    stepped in one compiled loop (Numba, when installed) that writes into
+    preallocated output arrays, with no per-step PlantInputs/PlantOutputs.
+
+    Args:
+        heater_duty: Heater duty per step, shape (n,)
+        workload_frac: Workload fraction per step, shape (n,)
+        dt_s: Timestep (seconds), either per step with shape (n,) or a
+              scalar used for every step
+        thermal_params: Thermal model parameters
+        resonator_params: Resonator model parameters
+        impairment_params: Impairment model parameters
+        initial_temp_c: Temperature before the first step (°C)
+
+    Returns:
+        PlantOutputsSoA with one entry per step
+
+    Raises:
+        ValueError: If the input arrays are not 1-D and of equal length
+    """
+    import numpy as np
+
+    # Imported here so importing thermalres.plant does not load Numba
+    from thermalres.plant.fused import run_plant_batch
+
+    if np.ndim(dt_s) == 0:
+        dt_s = np.full(np.shape(heater_duty), dt_s, dtype=np.float64)
+
+    _, out = run_plant_batch(
+        ThermalState(temp_c=initial_temp_c),
+        heater_duty,
+        workload_frac,
+        dt_s,
+        thermal_params,
+        resonator_params,
+        impairment_params,
+    )
+    return out
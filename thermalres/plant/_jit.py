@@ -0,0 +1,219 @@
+"""
+Scalar plant kernels for batched evaluation.
+
+The per-cycle plant chain (step_thermal -> eval_resonator -> eval_impairment)
+is restated here on plain floats so it can be compiled with Numba. Parameter
+dataclasses are packed into flat float tuples (see the pack_* helpers) so
+the jit signature is stable and no dataclass unboxing happens in the loop.
+The packed tuples carry the reciprocals precomputed on the parameter
+dataclasses, so the kernels multiply where the model divides, exactly as
+the pure-Python functions do.
+
+The kernels are deliberately compiled without fastmath: it would let LLVM
+reassociate and contract (FMA) the arithmetic, so results would differ
+from the pure-Python chain in the last bits depending on whether Numba is
+installed. Without it the kernels perform the same IEEE-754 operations in
+the same order and give bit-identical results; the loops are sequential
+recurrences, so fastmath bought no measurable speed.
+
+Numba is optional (pip install thermalres[jit]). Without it the kernels run
+as ordinary Python and produce the same results, only slower.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from thermalres._numba import NUMBA_AVAILABLE, njit, prange  # noqa: F401
+from thermalres.plant.impairment import ImpairmentParams
+from thermalres.plant.resonator import ResonatorParams
+from thermalres.plant.thermal import ThermalParams
+
+
+def pack_thermal_params(p: ThermalParams) -> tuple[float, float, float, float, float]:
+    """Pack ThermalParams as (ambient_c, r_th, inv_rc, heater_w_max, workload_w_max)."""
+    return (
+        float(p.ambient_c),
+        float(p.r_th_c_per_w),
+        float(p._inv_rc),
+        float(p.heater_w_max),
+        float(p.workload_w_max),
+    )
+
+
+def pack_resonator_params(
+    p: ResonatorParams,
+) -> tuple[float, float, float, float, float]:
+    """Pack ResonatorParams as (lambda0, thermo_optic, lock_window, target, ambient)."""
+    return (
+        float(p.lambda0_nm),
+        float(p.thermo_optic_nm_per_c),
+        float(p.lock_window_nm),
+        float(p.target_lambda_nm),
+        float(p.ambient_c),
+    )
+
+
+def pack_impairment_params(
+    p: ImpairmentParams,
+) -> tuple[float, float, float, float, float, float, float]:
+    """Pack ImpairmentParams as (floor, ceil, inv_range, x_50, inv_lo, mid, inv_hi)."""
+    return (
+        float(p.detune_floor_nm),
+        float(p.detune_ceil_nm),
+        float(p._inv_range),
+        float(p._x_50),
+        float(p._inv_lo),
+        float(p._mid),
+        float(p._inv_hi),
+    )
+
+
+@njit(cache=True)
+def thermal_kernel(temp_c, heater_duty, workload_frac, dt_s, thermal_p):
+    """Scalar step_thermal: returns the temperature after one Euler step."""
+    ambient_c, r_th, inv_rc, heater_w_max, workload_w_max = thermal_p
+
+    heater_duty = max(0.0, min(1.0, heater_duty))
+    workload_frac = max(0.0, min(1.0, workload_frac))
+    p_in = heater_duty * heater_w_max + workload_frac * workload_w_max
+
+    # dT/dt = (P_in * R_th - (T - T_amb)) / (R_th * C_th), with the division
+    # folded into inv_rc; the update is a multiply-add on temp_c
+    return temp_c + dt_s * ((p_in * r_th - (temp_c - ambient_c)) * inv_rc)
+
+
+@njit(cache=True)
+def impairment_kernel(detune_nm, locked, imp_p):
+    """Scalar eval_impairment: returns crc_fail_prob."""
+    floor, ceil, inv_range, x_50, inv_lo, mid, inv_hi = imp_p
+
+    if not locked:
+        return 1.0
+
+    abs_detune = abs(detune_nm)
+    if abs_detune <= floor:
+        return 0.0
+    if abs_detune >= ceil:
+        return 1.0
+
+    x = max(0.0, min(1.0, (abs_detune - floor) * inv_range))
+
+    # Piecewise rescale so detune_50 maps to 0.5 (see eval_impairment)
+    if x <= x_50:
+        x_norm = x * inv_lo
+    else:
+        x_norm = mid + (x - x_50) * inv_hi
+
+    s = x_norm * x_norm * (3.0 - 2.0 * x_norm)
+    return max(0.0, min(1.0, s))
+
+
+# Eager signature for plant_kernel: compiled (or loaded from the on-disk
+# cache) when this module is imported, so the first per-cycle call from
+# PlantRunner.step does not pay for compilation
+PLANT_KERNEL_SIG = (
+    "Tuple((float64, float64, float64, boolean, float64))("
+    "float64, float64, float64, float64, "
+    "UniTuple(float64, 5), UniTuple(float64, 5), UniTuple(float64, 7))"
+)
+
+
+@njit(PLANT_KERNEL_SIG, cache=True)
+def plant_kernel(temp_c, heater_duty, workload_frac, dt_s, thermal_p, res_p, imp_p):
+    """
+    One step of the plant chain on scalars.
+
+    Returns:
+        (temp_c, resonance_nm, detune_nm, locked, crc_fail_prob) after the step
+    """
+    lambda0_nm, thermo_optic, lock_window_nm, target_nm, res_ambient_c = res_p
+
+    # Thermal: Euler step of the first-order RC model
+    temp_next = thermal_kernel(temp_c, heater_duty, workload_frac, dt_s, thermal_p)
+
+    # Resonator: thermo-optic shift and lock check
+    resonance_nm = lambda0_nm + thermo_optic * (temp_next - res_ambient_c)
+    detune_nm = target_nm - resonance_nm
+    locked = abs(detune_nm) <= lock_window_nm
+
+    crc_fail_prob = impairment_kernel(detune_nm, locked, imp_p)
+
+    return temp_next, resonance_nm, detune_nm, locked, crc_fail_prob
+
+
+@njit(cache=True)
+def plant_batch(
+    temp_c,
+    heater_duty,
+    workload_frac,
+    dt_s,
+    thermal_p,
+    res_p,
+    imp_p,
+    out_temp,
+    out_resonance,
+    out_detune,
+    out_locked,
+    out_crc,
+):
+    """
+    Run plant_kernel over input arrays, writing into preallocated outputs.
+
+    Returns:
+        Final temperature (°C) after the last step.
+    """
+    for i in range(heater_duty.shape[0]):
+        temp_c, resonance_nm, detune_nm, locked, crc_fail_prob = plant_kernel(
+            temp_c, heater_duty[i], workload_frac[i], dt_s[i], thermal_p, res_p, imp_p
+        )
+        out_temp[i] = temp_c
+        out_resonance[i] = resonance_nm
+        out_detune[i] = detune_nm
+        out_locked[i] = locked
+        out_crc[i] = crc_fail_prob
+    return temp_c
+
+
+@njit(parallel=True, cache=True)
+def plant_sweep(
+    temp_c,
+    heater_duty,
+    workload_frac,
+    dt_s,
+    thermal_p,
+    res_p,
+    imp_p,
+    out_temp,
+    out_resonance,
+    out_detune,
+    out_locked,
+    out_crc,
+):
+    """
+    Run plant_batch over independent scenarios, one per row, in parallel.
+
+    Rows of the 2-D input/output arrays are scenarios; temp_c holds each
+    scenario's initial temperature and is overwritten with its final one.
+    Scenarios share no state, so the outer loop is a prange.
+    """
+    for s in prange(heater_duty.shape[0]):
+        temp_c[s] = plant_batch(
+            temp_c[s],
+            heater_duty[s],
+            workload_frac[s],
+            dt_s[s],
+            thermal_p,
+            res_p,
+            imp_p,
+            out_temp[s],
+            out_resonance[s],
+            out_detune[s],
+            out_locked[s],
+            out_crc[s],
+        )
+
+
+def as_f64(values) -> np.ndarray:
+    """Return values as a contiguous float64 array (no copy if already one)."""
+    return np.ascontiguousarray(values, dtype=np.float64)
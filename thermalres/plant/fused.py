@@ -0,0 +1,168 @@
+"""
+Fused plant chain over a batch of timesteps.
+
+Batched counterpart of eval_plant_chain: step_thermal, eval_resonator and
+eval_impairment are fused into one compiled loop (see thermalres.plant._jit)
+that writes struct-of-arrays outputs, so no per-step dataclasses or Python
+calls are made inside the loop.
+
+This module imports the kernels (and Numba, when installed) on import, so
+it is not re-exported from thermalres.plant; import it where batches are
+actually run.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from thermalres.cosim.interfaces import PlantOutputsSoA
+from thermalres.plant._jit import (
+    as_f64,
+    pack_impairment_params,
+    pack_resonator_params,
+    pack_thermal_params,
+    plant_batch,
+    plant_sweep,
+)
+from thermalres.plant.impairment import ImpairmentParams
+from thermalres.plant.resonator import ResonatorParams
+from thermalres.plant.thermal import ThermalParams, ThermalState
+
+
+def run_plant_batch(
+    thermal_state: ThermalState,
+    heater_duty: np.ndarray,
+    workload_frac: np.ndarray,
+    dt_s: np.ndarray,
+    thermal_params: ThermalParams,
+    resonator_params: ResonatorParams,
+    impairment_params: ImpairmentParams,
+) -> tuple[ThermalState, PlantOutputsSoA]:
+    """
+    Evaluate the plant chain over a batch of timesteps.
+
+    Equivalent to calling eval_plant_chain once per element, feeding each
+    step's thermal state into the next.
+
+    Args:
+        thermal_state: Thermal state before the first step
+        heater_duty: Heater duty per step, shape (n,)
+        workload_frac: Workload fraction per step, shape (n,)
+        dt_s: Timestep per step (seconds), shape (n,)
+        thermal_params: Thermal model parameters
+        resonator_params: Resonator model parameters
+        impairment_params: Impairment model parameters
+
+    Returns:
+        Tuple of (thermal state after the last step, PlantOutputsSoA with one
+        entry per step)
+
+    Raises:
+        ValueError: If the input arrays are not 1-D and of equal length
+    """
+    heater_duty = as_f64(heater_duty)
+    workload_frac = as_f64(workload_frac)
+    dt_s = as_f64(dt_s)
+    n = heater_duty.shape[0]
+    if heater_duty.ndim != 1 or workload_frac.shape != (n,) or dt_s.shape != (n,):
+        raise ValueError(
+            "heater_duty, workload_frac and dt_s must be 1-D arrays of equal length"
+        )
+
+    out = PlantOutputsSoA(
+        temp_c=np.empty(n, dtype=np.float64),
+        resonance_nm=np.empty(n, dtype=np.float64),
+        detune_nm=np.empty(n, dtype=np.float64),
+        locked=np.empty(n, dtype=np.bool_),
+        crc_fail_prob=np.empty(n, dtype=np.float64),
+    )
+    final_temp = plant_batch(
+        float(thermal_state.temp_c),
+        heater_duty,
+        workload_frac,
+        dt_s,
+        pack_thermal_params(thermal_params),
+        pack_resonator_params(resonator_params),
+        pack_impairment_params(impairment_params),
+        out.temp_c,
+        out.resonance_nm,
+        out.detune_nm,
+        out.locked,
+        out.crc_fail_prob,
+    )
+
+    return ThermalState(temp_c=float(final_temp)), out
+
+
+def run_plant_sweep(
+    heater_duty: np.ndarray,
+    workload_frac: np.ndarray,
+    dt_s: np.ndarray | float,
+    thermal_params: ThermalParams,
+    resonator_params: ResonatorParams,
+    impairment_params: ImpairmentParams,
+    initial_temp_c: np.ndarray | float,
+) -> tuple[np.ndarray, PlantOutputsSoA]:
+    """
+    Evaluate the plant chain for many independent scenarios at once.
+
+    Each row of the 2-D inputs is one scenario (e.g. one open-loop
+    schedule materialized with thermalres.scenarios.materialize) and is
+    stepped exactly like run_plant_batch. With Numba installed, scenarios
+    are spread across cores with prange; without it they run in turn.
+
+    Args:
+        heater_duty: Heater duty, shape (n_scenarios, n_steps)
+        workload_frac: Workload fraction, shape (n_scenarios, n_steps)
+        dt_s: Timestep (seconds), broadcast to (n_scenarios, n_steps)
+        thermal_params: Thermal model parameters
+        resonator_params: Resonator model parameters
+        impairment_params: Impairment model parameters
+        initial_temp_c: Initial temperature (°C), scalar or per scenario
+
+    Returns:
+        Tuple of (final temperature per scenario, PlantOutputsSoA whose
+        arrays have shape (n_scenarios, n_steps))
+
+    Raises:
+        ValueError: If heater_duty is not 2-D or the other inputs do not
+                    match its shape
+    """
+    heater_duty = as_f64(heater_duty)
+    if heater_duty.ndim != 2:
+        raise ValueError("heater_duty must be a 2-D (n_scenarios, n_steps) array")
+    shape = heater_duty.shape
+    workload_frac = as_f64(workload_frac)
+    if workload_frac.shape != shape:
+        raise ValueError("workload_frac must have the same shape as heater_duty")
+    try:
+        dt_s = as_f64(np.broadcast_to(dt_s, shape))
+        temp_c = np.array(np.broadcast_to(initial_temp_c, shape[:1]), dtype=np.float64)
+    except ValueError:
+        raise ValueError(
+            "dt_s and initial_temp_c must broadcast to the scenario/step shape"
+        ) from None
+
+    out = PlantOutputsSoA(
+        temp_c=np.empty(shape, dtype=np.float64),
+        resonance_nm=np.empty(shape, dtype=np.float64),
+        detune_nm=np.empty(shape, dtype=np.float64),
+        locked=np.empty(shape, dtype=np.bool_),
+        crc_fail_prob=np.empty(shape, dtype=np.float64),
+    )
+    plant_sweep(
+        temp_c,
+        heater_duty,
+        workload_frac,
+        dt_s,
+        pack_thermal_params(thermal_params),
+        pack_resonator_params(resonator_params),
+        pack_impairment_params(impairment_params),
+        out.temp_c,
+        out.resonance_nm,
+        out.detune_nm,
+        out.locked,
+        out.crc_fail_prob,
+    )
+
+    return temp_c, out
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import numpy as np
 
 
 @dataclass(frozen=True, slots=True)
@@ -10,11 +13,44 @@ class ImpairmentParams:
 
     Maps detuning magnitude to CRC failure probability using a smooth curve.
     When not locked, the failure probability is always 1.0.
+
+    The normalization constants used by eval_impairment depend only on
+    these parameters, so they are derived once in __post_init__ rather
+    than on every evaluation.
     """
     detune_50_nm: float        # Detuning magnitude where p_fail ≈ 0.5
     detune_floor_nm: float     # Below this, p_fail ≈ 0
     detune_ceil_nm: float      # Above this, p_fail ≈ 1
 
+    # Derived constants (not constructor arguments)
+    _inv_range: float = field(init=False, repr=False, compare=False)  # 1/(ceil-floor)
+    _x_50: float = field(init=False, repr=False, compare=False)       # detune_50 in [0, 1]
+    _inv_lo: float = field(init=False, repr=False, compare=False)     # 0.5/x_50
+    _mid: float = field(init=False, repr=False, compare=False)        # x_norm at x_50
+    _inv_hi: float = field(init=False, repr=False, compare=False)     # 0.5/(1-x_50)
+
+    def __post_init__(self) -> None:
+        span = self.detune_ceil_nm - self.detune_floor_nm
+        # A zero-width range never reaches the smoothstep (floor/ceil win)
+        inv_range = 1.0 / span if span > 0.0 else 0.0
+        x_50 = (self.detune_50_nm - self.detune_floor_nm) * inv_range
+        x_50 = max(0.0, min(1.0, x_50))
+
+        # With x_50 at 0 or 1 there is nothing to rescale; identity
+        # coefficients make both remap pieces return x unchanged, so
+        # evaluation needs no separate check for that case
+        if 0.0 < x_50 < 1.0:
+            inv_lo, mid, inv_hi = 0.5 / x_50, 0.5, 0.5 / (1.0 - x_50)
+        else:
+            inv_lo, mid, inv_hi = 1.0, 0.0, 1.0
+
+        # Frozen dataclass: assign through object.__setattr__
+        object.__setattr__(self, "_inv_range", inv_range)
+        object.__setattr__(self, "_x_50", x_50)
+        object.__setattr__(self, "_inv_lo", inv_lo)
+        object.__setattr__(self, "_mid", mid)
+        object.__setattr__(self, "_inv_hi", inv_hi)
+
 
 @dataclass(frozen=True, slots=True)
 class ImpairmentOutputs:
@@ -48,8 +84,23 @@ def eval_impairment(
     Returns:
         ImpairmentOutputs with CRC failure probability
     """
+    return ImpairmentOutputs(crc_fail_prob=eval_impairment_fast(detune_nm, locked, p))
+
+
+def eval_impairment_fast(detune_nm: float, locked: bool, p: ImpairmentParams) -> float:
+    """
+    Allocation-free eval_impairment for per-cycle loops.
+
+    Args:
+        detune_nm: Detuning (signed, nm)
+        locked: Whether resonator is locked
+        p: Impairment parameters
+
+    Returns:
+        CRC failure probability in [0, 1]
+    """
     if not locked:
-        return ImpairmentOutputs(crc_fail_prob=1.0)
+        return 1.0
 
     # Work with absolute detuning
     abs_detune = abs(detune_nm)
@@ -60,19 +111,18 @@ def eval_impairment(
     # Simple approach: normalize to [floor, ceil] range, then adjust
 
     if abs_detune <= p.detune_floor_nm:
-        return ImpairmentOutputs(crc_fail_prob=0.0)
+        return 0.0
 
     if abs_detune >= p.detune_ceil_nm:
-        return ImpairmentOutputs(crc_fail_prob=1.0)
+        return 1.0
 
     # Normalize to [0, 1] based on floor/ceil range
-    x = (abs_detune - p.detune_floor_nm) / (p.detune_ceil_nm - p.detune_floor_nm)
+    x = (abs_detune - p.detune_floor_nm) * p._inv_range
     x = max(0.0, min(1.0, x))
 
     # To center around detune_50, we need to adjust the mapping
-    # Calculate where detune_50 falls in the normalized range
-    x_50 = (p.detune_50_nm - p.detune_floor_nm) / (p.detune_ceil_nm - p.detune_floor_nm)
-    x_50 = max(0.0, min(1.0, x_50))
+    # x_50 is where detune_50 falls in the normalized range (precomputed)
+    x_50 = p._x_50
 
     # Piecewise linear remapping to use 50% exactly.
     # Without this, a detune_50_nm that's not centered in [floor, ceil] would
@@ -80,16 +130,15 @@ def eval_impairment(
     #
     # Example: floor=0.0, ceil=0.1, detune_50=0.03
     #   Input 0.03nm → x=0.3 → x_50=0.3 → rescaled to x_norm=0.5 → smoothstep(0.5)=0.5
-    if x_50 > 0.0 and x_50 < 1.0:
-        # Piecewise rescaling:
-        # - [0, x_50] maps to [0, 0.5]
-        # - [x_50, 1] maps to [0.5, 1]
-        if x <= x_50:
-            x_norm = 0.5 * (x / x_50) if x_50 > 0 else 0.0
-        else:
-            x_norm = 0.5 + 0.5 * ((x - x_50) / (1.0 - x_50)) if x_50 < 1 else 1.0
+    #
+    # Piecewise rescaling:
+    # - [0, x_50] maps to [0, 0.5]
+    # - [x_50, 1] maps to [0.5, 1]
+    # (identity when x_50 is 0 or 1; see ImpairmentParams.__post_init__)
+    if x <= x_50:
+        x_norm = x * p._inv_lo
     else:
-        x_norm = x
+        x_norm = p._mid + (x - x_50) * p._inv_hi
 
     # Apply cubic smoothstep: s(t) = t^2 * (3 - 2*t)
     s = x_norm * x_norm * (3.0 - 2.0 * x_norm)
@@ -97,4 +146,169 @@ def eval_impairment(
     # Clamp to [0, 1] for safety
     crc_fail_prob = max(0.0, min(1.0, s))
 
-    return ImpairmentOutputs(crc_fail_prob=crc_fail_prob)
+    return crc_fail_prob
+
+
+def _smoothstep_locked_batch(abs_detune: np.ndarray, p: ImpairmentParams) -> np.ndarray:
+    """Locked-branch impairment over a 1-D array of |detuning| values."""
+    floor = p.detune_floor_nm
+    ceil = p.detune_ceil_nm
+
+    x = np.clip((abs_detune - floor) * p._inv_range, 0.0, 1.0)
+    x_50 = p._x_50
+
+    # Piecewise rescale so detune_50 maps to 0.5 (see eval_impairment)
+    lo = x * p._inv_lo
+    hi = p._mid + (x - x_50) * p._inv_hi
+    x_norm = np.where(x <= x_50, lo, hi)
+
+    # Cubic smoothstep s = x^2 * (3 - 2x), evaluated in place in two
+    # buffers (same rounding as the scalar expression, fewer temporaries)
+    s = np.multiply(x_norm, x_norm)
+    t = np.multiply(x_norm, -2.0)
+    t += 3.0
+    s *= t
+    np.clip(s, 0.0, 1.0, out=s)
+
+    # Same precedence as the scalar branches: floor is checked before ceil
+    np.copyto(s, 1.0, where=abs_detune >= ceil)
+    np.copyto(s, 0.0, where=abs_detune <= floor)
+    return s
+
+
+def eval_impairment_batch(
+    detune_nm: np.ndarray,
+    locked: np.ndarray,
+    p: ImpairmentParams,
+) -> np.ndarray:
+    """
+    Evaluate the impairment model over arrays of detuning and lock status.
+
+    Array counterpart of eval_impairment: the floor/ceil branches become
+    masked selects and the normalization uses the reciprocals precomputed
+    on ImpairmentParams, so a whole trace is evaluated in a few vectorized
+    passes. Unlocked elements are fixed at 1.0, so the smoothstep is only
+    evaluated on the locked subset (skipped entirely when nothing is
+    locked, and without a gather/scatter when everything is).
+
+    Args:
+        detune_nm: Detuning values (signed, nm)
+        locked: Lock status per element (broadcast against detune_nm)
+        p: Impairment parameters
+
+    Returns:
+        float64 array of CRC failure probabilities in [0, 1]
+    """
+    return _eval_locked_subset(
+        detune_nm, locked, lambda abs_detune: _smoothstep_locked_batch(abs_detune, p)
+    )
+
+
+def _eval_locked_subset(
+    detune_nm: np.ndarray,
+    locked: np.ndarray,
+    locked_fn: Callable[[np.ndarray], np.ndarray],
+) -> np.ndarray:
+    """Apply locked_fn to |detune| of the locked elements; unlocked are 1.0."""
+    detune, locked = np.broadcast_arrays(
+        np.asarray(detune_nm, dtype=np.float64), np.asarray(locked, dtype=np.bool_)
+    )
+    shape = detune.shape
+    detune = detune.ravel()
+    idx = np.flatnonzero(locked)
+
+    if idx.size == detune.size:
+        return locked_fn(np.abs(detune)).reshape(shape)
+
+    out = np.ones(detune.size, dtype=np.float64)
+    if idx.size:
+        out[idx] = locked_fn(np.abs(detune[idx]))
+    return out.reshape(shape)
+
+
+@dataclass(frozen=True, slots=True)
+class ImpairmentLUT:
+    """
+    Tabulated impairment curve for repeated evaluation with fixed params.
+
+    The locked-branch curve (piecewise remap followed by the smoothstep)
+    depends only on |detune| within [floor, ceil], so it is sampled once
+    at size + 1 evenly spaced points and evaluated by linear interpolation:
+    one index computation and one lerp per element instead of the remap
+    branches and the cubic. Useful for Monte Carlo runs that evaluate the
+    same params millions of times.
+
+    This is an approximation. The curve has a slope discontinuity at
+    detune_50_nm, so the worst-case absolute error near it falls off as
+    1/size (and grows as detune_50_nm approaches floor or ceil); away
+    from the kink it falls off as 1/size**2. Floor/ceil boundaries and
+    unlocked elements are exact.
+    """
+    params: ImpairmentParams
+    size: int = 1024           # Number of table intervals
+
+    # Derived (not constructor arguments)
+    _table: np.ndarray = field(init=False, repr=False, compare=False)  # size + 1 samples
+    _scale: float = field(init=False, repr=False, compare=False)       # size/(ceil-floor)
+
+    def __post_init__(self) -> None:
+        if self.size < 1:
+            raise ValueError(f"size must be >= 1, got {self.size}")
+
+        p = self.params
+        grid = np.linspace(p.detune_floor_nm, p.detune_ceil_nm, self.size + 1)
+        table = _smoothstep_locked_batch(grid, p)
+        table.flags.writeable = False
+
+        # Frozen dataclass: assign through object.__setattr__
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_scale", self.size * p._inv_range)
+
+    def _locked_batch(self, abs_detune: np.ndarray) -> np.ndarray:
+        """Interpolate the table at a 1-D array of |detuning| values."""
+        p = self.params
+        size = self.size
+        table = self._table
+
+        # Fractional table position, clamped to the table range
+        u = abs_detune - p.detune_floor_nm
+        u *= self._scale
+        np.clip(u, 0.0, size, out=u)
+        i = u.astype(np.intp)
+        np.minimum(i, size - 1, out=i)
+        u -= i
+
+        # s = table[i] + frac * (table[i+1] - table[i]), in place
+        lo = table[i]
+        s = table[i + 1]
+        s -= lo
+        s *= u
+        s += lo
+
+        # Exact floor/ceil semantics (also covers a zero-width range)
+        np.copyto(s, 1.0, where=abs_detune >= p.detune_ceil_nm)
+        np.copyto(s, 0.0, where=abs_detune <= p.detune_floor_nm)
+        return s
+
+
+def eval_impairment_lut(
+    detune_nm: np.ndarray,
+    locked: np.ndarray,
+    lut: ImpairmentLUT,
+) -> np.ndarray:
+    """
+    Evaluate the impairment model over arrays using a lookup table.
+
+    Table-interpolated counterpart of eval_impairment_batch, trading a
+    bounded approximation error (see ImpairmentLUT) for fewer passes over
+    the data. Unlocked elements are exactly 1.0.
+
+    Args:
+        detune_nm: Detuning values (signed, nm)
+        locked: Lock status per element (broadcast against detune_nm)
+        lut: Table built from the impairment parameters
+
+    Returns:
+        float64 array of CRC failure probabilities in [0, 1]
+    """
+    return _eval_locked_subset(detune_nm, locked, lut._locked_batch)
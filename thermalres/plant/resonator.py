@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True, slots=True)
 class ResonatorParams:
@@ -46,6 +48,25 @@ def eval_resonator(temp_c: float, p: ResonatorParams) -> ResonatorOutputs:
     Returns:
         ResonatorOutputs with resonance, detuning, and lock status
     """
+    resonance_nm, detune_nm, locked = eval_resonator_fast(temp_c, p)
+    return ResonatorOutputs(
+        resonance_nm=resonance_nm,
+        detune_nm=detune_nm,
+        locked=locked,
+    )
+
+
+def eval_resonator_fast(temp_c: float, p: ResonatorParams) -> tuple[float, float, bool]:
+    """
+    Allocation-free eval_resonator for per-cycle loops.
+
+    Args:
+        temp_c: Current temperature (°C)
+        p: Resonator parameters
+
+    Returns:
+        Tuple of (resonance_nm, detune_nm, locked)
+    """
     # Calculate temperature-dependent resonance shift
     temp_delta = temp_c - p.ambient_c
     resonance_nm = p.lambda0_nm + p.thermo_optic_nm_per_c * temp_delta
@@ -56,8 +77,33 @@ def eval_resonator(temp_c: float, p: ResonatorParams) -> ResonatorOutputs:
     # Check if locked (within tolerance window)
     locked = abs(detune_nm) <= p.lock_window_nm
 
-    return ResonatorOutputs(
-        resonance_nm=resonance_nm,
-        detune_nm=detune_nm,
-        locked=locked,
-    )
+    return resonance_nm, detune_nm, locked
+
+
+def eval_resonator_batch(
+    temp_c: np.ndarray,
+    p: ResonatorParams,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate the resonator model over an array of temperatures.
+
+    Array counterpart of eval_resonator with the same operation order (so
+    the same rounding), evaluated in place over a few streaming passes.
+    The detuning and lock arrays feed eval_impairment_batch directly.
+
+    Args:
+        temp_c: Temperatures (°C)
+        p: Resonator parameters
+
+    Returns:
+        Tuple of (resonance_nm, detune_nm, locked) arrays with the shape of
+        temp_c (float64, float64, bool)
+    """
+    resonance_nm = np.subtract(temp_c, p.ambient_c, dtype=np.float64)
+    resonance_nm *= p.thermo_optic_nm_per_c
+    resonance_nm += p.lambda0_nm
+
+    detune_nm = np.subtract(p.target_lambda_nm, resonance_nm)
+    locked = np.abs(detune_nm) <= p.lock_window_nm
+
+    return resonance_nm, detune_nm, locked
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True, slots=True)
@@ -10,6 +10,9 @@ class ThermalParams:
 
     The thermal system models heat flow from power sources (heater + workload)
     to ambient temperature through a first-order RC network.
+
+    The reciprocal time constant 1/(R_th * C_th) is derived once in
+    __post_init__ so step_thermal multiplies instead of dividing each step.
     """
     ambient_c: float           # Ambient temperature (°C)
     r_th_c_per_w: float        # Thermal resistance (°C/W)
@@ -17,6 +20,16 @@ class ThermalParams:
     heater_w_max: float        # Maximum heater power (W)
     workload_w_max: float      # Maximum workload power (W)
 
+    # Derived constant (not a constructor argument)
+    _inv_rc: float = field(init=False, repr=False, compare=False)  # 1/(R_th*C_th)
+
+    def __post_init__(self) -> None:
+        rc = self.r_th_c_per_w * self.c_th_j_per_c
+        if rc == 0.0:
+            raise ValueError("r_th_c_per_w * c_th_j_per_c must be non-zero")
+        # Frozen dataclass: assign through object.__setattr__
+        object.__setattr__(self, "_inv_rc", 1.0 / rc)
+
 
 @dataclass(frozen=False, slots=True)
 class ThermalState:
@@ -54,6 +67,34 @@ def step_thermal(
     Returns:
         New thermal state (does not mutate input)
     """
+    return ThermalState(
+        temp_c=step_thermal_fast(state.temp_c, dt_s, heater_duty, workload_frac, p)
+    )
+
+
+def step_thermal_fast(
+    temp_c: float,
+    dt_s: float,
+    heater_duty: float,
+    workload_frac: float,
+    p: ThermalParams,
+) -> float:
+    """
+    Allocation-free step_thermal for per-cycle loops.
+
+    Same physics and rounding as step_thermal, but takes and returns the
+    bare temperature instead of ThermalState, and positional arguments.
+
+    Args:
+        temp_c: Current temperature (°C)
+        dt_s: Time step in seconds
+        heater_duty: Heater duty cycle [0, 1]
+        workload_frac: Workload fraction [0, 1]
+        p: Thermal parameters
+
+    Returns:
+        Temperature after the step (°C)
+    """
     # Clamp inputs to valid range [0, 1]
     heater_duty = max(0.0, min(1.0, heater_duty))
     workload_frac = max(0.0, min(1.0, workload_frac))
@@ -68,14 +109,14 @@ def step_thermal(
     # This can be rewritten as:
     # dT/dt = (P_in * R_th + T_amb - T) / (R_th * C_th)
 
-    temp_delta_from_ambient = state.temp_c - p.ambient_c
+    temp_delta_from_ambient = temp_c - p.ambient_c
     numerator = p_in * p.r_th_c_per_w - temp_delta_from_ambient
-    denominator = p.r_th_c_per_w * p.c_th_j_per_c
 
-    dt_dt = numerator / denominator
+    # Divide by R_th * C_th via the precomputed reciprocal
+    dt_dt = numerator * p._inv_rc
 
     # Euler integration: sufficient for slow thermal dynamics where τ = R*C >> dt_s
     # (typical τ ~ 1-10 seconds, dt_s ~ 0.1 seconds)
-    temp_next = state.temp_c + dt_s * dt_dt
+    temp_next = temp_c + dt_s * dt_dt
 
-    return ThermalState(temp_c=temp_next)
+    return temp_next
@@ -4,6 +4,16 @@ RTL integration layer.
 Provides adapter functions to run RTL simulations and return results.
 """
 
-from .adapter import RtlLinkSample, run_link_monitor_rtl
+from .adapter import (
+    RtlLinkSample,
+    run_link_monitor_rtl,
+    run_link_monitor_rtl_batch,
+    run_link_monitor_rtl_columns,
+)
 
-__all__ = ["RtlLinkSample", "run_link_monitor_rtl"]
+__all__ = [
+    "RtlLinkSample",
+    "run_link_monitor_rtl",
+    "run_link_monitor_rtl_batch",
+    "run_link_monitor_rtl_columns",
+]
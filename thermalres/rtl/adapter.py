@@ -6,34 +6,56 @@ and cocotb. This enables equivalence testing between the Python reference
 model (LinkMonitorRef) and the actual SystemVerilog implementation.
 
 Integration Strategy:
-1. Generate pattern file (valid, crc_fail per cycle) and sample cycle list
+1. Write binary pattern file (valid, crc_fail per cycle) and sample cycle list
 2. Generate cocotb test script with embedded parameters
-3. Generate Makefile with Verilator flags (-G for parameter override)
-4. Run make in temp directory → Verilator compiles RTL → cocotb drives simulation
-5. Parse output file with sampled RTL state
-6. Return RtlLinkSample objects for comparison with Python samples
-
-The adapter handles the complexity of temp directories, environment variables,
-Makefile generation, and output parsing so callers can simply pass a pattern
-and receive samples.
+3. Build and simulate through cocotb's Python runner API (cocotb >= 1.9):
+   Verilator compiles RTL with the parameters overridden (or the cached
+   build is reused) → cocotb drives simulation. Older cocotb falls back to
+   a generated Makefile run with make.
+4. Parse output file with sampled RTL state
+5. Return RtlLinkSample objects for comparison with Python samples
+
+The adapter handles the complexity of temp directories, build configuration,
+and output parsing so callers can simply pass a pattern
+and receive samples. run_link_monitor_rtl_batch() runs many patterns in one
+simulation (resetting the DUT between them), so process startup is paid once
+per batch rather than once per pattern.
 
 Key Design Decisions:
 - Parameters (FAILS_TO_DOWN, PASSES_TO_UP) are passed via Verilator's -G option
   at compile time, enabling testing with different threshold configurations.
-- A 1ns Timer delay after RisingEdge ensures non-blocking assignments (NBA)
-  have completed before sampling outputs (standard cocotb pattern for registers).
+- Outputs are sampled in the ReadOnly phase after each RisingEdge, once
+  non-blocking assignments (NBA) have completed, without advancing
+  simulation time. The next cycle's inputs are driven right after the edge
+  (the registers have already captured the current ones), since signals
+  cannot be written in the ReadOnly phase.
 - Paths to RTL sources are computed dynamically from __file__ location,
   avoiding hardcoded absolute paths.
+- The Verilator build directory is kept in a persistent cache, keyed by
+  the RTL sources, the build configuration (which carries the parameters)
+  and the tool versions. Only the first run for a given key
+  pays for compilation; later runs only simulate. The cache lives in
+  $THERMALRES_CACHE_DIR, else $XDG_CACHE_HOME/thermalres, else
+  ~/.cache/thermalres, and can be deleted at any time.
 """
 
 from __future__ import annotations
 
+import hashlib
+import inspect
 import os
 import subprocess
+import sys
 import tempfile
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
+from thermalres.cosim.interfaces import LinkStateColumns
+
 
 @dataclass(frozen=True, slots=True)
 class RtlLinkSample:
@@ -51,8 +73,72 @@ class RtlLinkSample:
     consec_passes: int
 
 
+@dataclass(frozen=True, slots=True)
+class _RtlLinkSamples:
+    """
+    Link monitor samples from RTL in struct-of-arrays layout.
+
+    Element i of each array holds the RtlLinkSample field for sample i.
+    The arrays are views into the parsed simulator output, so building
+    this container costs no per-sample Python objects; to_list() gives
+    the RtlLinkSample list when one is needed.
+    """
+
+    cycle: np.ndarray            # int64
+    link_up: np.ndarray          # bool
+    total_frames: np.ndarray     # int64
+    total_crc_fails: np.ndarray  # int64
+    consec_fails: np.ndarray     # int64
+    consec_passes: np.ndarray    # int64
+
+    @classmethod
+    def from_array(cls, raw: np.ndarray) -> _RtlLinkSamples:
+        """Wrap an (M, 6) int64 array of (cycle, link_up, ...) rows."""
+        return cls(
+            cycle=raw[:, 0],
+            link_up=raw[:, 1].astype(np.bool_),
+            total_frames=raw[:, 2],
+            total_crc_fails=raw[:, 3],
+            consec_fails=raw[:, 4],
+            consec_passes=raw[:, 5],
+        )
+
+    def __len__(self) -> int:
+        return len(self.cycle)
+
+    def to_list(self) -> list[RtlLinkSample]:
+        """Convert to one RtlLinkSample per sample."""
+        return [
+            RtlLinkSample(*row)
+            for row in zip(
+                self.cycle.tolist(),
+                self.link_up.tolist(),
+                self.total_frames.tolist(),
+                self.total_crc_fails.tolist(),
+                self.consec_fails.tolist(),
+                self.consec_passes.tolist(),
+            )
+        ]
+
+    def to_columns(self) -> LinkStateColumns:
+        """Drop the cycle column, giving the layout shared with LinkRunner."""
+        return LinkStateColumns(
+            link_up=self.link_up,
+            total_frames=self.total_frames,
+            total_crc_fails=self.total_crc_fails,
+            consec_fails=self.consec_fails,
+            consec_passes=self.consec_passes,
+        )
+
+
 def check_verilator_available() -> bool:
     """Check if Verilator is available on PATH."""
+    return _verilator_version() is not None
+
+
+@lru_cache(maxsize=1)
+def _verilator_version() -> str | None:
+    """Return `verilator --version` output, or None if it cannot be run."""
     try:
         result = subprocess.run(
             ["verilator", "--version"],
@@ -60,9 +146,37 @@ def check_verilator_available() -> bool:
             text=True,
             timeout=5,
         )
-        return result.returncode == 0
     except (FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _cache_root() -> Path:
+    """Directory for persistent RTL build artifacts."""
+    override = os.environ.get("THERMALRES_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "thermalres"
+
+
+def _sim_build_dir(build_config: str, rtl_dir: Path) -> Path:
+    """
+    Persistent Verilator build directory for a given RTL configuration.
+
+    The key covers everything that changes the compiled model: RTL source
+    contents, the build configuration (the Makefile, or the runner's
+    parameters and Verilator flags) and the Verilator and cocotb versions.
+    """
+    import cocotb
+
+    h = hashlib.sha1()
+    for name in ("link_monitor.sv", "top.sv"):
+        h.update((rtl_dir / name).read_bytes())
+    h.update(build_config.encode())
+    h.update(str(_verilator_version()).encode())
+    h.update(str(getattr(cocotb, "__version__", "")).encode())
+    return _cache_root() / "rtl" / h.hexdigest()
 
 
 def _get_rtl_dir() -> Path:
@@ -80,27 +194,169 @@ def _get_rtl_dir() -> Path:
     return rtl_dir
 
 
+def _pattern_array(
+    pattern: Sequence[tuple[bool, bool]] | None,
+    crc_fails: np.ndarray | None,
+) -> np.ndarray:
+    """
+    Normalize the input pattern to an (N, 2) uint8 array of (valid, crc_fail).
+
+    Exactly one of pattern / crc_fails must be given. crc_fails implies
+    valid=1 on every cycle, so no valid column has to be built by callers.
+    """
+    if (pattern is None) == (crc_fails is None):
+        raise ValueError("Provide exactly one of pattern or crc_fails")
+
+    if crc_fails is not None:
+        crc_fails = np.asarray(crc_fails, dtype=np.uint8).reshape(-1)
+        arr = np.ones((crc_fails.shape[0], 2), dtype=np.uint8)
+        arr[:, 1] = crc_fails
+        return arr
+
+    return np.asarray(pattern, dtype=np.uint8).reshape(-1, 2)
+
+
 def run_link_monitor_rtl(
-    pattern: list[tuple[bool, bool]],
+    pattern: Sequence[tuple[bool, bool]] | None = None,
     fails_to_down: int = 4,
     passes_to_up: int = 8,
     sample_cycles: list[int] | None = None,
+    *,
+    crc_fails: np.ndarray | None = None,
 ) -> list[RtlLinkSample]:
     """
     Run link_monitor RTL with given CRC fail pattern.
 
     Args:
-        pattern: List of (valid, crc_fail) tuples, one per cycle
+        pattern: Sequence of (valid, crc_fail) tuples, one per cycle
         fails_to_down: FAILS_TO_DOWN parameter
         passes_to_up: PASSES_TO_UP parameter
         sample_cycles: Cycles to sample (default: all cycles)
+        crc_fails: Alternative to pattern: bool array of per-cycle CRC
+                   failures with every cycle valid
 
     Returns:
         List of RtlLinkSample at requested cycles
 
     Raises:
+        ValueError: If both or neither of pattern and crc_fails are given
         RuntimeError: If Verilator or cocotb not available
     """
+    return _run_rtl(
+        _pattern_array(pattern, crc_fails), fails_to_down, passes_to_up, sample_cycles
+    ).to_list()
+
+
+def run_link_monitor_rtl_batch(
+    patterns: Sequence[Sequence[tuple[bool, bool]]],
+    fails_to_down: int = 4,
+    passes_to_up: int = 8,
+    sample_cycles: Sequence[list[int] | None] | None = None,
+) -> list[list[RtlLinkSample]]:
+    """
+    Run several independent patterns through link_monitor RTL in one simulation.
+
+    The DUT is reset before each pattern, so every pattern starts from the
+    same state it would in its own run_link_monitor_rtl() call, but make,
+    Verilator and the simulator start only once for the whole batch.
+
+    Args:
+        patterns: One sequence of (valid, crc_fail) tuples per pattern
+        fails_to_down: FAILS_TO_DOWN parameter
+        passes_to_up: PASSES_TO_UP parameter
+        sample_cycles: Per-pattern cycles to sample (None entries, or None
+                       overall, sample every cycle of that pattern)
+
+    Returns:
+        One list of RtlLinkSample per pattern, in input order. Cycle
+        numbers restart at 0 for each pattern.
+
+    Raises:
+        ValueError: If sample_cycles does not have one entry per pattern
+        RuntimeError: If Verilator or cocotb not available
+    """
+    if sample_cycles is None:
+        sample_cycles = [None] * len(patterns)
+    elif len(sample_cycles) != len(patterns):
+        raise ValueError("sample_cycles must have one entry per pattern")
+
+    results = _run_rtl_many(
+        [_pattern_array(pattern, None) for pattern in patterns],
+        fails_to_down,
+        passes_to_up,
+        list(sample_cycles),
+    )
+    return [samples.to_list() for samples in results]
+
+
+def run_link_monitor_rtl_columns(
+    pattern: Sequence[tuple[bool, bool]] | None = None,
+    fails_to_down: int = 4,
+    passes_to_up: int = 8,
+    sample_cycles: list[int] | None = None,
+    *,
+    crc_fails: np.ndarray | None = None,
+) -> LinkStateColumns:
+    """
+    Run link_monitor RTL and return the sampled state as columns.
+
+    Same inputs as run_link_monitor_rtl(), but the output is returned in
+    the LinkStateColumns layout shared with LinkRunner.get_columns(), so
+    the two can be compared with whole-array operations and no per-sample
+    objects are built.
+
+    Returns:
+        LinkStateColumns with one entry per sampled cycle
+
+    Raises:
+        ValueError: If both or neither of pattern and crc_fails are given
+        RuntimeError: If Verilator or cocotb not available
+    """
+    return _run_rtl(
+        _pattern_array(pattern, crc_fails), fails_to_down, passes_to_up, sample_cycles
+    ).to_columns()
+
+
+def _run_rtl(
+    frames: np.ndarray,
+    fails_to_down: int,
+    passes_to_up: int,
+    sample_cycles: list[int] | None,
+) -> _RtlLinkSamples:
+    """
+    Simulate link_monitor RTL over an (N, 2) frame array.
+
+    Returns:
+        _RtlLinkSamples with one entry per sampled cycle.
+
+    Raises:
+        RuntimeError: If Verilator or cocotb not available, or the
+                      simulation fails
+    """
+    return _run_rtl_many([frames], fails_to_down, passes_to_up, [sample_cycles])[0]
+
+
+def _run_rtl_many(
+    frames: list[np.ndarray],
+    fails_to_down: int,
+    passes_to_up: int,
+    sample_cycles: list[list[int] | None],
+) -> list[_RtlLinkSamples]:
+    """
+    Simulate link_monitor RTL over several (N, 2) frame arrays in one run.
+
+    Patterns are written back to back to one binary pattern file (see
+    _write_blocks); the generated cocotb test resets the DUT at the start
+    of each pattern and tags every output row with its pattern index.
+
+    Returns:
+        One _RtlLinkSamples per pattern, as from _run_rtl.
+
+    Raises:
+        RuntimeError: If Verilator or cocotb not available, or the
+                      simulation fails
+    """
+
     # Check dependencies
     if not check_verilator_available():
         raise RuntimeError(
@@ -116,77 +372,201 @@ def run_link_monitor_rtl(
         )
 
     # Default: sample all cycles
-    if sample_cycles is None:
-        sample_cycles = list(range(len(pattern)))
+    sample_cycles = [
+        list(range(len(f))) if cycles is None else cycles
+        for f, cycles in zip(frames, sample_cycles)
+    ]
 
     # Create temporary directory for simulation
     with tempfile.TemporaryDirectory() as tmpdir:
         tmppath = Path(tmpdir)
 
-        # Write pattern to file for test to read
-        pattern_file = tmppath / "pattern.txt"
-        with pattern_file.open("w") as f:
-            for valid, crc_fail in pattern:
-                f.write(f"{int(valid)} {int(crc_fail)}\n")
-
-        # Write sample cycles
-        sample_file = tmppath / "samples.txt"
-        with sample_file.open("w") as f:
-            for cycle in sample_cycles:
-                f.write(f"{cycle}\n")
+        # Write patterns and sample cycles for the test to read as raw
+        # binary, so neither side formats or parses text per cycle
+        _write_blocks(tmppath / "pattern.bin", frames, np.uint8)
+        _write_blocks(tmppath / "samples.bin", sample_cycles, np.int64)
 
         # Write test script
         test_script = tmppath / "test_adapter.py"
         test_script.write_text(_generate_adapter_test(fails_to_down, passes_to_up))
 
-        # Write Makefile with absolute paths to RTL sources and parameters
-        makefile = tmppath / "Makefile"
-        makefile.write_text(
-            _generate_makefile(_get_rtl_dir(), fails_to_down, passes_to_up)
-        )
-
-        # Run simulation
-        env = os.environ.copy()
-        env["PATTERN_FILE"] = str(pattern_file)
-        env["SAMPLE_FILE"] = str(sample_file)
-        env["OUTPUT_FILE"] = str(tmppath / "output.txt")
-
-        result = subprocess.run(
-            ["make", "-f", str(makefile)],
-            cwd=tmppath,
-            env=env,
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"RTL simulation failed:\nstdout: {result.stdout}\nstderr: {result.stderr}"
+        # Build (or reuse the cached build) and simulate; the test's
+        # input and output files all live in tmppath
+        rtl_dir = _get_rtl_dir()
+        runner_api = _cocotb_runner_api()
+        if runner_api is not None:
+            _simulate_with_runner(
+                runner_api, tmppath, rtl_dir, fails_to_down, passes_to_up
             )
+        else:
+            _simulate_with_make(tmppath, rtl_dir, fails_to_down, passes_to_up)
 
         # Read results
         output_file = tmppath / "output.txt"
         if not output_file.exists():
             raise RuntimeError("RTL simulation did not produce output file")
 
-        samples = []
-        with output_file.open() as f:
-            for line in f:
-                parts = line.strip().split()
-                if len(parts) == 6:
-                    samples.append(
-                        RtlLinkSample(
-                            cycle=int(parts[0]),
-                            link_up=bool(int(parts[1])),
-                            total_frames=int(parts[2]),
-                            total_crc_fails=int(parts[3]),
-                            consec_fails=int(parts[4]),
-                            consec_passes=int(parts[5]),
-                        )
-                    )
-
-        return samples
+        # Every output line has 7 integer fields; parse them in one pass
+        fields = output_file.read_bytes().split()
+        if len(fields) % 7:
+            raise RuntimeError("RTL simulation produced a malformed output file")
+        raw = np.array(fields, dtype=np.int64).reshape(-1, 7)
+
+        # Demultiplex by the leading pattern index column
+        return [
+            _RtlLinkSamples.from_array(raw[raw[:, 0] == i, 1:])
+            for i in range(len(frames))
+        ]
+
+
+def _cocotb_runner_api() -> tuple[Callable, Callable] | None:
+    """
+    Return cocotb's (get_runner, get_results), or None to fall back to make.
+
+    The Python runner API lives in cocotb_tools.runner from cocotb 2.0 and
+    in cocotb.runner before that; the sources=/log_file= arguments used
+    here need cocotb >= 1.9.
+    """
+    try:
+        from cocotb_tools.runner import Verilator, get_results, get_runner
+    except ImportError:
+        try:
+            from cocotb.runner import Verilator, get_results, get_runner
+        except ImportError:
+            return None
+
+    # Inspect the class rather than constructing a runner just to probe it
+    if "log_file" not in inspect.signature(Verilator.build).parameters:
+        return None
+    return get_runner, get_results
+
+
+def _simulate_with_runner(
+    runner_api: tuple[Callable, Callable],
+    tmppath: Path,
+    rtl_dir: Path,
+    fails_to_down: int,
+    passes_to_up: int,
+) -> None:
+    """
+    Build and run the adapter test through cocotb's Python runner API.
+
+    Drives Verilator and the simulator directly, without the make and
+    shell layers of the Makefile flow. always=False lets the runner skip
+    the build when the cached model is up to date.
+
+    Raises:
+        RuntimeError: If the build or the simulation fails
+    """
+    get_runner, get_results = runner_api
+
+    sources = [rtl_dir / "link_monitor.sv", rtl_dir / "top.sv"]
+    parameters = {"FAILS_TO_DOWN": fails_to_down, "PASSES_TO_UP": passes_to_up}
+    build_args = ["--trace", "--trace-structs"]
+    build_key = f"runner {build_args} {sorted(parameters.items())}"
+    build_dir = _sim_build_dir(build_key, rtl_dir)
+    build_dir.mkdir(parents=True, exist_ok=True)
+
+    runner = get_runner("verilator")
+    log_file = tmppath / "sim.log"
+    try:
+        runner.build(
+            sources=sources,
+            hdl_toplevel="top",
+            parameters=parameters,
+            build_args=build_args,
+            build_dir=build_dir,
+            always=False,
+            log_file=log_file,
+        )
+
+        # The simulator's embedded interpreter imports test_module from
+        # PYTHONPATH; extra_env overrides the one the runner derives from
+        # sys.path, so prepend tmppath there instead of mutating sys.path
+        results_xml = runner.test(
+            test_module="test_adapter",
+            hdl_toplevel="top",
+            test_dir=tmppath,
+            build_dir=build_dir,
+            extra_env={
+                "PYTHONPATH": os.pathsep.join([str(tmppath), *sys.path]),
+                "PATTERN_FILE": str(tmppath / "pattern.bin"),
+                "SAMPLE_FILE": str(tmppath / "samples.bin"),
+                "OUTPUT_FILE": str(tmppath / "output.txt"),
+            },
+            log_file=log_file,
+        )
+
+        _, num_failed = get_results(results_xml)
+    except Exception as e:
+        log = log_file.read_text(errors="replace") if log_file.exists() else ""
+        raise RuntimeError(f"RTL simulation failed: {e}\nlog: {log}") from e
+
+    if num_failed:
+        raise RuntimeError(
+            f"RTL simulation failed:\nlog: {log_file.read_text(errors='replace')}"
+        )
+
+
+def _simulate_with_make(
+    tmppath: Path,
+    rtl_dir: Path,
+    fails_to_down: int,
+    passes_to_up: int,
+) -> None:
+    """
+    Build and run the adapter test through cocotb's Makefile flow.
+
+    Used with cocotb versions that predate the runner API.
+
+    Raises:
+        RuntimeError: If make exits with an error
+    """
+    # Write Makefile with absolute paths to RTL sources and parameters
+    makefile_text = _generate_makefile(rtl_dir, fails_to_down, passes_to_up)
+    makefile = tmppath / "Makefile"
+    makefile.write_text(makefile_text)
+
+    # Build into the persistent cache; make skips Verilator when the
+    # compiled model there is up to date
+    sim_build = _sim_build_dir(makefile_text, rtl_dir)
+    sim_build.mkdir(parents=True, exist_ok=True)
+
+    # Run simulation
+    env = os.environ.copy()
+    env["PATTERN_FILE"] = str(tmppath / "pattern.bin")
+    env["SAMPLE_FILE"] = str(tmppath / "samples.bin")
+    env["OUTPUT_FILE"] = str(tmppath / "output.txt")
+
+    result = subprocess.run(
+        ["make", "-f", str(makefile), f"SIM_BUILD={sim_build}"],
+        cwd=tmppath,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"RTL simulation failed:\nstdout: {result.stdout}\nstderr: {result.stderr}"
+        )
+
+
+def _write_blocks(path: Path, blocks: Sequence, dtype: type) -> None:
+    """
+    Write arrays back to back as raw binary, plus their lengths.
+
+    path holds the blocks concatenated in dtype (ndarray.tofile layout);
+    path + ".len" holds each block's row count as int64. The generated
+    cocotb test reads both with np.fromfile and splits the rows, with no
+    per-line parsing.
+    """
+    arrays = [np.asarray(block, dtype=dtype) for block in blocks]
+    lengths = np.array([len(a) for a in arrays], dtype=np.int64)
+    data = np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype)
+    data.tofile(path)
+    lengths.tofile(f"{path}.len")
 
 
 def _generate_adapter_test(fails_to_down: int, passes_to_up: int) -> str:
@@ -194,21 +574,24 @@ def _generate_adapter_test(fails_to_down: int, passes_to_up: int) -> str:
     Generate cocotb test script for adapter.
 
     This generates a Python test script that cocotb will run to drive
-    the RTL simulation. The test:
+    the RTL simulation. For each pattern in the pattern file, the test:
     1. Resets the DUT
     2. Applies the input pattern (valid, crc_fail) cycle by cycle
     3. Samples outputs at requested cycles
-    4. Writes samples to output file
+    4. Writes samples to output file, prefixed with the pattern index
 
     Note on timing:
         RTL uses registered outputs (always_ff). After await RisingEdge(),
-        we add a small Timer delay to let non-blocking assignments (NBA)
-        complete before sampling outputs. Without this delay, we would
-        sample stale values from the previous cycle.
+        we await ReadOnly() so non-blocking assignments (NBA) have completed
+        before sampling outputs; sampling right at the edge would see stale
+        values from the previous cycle. ReadOnly is a zero-time trigger, so
+        unlike a Timer delay it adds no simulation event per cycle. Writes
+        are illegal in that phase, so each cycle's inputs are driven right
+        after the previous rising edge instead.
 
     Args:
-        fails_to_down: FAILS_TO_DOWN parameter (passed via Makefile -G option).
-        passes_to_up: PASSES_TO_UP parameter (passed via Makefile -G option).
+        fails_to_down: FAILS_TO_DOWN parameter (Verilator -G option at build time).
+        passes_to_up: PASSES_TO_UP parameter (Verilator -G option at build time).
 
     Returns:
         Complete cocotb test script as a string.
@@ -216,12 +599,34 @@ def _generate_adapter_test(fails_to_down: int, passes_to_up: int) -> str:
     return f'''"""Adapter test for link_monitor."""
 import os
 import cocotb
+import numpy as np
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, Timer
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge, Timer
+
+def read_blocks(path, dtype, columns):
+    """Read the blocks written by the adapter's _write_blocks as arrays."""
+    data = np.fromfile(path, dtype=dtype).reshape(-1, columns)
+    lengths = np.fromfile(path + ".len", dtype=np.int64)
+    if not lengths.size:
+        return []
+    return np.split(data, np.cumsum(lengths)[:-1])
+
+
+async def reset(dut):
+    """Hold reset with idle inputs, then release it."""
+    # Leave any ReadOnly phase before writing
+    await FallingEdge(dut.clk)
+    dut.rst_n.value = 0
+    dut.valid.value = 0
+    dut.crc_fail.value = 0
+    await Timer(20, units="ns")
+    dut.rst_n.value = 1
+    await RisingEdge(dut.clk)
+
 
 @cocotb.test()
 async def test_adapter(dut):
-    """Run pattern and capture samples.
+    """Run each pattern from reset and capture samples.
 
     Parameters FAILS_TO_DOWN={fails_to_down} and PASSES_TO_UP={passes_to_up}
     are passed via Verilator's -G option at compile time.
@@ -230,55 +635,52 @@ async def test_adapter(dut):
     clock = Clock(dut.clk, 10, units="ns")
     cocotb.start_soon(clock.start())
 
-    # Reset
-    dut.rst_n.value = 0
-    dut.valid.value = 0
-    dut.crc_fail.value = 0
-    await Timer(20, units="ns")
-    dut.rst_n.value = 1
-    await RisingEdge(dut.clk)
-
-    # Read pattern
-    pattern_file = os.environ.get("PATTERN_FILE", "pattern.txt")
-    pattern = []
-    with open(pattern_file) as f:
-        for line in f:
-            valid, crc_fail = map(int, line.split())
-            pattern.append((valid, crc_fail))
-
-    # Read sample cycles
-    sample_file = os.environ.get("SAMPLE_FILE", "samples.txt")
-    sample_cycles = set()
-    with open(sample_file) as f:
-        for line in f:
-            sample_cycles.add(int(line.strip()))
+    # Read patterns and per-pattern sample cycles
+    patterns = read_blocks(os.environ.get("PATTERN_FILE", "pattern.bin"), np.uint8, 2)
+    sample_sets = [
+        set(block.ravel().tolist())
+        for block in read_blocks(
+            os.environ.get("SAMPLE_FILE", "samples.bin"), np.int64, 1
+        )
+    ]
 
     # Open output file
     output_file = os.environ.get("OUTPUT_FILE", "output.txt")
     with open(output_file, "w") as out:
-        # Run pattern
-        for cycle, (valid, crc_fail) in enumerate(pattern):
-            # Apply inputs before clock edge
-            dut.valid.value = valid
-            dut.crc_fail.value = crc_fail
-
-            # Wait for rising edge - RTL processes inputs on this edge
-            await RisingEdge(dut.clk)
-
-            # CRITICAL: Wait for non-blocking assignments (NBA) to complete
-            # RTL registers update on the clock edge, but in simulation the
-            # new values aren't visible until the NBA phase completes.
-            # A small delay (1ns) ensures we sample the updated values.
-            await Timer(1, units="ns")
-
-            # Sample outputs if this cycle is requested
-            # Outputs now reflect the result of processing this cycle's inputs
-            if cycle in sample_cycles:
-                out.write(f"{{cycle}} {{int(dut.link_up.value)}} ")
-                out.write(f"{{int(dut.total_frames.value)}} ")
-                out.write(f"{{int(dut.total_crc_fails.value)}} ")
-                out.write(f"{{int(dut.consec_fails.value)}} ")
-                out.write(f"{{int(dut.consec_passes.value)}}\\n")
+        for pattern_idx, (pattern, sample_cycles) in enumerate(
+            zip(patterns, sample_sets)
+        ):
+            # Every pattern starts from reset
+            await reset(dut)
+
+            frames = pattern.tolist()
+            if frames:
+                dut.valid.value, dut.crc_fail.value = frames[0]
+
+            for cycle in range(len(frames)):
+                # Wait for rising edge - RTL processes inputs on this edge
+                await RisingEdge(dut.clk)
+
+                # The registers have captured this cycle's inputs, so the
+                # next cycle's can be applied now (not once in ReadOnly)
+                if cycle + 1 < len(frames):
+                    dut.valid.value, dut.crc_fail.value = frames[cycle + 1]
+
+                # CRITICAL: Wait for non-blocking assignments (NBA) to complete
+                # RTL registers update on the clock edge, but in simulation the
+                # new values aren't visible until the NBA phase completes.
+                # ReadOnly resumes at the end of this time step, after it.
+                await ReadOnly()
+
+                # Sample outputs if this cycle is requested
+                # Outputs now reflect the result of processing this cycle's inputs
+                if cycle in sample_cycles:
+                    out.write(f"{{pattern_idx}} {{cycle}} ")
+                    out.write(f"{{int(dut.link_up.value)}} ")
+                    out.write(f"{{int(dut.total_frames.value)}} ")
+                    out.write(f"{{int(dut.total_crc_fails.value)}} ")
+                    out.write(f"{{int(dut.consec_fails.value)}} ")
+                    out.write(f"{{int(dut.consec_passes.value)}}\\n")
 '''
 
 
@@ -5,6 +5,7 @@ from thermalres.scenarios.open_loop import (
     step_workload,
     ramp_workload,
     heater_off_workload_on,
+    materialize,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "step_workload",
     "ramp_workload",
     "heater_off_workload_on",
+    "materialize",
 ]
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Callable
 
+import numpy as np
+
 from thermalres.cosim.interfaces import PlantInputs
 
 # Default timestep for plant evaluation (seconds)
@@ -10,6 +12,56 @@ DEFAULT_DT = 0.1
 # Type alias for schedule functions
 Schedule = Callable[[int], PlantInputs]
 
+# Vectorized form of a schedule: cycles -> (heater, workload, dt) arrays
+ScheduleColumns = Callable[[np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]]
+
+
+def _with_columns(schedule: Schedule, columns: ScheduleColumns) -> Schedule:
+    """Attach the vectorized form of a schedule for materialize()."""
+    schedule._columns = columns  # type: ignore[attr-defined]
+    return schedule
+
+
+def materialize(
+    schedule: Schedule,
+    cycles: int | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate a schedule for many cycles at once.
+
+    Schedules built by this module are evaluated with whole-array NumPy
+    operations (bit-identical to calling them cycle by cycle). Any other
+    callable is called once per cycle.
+
+    Args:
+        schedule: Schedule function: cycle -> PlantInputs
+        cycles: Number of cycles (evaluates cycles 0..n-1) or an array of
+                cycle numbers.
+
+    Returns:
+        (heater_duty, workload_frac, dt_s) float64 arrays, one entry per cycle
+    """
+    if isinstance(cycles, (int, np.integer)):
+        cycles = np.arange(cycles, dtype=np.int64)
+    else:
+        cycles = np.asarray(cycles, dtype=np.int64)
+
+    columns = getattr(schedule, "_columns", None)
+    if columns is not None:
+        heater, workload, dt = columns(cycles)
+        n = cycles.shape
+        return (
+            np.broadcast_to(np.asarray(heater, dtype=np.float64), n).copy(),
+            np.broadcast_to(np.asarray(workload, dtype=np.float64), n).copy(),
+            np.broadcast_to(np.asarray(dt, dtype=np.float64), n).copy(),
+        )
+
+    out = np.empty((3, cycles.size), dtype=np.float64)
+    for i, cycle in enumerate(cycles.tolist()):
+        inputs = schedule(cycle)
+        out[:, i] = (inputs.heater_duty, inputs.workload_frac, inputs.dt_s)
+    return out[0], out[1], out[2]
+
 
 def constant_heater(heater: float, workload: float = 0.0) -> Schedule:
     """
@@ -28,7 +80,11 @@ def constant_heater(heater: float, workload: float = 0.0) -> Schedule:
             workload_frac=workload,
             dt_s=DEFAULT_DT,
         )
-    return schedule
+
+    def columns(cycles: np.ndarray) -> tuple:
+        return heater, workload, DEFAULT_DT
+
+    return _with_columns(schedule, columns)
 
 
 def step_workload(
@@ -58,7 +114,12 @@ def step_workload(
             workload_frac=workload,
             dt_s=DEFAULT_DT,
         )
-    return schedule
+
+    def columns(cycles: np.ndarray) -> tuple:
+        workload = np.where(cycles < step_at_cycle, workload_low, workload_high)
+        return heater, workload, DEFAULT_DT
+
+    return _with_columns(schedule, columns)
 
 
 def ramp_workload(
@@ -92,7 +153,20 @@ def ramp_workload(
             workload_frac=workload,
             dt_s=DEFAULT_DT,
         )
-    return schedule
+
+    def columns(cycles: np.ndarray) -> tuple:
+        # Same operation order as the scalar interpolation; t is only
+        # computed inside the ramp, so ramp_cycles=0 never divides by zero
+        ramping = cycles < ramp_cycles
+        t = np.divide(cycles, ramp_cycles, out=np.zeros(cycles.shape), where=ramping)
+        workload = np.where(
+            ramping,
+            workload_start + t * (workload_end - workload_start),
+            workload_end,
+        )
+        return heater, workload, DEFAULT_DT
+
+    return _with_columns(schedule, columns)
 
 
 def heater_off_workload_on(
@@ -115,4 +189,8 @@ def heater_off_workload_on(
             workload_frac=workload,
             dt_s=DEFAULT_DT,
         )
-    return schedule
+
+    def columns(cycles: np.ndarray) -> tuple:
+        return 0.0, workload, DEFAULT_DT
+
+    return _with_columns(schedule, columns)